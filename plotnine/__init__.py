@@ -40,6 +40,7 @@ from .geoms import (
     annotation_stripes,
     arrow,
     geom_abline,
+    geom_aggregate,
     geom_area,
     geom_bar,
     geom_bin2d,
@@ -225,12 +226,14 @@ from .scales import (
     ylim,
 )
 from .stats import (
+    stat_aggregate,
     stat_bin,
     stat_bin2d,
     stat_bin_2d,
     stat_bindot,
     stat_boxplot,
     stat_count,
+    stat_decimate,
     stat_density,
     stat_density_2d,
     stat_ecdf,
@@ -306,6 +309,7 @@ __all__ = (
     "facet_null",
     "facet_wrap",
     "geom_abline",
+    "geom_aggregate",
     "geom_area",
     "geom_bar",
     "geom_bin2d",
@@ -470,12 +474,14 @@ __all__ = (
     "scale_y_timedelta",
     "sec_axis",
     "stage",
+    "stat_aggregate",
     "stat_bin",
     "stat_bin2d",
     "stat_bin_2d",
     "stat_bindot",
     "stat_boxplot",
     "stat_count",
+    "stat_decimate",
     "stat_density",
     "stat_density_2d",
     "stat_ecdf",
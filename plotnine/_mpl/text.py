@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from functools import lru_cache
 from typing import TYPE_CHECKING
 
+import numpy as np
+from matplotlib import artist
+from matplotlib.artist import Artist
 from matplotlib.patches import FancyBboxPatch
 from matplotlib.text import Text
+from matplotlib.transforms import Bbox
 
 if TYPE_CHECKING:
+    from typing import Any, Callable, Iterator, Sequence
+
     from matplotlib.axes import Axes
+    from matplotlib.backend_bases import RendererBase
 
-    from plotnine.typing import StripPosition
+    from plotnine.typing import FloatArray, StripPosition
 
 
 class StripText(Text):
@@ -91,3 +99,267 @@ class StripText(Text):
             height = max([p[1][1] for p in parts])
 
         return height
+
+
+class TextCollection(Artist):
+    """
+    Many texts drawn by a single artist
+
+    Creating a Text artist for each of many labels is expensive, and
+    so is everything else that then has to go through all of them.
+    The texts in the collection share one Text (and for labels one
+    bbox patch), whose properties are updated for each text before
+    it is drawn.
+
+    Parameters
+    ----------
+    x, y :
+        Positions of the texts
+    texts :
+        The texts
+    props :
+        Properties of the texts. Each value is either a single value
+        for all the texts or a sequence with a value for each text.
+    bbox :
+        Properties of the bbox patch that are the same for all texts.
+        If `None`, the texts have no bbox.
+    bbox_props :
+        Properties of the bbox patch, given in the same way as `props`.
+    path_effects :
+        Path effects of the texts.
+    check_overlap :
+        If `True`, a text that overlaps an earlier text in the
+        collection is not drawn. The overlaps are checked at draw
+        time, in display space.
+    """
+
+    zorder = 3
+
+    def __init__(
+        self,
+        x: Sequence[float],
+        y: Sequence[float],
+        texts: Sequence[Any],
+        props: dict[str, Any],
+        bbox: dict[str, Any] | None = None,
+        bbox_props: dict[str, Any] | None = None,
+        path_effects: Sequence[Any] | None = None,
+        check_overlap: bool = False,
+    ):
+        super().__init__()
+        self._n = len(texts)
+        self._x = np.asarray(x, dtype=float)
+        self._y = np.asarray(y, dtype=float)
+        self._check_overlap = check_overlap
+        # The extents of the texts relative to their positions, for
+        # the dpi at which they were measured
+        self._offsets: tuple[float, FloatArray] | None = None
+        self._text = Text(bbox=bbox)
+        if path_effects:
+            self._text.set_path_effects(path_effects)
+
+        # Properties that are the same for all texts are set once,
+        # the rest are set for each text as it is drawn
+        self._varying: list[tuple[Callable[..., Any], Sequence[Any]]] = []
+        self._add_props(self._text, {"text": texts})
+        self._add_props(self._text, props)
+        if bbox_props:
+            patch = self._text.get_bbox_patch()
+            self._add_props(patch, bbox_props)
+
+    def _add_props(self, obj: Artist, props: dict[str, Any]):
+        """
+        Set the constant properties and record the varying ones
+        """
+        for name, value in props.items():
+            setter = getattr(obj, f"set_{name}")
+            if isinstance(value, (str, tuple)) or not hasattr(
+                value, "__len__"
+            ):
+                setter(value)
+                continue
+
+            values = list(value)
+            try:
+                is_constant = len(set(values)) == 1
+            except TypeError:
+                is_constant = False
+
+            if is_constant:
+                setter(values[0])
+            else:
+                self._varying.append((setter, values))
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _iter_texts(
+        self, indices: Sequence[int] | None = None
+    ) -> Iterator[Text]:
+        """
+        Yield the shared Text, set up as each of the texts in turn
+
+        Parameters
+        ----------
+        indices :
+            The texts to go through. If `None`, all of them.
+        """
+        text = self._text
+        text.set_figure(self.get_figure(root=False))
+        text.set_transform(self.get_transform())
+        text.set_clip_on(self.get_clip_on())
+        text.set_clip_box(self.get_clip_box())
+        text.set_clip_path(self.get_clip_path())
+        text.set_visible(self.get_visible())
+        if indices is None:
+            indices = range(self._n)
+
+        xs, ys = self._x, self._y
+        for i in indices:
+            text.set_x(xs[i])
+            text.set_y(ys[i])
+            for setter, values in self._varying:
+                setter(values[i])
+            yield text
+
+    def _get_indices(self, renderer: RendererBase | None) -> Sequence[int]:
+        """
+        Return the indices of the texts to draw
+        """
+        if not self._check_overlap:
+            return range(self._n)
+
+        xy = self.get_transform().transform(
+            np.column_stack([self._x, self._y])
+        )
+        extents = self._get_offsets(renderer) + np.tile(xy, 2)
+        return non_overlapping(extents)
+
+    def _get_offsets(self, renderer: RendererBase | None) -> FloatArray:
+        """
+        Return the extents of the texts relative to their positions
+
+        Texts with the same properties have the same offsets, so only
+        one of them is measured. For labels, the extent of the box is
+        estimated from the padding around the text.
+        """
+        figure = self.get_figure(root=True)
+        assert figure is not None
+        dpi = figure.dpi
+        if self._offsets is not None and self._offsets[0] == dpi:
+            return self._offsets[1]
+
+        if renderer is None:
+            renderer = figure._get_renderer()  # pyright: ignore[reportAttributeAccessIssue]
+
+        offsets = np.zeros((self._n, 4))
+        measured: dict[tuple[Any, ...], FloatArray] = {}
+        patch = self._text.get_bbox_patch()
+        pad = getattr(patch.get_boxstyle(), "pad", 0) if patch else 0
+        for i, text in enumerate(self._iter_texts()):
+            try:
+                key = tuple(values[i] for _, values in self._varying)
+                offsets[i] = measured[key]
+                continue
+            except KeyError:
+                pass
+            except TypeError:
+                key = None
+
+            bbox = text.get_window_extent(renderer)
+            x, y = text.get_transform().transform(text.get_unitless_position())
+            offset = bbox.extents - (x, y, x, y)
+            if pad and text.get_text():
+                size = renderer.points_to_pixels(text.get_size())
+                offset += np.array([-1, -1, 1, 1]) * pad * size
+
+            offsets[i] = offset
+            if key is not None and np.isfinite(offset).all():
+                measured[key] = offset
+
+        self._offsets = (dpi, offsets)
+        return offsets
+
+    @artist.allow_rasterization
+    def draw(self, renderer: RendererBase):
+        if not self.get_visible():
+            return
+
+        for text in self._iter_texts(self._get_indices(renderer)):
+            text.draw(renderer)
+
+        self.stale = False
+
+    def get_window_extent(self, renderer: RendererBase | None = None) -> Bbox:
+        indices = self._get_indices(renderer)
+        boxes = [
+            text.get_window_extent(renderer)
+            for text in self._iter_texts(indices)
+        ]
+        return Bbox.union(boxes) if boxes else Bbox.null()
+
+
+def non_overlapping(extents: FloatArray) -> list[int]:
+    """
+    Return the indices of the boxes that do not overlap earlier boxes
+
+    The boxes are visited in order and a box is kept if it does not
+    overlap any box that has already been kept. Boxes that touch do
+    not overlap.
+
+    Parameters
+    ----------
+    extents :
+        Array of shape (n, 4), with the x0, y0, x1 & y1 of each box.
+        A box with any non-finite value is never kept.
+
+    Notes
+    -----
+    The kept boxes are put in a grid whose cells are the size of
+    the typical box, so each box is only compared with the kept
+    boxes in the cells that it covers.
+    """
+    n = len(extents)
+    if n == 0:
+        return []
+
+    finite = np.isfinite(extents).all(axis=1)
+    if not finite.any():
+        return []
+
+    x0, y0, x1, y1 = extents.T
+    width = np.median((x1 - x0)[finite])
+    height = np.median((y1 - y0)[finite])
+    cell_width = width if width > 0 else 1.0
+    cell_height = height if height > 0 else 1.0
+
+    with np.errstate(invalid="ignore"):
+        col0 = np.floor(x0 / cell_width)
+        col1 = np.floor(x1 / cell_width)
+        row0 = np.floor(y0 / cell_height)
+        row1 = np.floor(y1 / cell_height)
+
+    # Python scalars are quicker to compare one at a time
+    x0, y0, x1, y1 = x0.tolist(), y0.tolist(), x1.tolist(), y1.tolist()
+    col0, col1 = col0.tolist(), col1.tolist()
+    row0, row1 = row0.tolist(), row1.tolist()
+
+    grid: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+    kept: list[int] = []
+    for i in np.flatnonzero(finite).tolist():
+        cells = [
+            (c, r)
+            for c in range(int(col0[i]), int(col1[i]) + 1)
+            for r in range(int(row0[i]), int(row1[i]) + 1)
+        ]
+        overlaps = any(
+            x0[i] < x1[j] and x0[j] < x1[i] and y0[i] < y1[j] and y0[j] < y1[i]
+            for cell in cells
+            for j in grid.get(cell, ())
+        )
+        if not overlaps:
+            kept.append(i)
+            for cell in cells:
+                grid[cell].append(i)
+
+    return kept
@@ -90,6 +90,29 @@ def get_transPanels(fig: Figure, gs: p9GridSpec) -> Transform:
     return fig.transFigure + transFiguretoPanels
 
 
+def artist_size(artist: Artist) -> int:
+    """
+    Return the number of vertices & markers that make up an artist
+
+    It is a measure of how expensive the artist is in vector output.
+    Text and images are not counted.
+    """
+    from matplotlib.collections import Collection, QuadMesh
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Patch
+
+    if isinstance(artist, QuadMesh):
+        return artist.get_coordinates().size // 2
+    elif isinstance(artist, Collection):
+        nvertices = sum(len(p.vertices) for p in artist.get_paths())
+        return max(nvertices, len(artist.get_offsets()))
+    elif isinstance(artist, Line2D):
+        return len(artist.get_xydata())
+    elif isinstance(artist, Patch):
+        return len(artist.get_path().vertices)
+    return 0
+
+
 def rel_position(rel: float, length: float, low: float, high: float) -> float:
     """
     Relatively position an object of a given length between two position
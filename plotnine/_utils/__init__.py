@@ -12,16 +12,19 @@ from collections.abc import Iterable, Sequence
 from contextlib import suppress
 from copy import deepcopy
 from dataclasses import field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 from warnings import warn
 
 import mizani._colors.utils as color_utils
 import numpy as np
 import pandas as pd
+import pandas.api.types as pdtypes
 from pandas.core.groupby import DataFrameGroupBy
 
 from ..exceptions import PlotnineError, PlotnineWarning
 from ..mapping import aes
+from .colors import to_rgba as to_rgba
+from .colors import to_rgba_array as to_rgba_array
 
 if TYPE_CHECKING:
     from typing import Any, Callable, Literal, TypeVar
@@ -31,11 +34,14 @@ if TYPE_CHECKING:
 
     from plotnine.typing import (
         AnyArrayLike,
+        BoolArray,
         DataLike,
         FloatArray,
         FloatArrayLike,
         HorizontalJustification,
         PolarSide,
+        RandomGenerator,
+        RandomStateLike,
         Side,
         VerticalJustification,
     )
@@ -59,8 +65,6 @@ BOX_LOCATIONS: dict[str, tuple[float, float]] = {
     "centre": (0.5, 0.5),
 }
 
-to_rgba = color_utils.to_rgba
-
 
 def side_artists(side: Side | PolarSide) -> tuple[str, str]:
     """
@@ -151,22 +155,20 @@ def match(
     start: int
         type of indexing to use. Most likely 0 or 1
     """
-    # NOTE: This function gets called a lot. If it can
-    # be optimised, it should.
-    lookup = {}
-    for i, x in enumerate(v2):
-        if x not in lookup:
-            lookup[x] = i
+    # NOTE: This function gets called a lot (e.g. with the PANEL of
+    # every row of the data) so the lookup is done by pandas
+    if len(v2) == 0:
+        return np.full(len(v1), nomatch)
+
+    v2 = pd.Index(v2)
+    first = ~v2.duplicated(keep="first")
+    idx = v2[first].get_indexer(v1)
+    out = np.flatnonzero(first)[idx] + start
+    out[idx == -1] = nomatch
 
     if incomparables:
-        skip = set(incomparables) if incomparables else set()
-        lst = [
-            lookup[x] + start if x not in skip and x in lookup else nomatch
-            for x in v1
-        ]
-    else:
-        lst = [lookup[x] + start if x in lookup else nomatch for x in v1]
-    return np.array(lst)
+        out[pd.Index(v1).isin(list(incomparables))] = nomatch
+    return out
 
 
 def multitype_sort(arr: AnyArrayLike) -> list[Any]:
@@ -467,6 +469,31 @@ def uniquecols(data):
     return data
 
 
+def get_random_state(
+    random_state: RandomStateLike | None = None,
+) -> RandomGenerator:
+    """
+    Return a random number generator
+
+    Parameters
+    ----------
+    random_state :
+        Seed or random number generator. If `None`, the numpy global
+        generator [](`numpy.random`) is used. An integer seed creates
+        a [](`~numpy.random.RandomState`), so plots made with a seed
+        do not change. A [](`~numpy.random.SeedSequence`) creates a
+        [](`~numpy.random.Generator`), use it when building plots in
+        parallel e.g. with the children of `SeedSequence.spawn`.
+    """
+    if random_state is None:
+        return cast("RandomGenerator", np.random)
+    elif isinstance(random_state, (int, np.integer)):
+        return np.random.RandomState(random_state)
+    elif isinstance(random_state, np.random.SeedSequence):
+        return np.random.default_rng(random_state)
+    return random_state
+
+
 def jitter(x, factor=1, amount=None, random_state=None):
     """
     Add a small amount of noise to values in an array_like
@@ -474,20 +501,24 @@ def jitter(x, factor=1, amount=None, random_state=None):
     Parameters
     ----------
     x : array_like
-        Values to apply a jitter
+        Values to apply a jitter. If it is 2-dimensional, each column
+        is jittered and the noise for all of them is generated
+        together.
     factor : float
         Multiplicative value to used in automatically determining
         the `amount`. If the `amount` is given then the `factor`
         has no effect.
-    amount : float
+    amount : float | array_like
         This defines the range ([-amount, amount]) of the jitter to
         apply to the values. If `0` then `amount = factor * z/50`.
         If `None` then `amount = factor * d/5`, where d is about
         the smallest difference between `x` values and `z` is the
-        range of the `x` values.
-    random_state : int | ~numpy.random.RandomState, default=None
+        range of the `x` values. For a 2-dimensional `x`, there
+        can be an amount for each column.
+    random_state : int | ~numpy.random.Generator, default=None
         Seed or Random number generator to use. If `None`, then
         numpy global generator [](`numpy.random`) is used.
+        A `RandomState` or a `SeedSequence` are also accepted.
 
     References:
 
@@ -498,16 +529,33 @@ def jitter(x, factor=1, amount=None, random_state=None):
     if len(x) == 0:
         return x
 
-    if random_state is None:
-        random_state = np.random
-    elif isinstance(random_state, int):
-        random_state = np.random.RandomState(random_state)
-
+    random_state = get_random_state(random_state)
     x = np.asarray(x)
+    columns = x.reshape(len(x), -1).T
+    amounts = np.broadcast_to(
+        np.array(amount, dtype=object), len(columns)
+    ).copy()
 
+    for i, (col, _amount) in enumerate(zip(columns, amounts)):
+        if _amount is None or _amount == 0:
+            amounts[i] = _jitter_amount(col, factor, _amount)
+
+    # One call for all the columns, the noise for each column is a
+    # contiguous run of the random numbers.
+    amounts = amounts.astype(float)[:, np.newaxis]
+    noise = random_state.uniform(-amounts, amounts, columns.shape)
+    return x + noise.T.reshape(x.shape)
+
+
+def _jitter_amount(x, factor, amount):
+    """
+    Calculate the amount of jitter for the values in x
+
+    See [](`~plotnine._utils.jitter`).
+    """
     try:
         z = np.ptp(x[np.isfinite(x)])
-    except IndexError:
+    except (IndexError, ValueError):
         z = 0
 
     if z == 0:
@@ -517,7 +565,7 @@ def jitter(x, factor=1, amount=None, random_state=None):
 
     if amount is None:
         _x = np.round(x, 3 - int(np.floor(np.log10(z)))).astype(int)
-        xx = np.unique(np.sort(_x))
+        xx = np.unique(_x)
         d = np.diff(xx)
         if len(d):
             d = d.min()
@@ -526,10 +574,9 @@ def jitter(x, factor=1, amount=None, random_state=None):
         else:
             d = z / 10
         amount = factor / 5.0 * abs(d)
-    elif amount == 0:
+    else:
         amount = factor * (z / 50.0)
-
-    return x + random_state.uniform(-amount, amount, len(x))
+    return amount
 
 
 def remove_missing(
@@ -561,16 +608,22 @@ def remove_missing(
     else:
         vars = data.columns.intersection(list(vars)).to_list()
 
-    if finite:
-        lst = [np.inf, -np.inf]
-        to_replace = {v: lst for v in vars}
-        data.replace(to_replace, np.nan, inplace=True)
-        txt = "non-finite"
-    else:
-        txt = "missing"
+    # One mask for all the columns, and the data is only copied
+    # if there are rows to remove
+    remove = np.zeros(n, dtype=bool)
+    for col in vars:
+        remove |= data[col].isna().to_numpy()
+        if finite:
+            remove |= _is_infinite(data[col])
+
+    txt = "non-finite" if finite else "missing"
+
+    if remove.any():
+        data = data.loc[~remove]
+        data.reset_index(drop=True, inplace=True)
+    elif not data.index.equals(pd.RangeIndex(n)):
+        data = data.reset_index(drop=True)
 
-    data = data.dropna(subset=vars)
-    data.reset_index(drop=True, inplace=True)
     if len(data) < n and not na_rm:
         msg = "{} : Removed {} rows containing {} values."
         warn(
@@ -579,6 +632,17 @@ def remove_missing(
     return data
 
 
+def _is_infinite(x: pd.Series) -> BoolArray:
+    """
+    Return a boolean array of the positions with infinite values
+    """
+    if pdtypes.is_float_dtype(x):
+        return np.isinf(x.to_numpy())
+    elif pdtypes.is_object_dtype(x):
+        return x.isin([np.inf, -np.inf]).to_numpy()
+    return np.zeros(len(x), dtype=bool)
+
+
 def groupby_apply(
     df: pd.DataFrame,
     cols: str | list[str],
@@ -656,6 +720,63 @@ def pivot_apply(df, column, index, func, *args, **kwargs):
     return df.pivot_table(column, index, aggfunc=_func)[column]
 
 
+def scalar_if_constant(values: Any) -> Any:
+    """
+    Return the only value if all the values are the same
+
+    Matplotlib does some work for each value of a property, it is
+    better to give it a single value when there is only one.
+
+    Parameters
+    ----------
+    values :
+        Values of a property, one for each artist, or a single
+        value for all of them.
+    """
+    if values is None or np.isscalar(values):
+        return values
+
+    if isinstance(values, pd.Series):
+        values = values.to_numpy()
+
+    if isinstance(values, np.ndarray):
+        if values.ndim == 0:
+            return values[()]
+        if len(values) and (values == values[:1]).all():
+            return values[0]
+        return values
+
+    if len(values) and all(v == values[0] for v in values[1:]):
+        return values[0]
+    return values
+
+
+def aes_values(data: pd.DataFrame, params: dict[str, Any], ae: str) -> Any:
+    """
+    Return the values of an aesthetic of the data to draw
+
+    Parameters
+    ----------
+    data :
+        Data to draw
+    params :
+        Parameters of the geom. The aesthetics that have the same
+        value for all the rows of the layer may be in
+        `params["constant_aes"]` instead of the data.
+    ae :
+        Name of the aesthetic
+
+    Returns
+    -------
+    out :
+        The column of the aesthetic if it is in the data, otherwise
+        its constant value.
+    """
+    if ae in data:
+        return data[ae]
+    return params["constant_aes"][ae]
+
+
 def make_line_segments(
     x: FloatArrayLike, y: FloatArrayLike, ispath=True
 ) -> FloatArray:
@@ -683,7 +804,7 @@ def make_line_segments(
         raise PlotnineError("Expects an even number of points")
 
     n = len(x) // 2
-    segments = np.reshape(list(zip(x, y)), [n, 2, 2])
+    segments = np.column_stack([x, y]).reshape(n, 2, 2)
     return segments
 
 
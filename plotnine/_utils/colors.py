@@ -0,0 +1,179 @@
+"""
+Resolving colors and alpha values to RGBA
+
+The same few colors (those of a palette) make up the color columns of
+the data, so each unique color & alpha combination is resolved once
+and the results are mapped back onto the rows.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import mizani._colors.utils as color_utils
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from plotnine.typing import FloatArray, IntArray
+
+# The RGBA of a color that is not drawn
+NO_COLOR = (0.0, 0.0, 0.0, 0.0)
+
+
+def to_rgba(colors: Any, alpha: Any) -> Any:
+    """
+    Convert color(s) to rgba values
+
+    This is mizani's `to_rgba`, with the conversion done once for
+    each unique color & alpha combination.
+
+    Parameters
+    ----------
+    colors :
+        Color(s) to convert. Note that, if a color is already
+        RGBA, it is not modified
+    alpha :
+        Alpha value(s)
+
+    Returns
+    -------
+    out :
+        RGBA color(s). A hex string (or tuple) for a single color,
+        and a list of them for many colors.
+    """
+    if _is_single_color(colors):
+        return _to_rgba(colors, alpha)
+
+    ucolors, ualpha, inverse = _unique_pairs(colors, alpha)
+    lookup = [_to_rgba(c, a) for c, a in zip(ucolors, ualpha)]
+    return [lookup[i] for i in inverse]
+
+
+def to_rgba_array(colors: Any, alpha: Any) -> FloatArray:
+    """
+    Convert color(s) to an array of rgba values
+
+    Colors that are not drawn (`None` & `"none"`) are transparent.
+
+    Parameters
+    ----------
+    colors :
+        Color(s) to convert. Note that, if a color is already
+        RGBA, it is not modified
+    alpha :
+        Alpha value(s)
+
+    Returns
+    -------
+    out :
+        Array of shape (n, 4), one row for each color. For a single
+        color n is 1.
+    """
+    if _is_single_color(colors):
+        colors = [colors]
+
+    ucolors, ualpha, inverse = _unique_pairs(colors, alpha)
+    lookup = np.array(
+        [_rgba_tuple(c, a) for c, a in zip(ucolors, ualpha)],
+        dtype=float,
+    ).reshape(-1, 4)
+    return lookup[inverse]
+
+
+def _is_single_color(colors: Any) -> bool:
+    """
+    Return True if colors is one color and not a collection of them
+    """
+    return (
+        colors is None
+        or isinstance(colors, str)
+        or color_utils.is_color_tuple(colors)
+    )
+
+
+def _unique_pairs(
+    colors: Any, alpha: Any
+) -> tuple[list[Any], list[Any], IntArray]:
+    """
+    Return the unique color & alpha pairs and where they are used
+
+    Parameters
+    ----------
+    colors :
+        Colors
+    alpha :
+        A single alpha value or one for each color
+
+    Returns
+    -------
+    ucolors, ualpha :
+        The colors and alpha values of the unique pairs
+    inverse :
+        The index of the pair of each color
+    """
+    # A Series keeps tuple colors intact, an array would not
+    if not isinstance(colors, pd.Series):
+        colors = pd.Series(list(colors), dtype=object)
+
+    ccodes, cuniques = pd.factorize(colors, use_na_sentinel=False)
+    if np.ndim(alpha) == 0:
+        acodes = np.zeros(len(ccodes), dtype=int)
+        auniques = [alpha]
+    else:
+        acodes, _auniques = pd.factorize(
+            np.asarray(alpha), use_na_sentinel=False
+        )
+        auniques = _auniques.tolist()
+
+    n = max(len(auniques), 1)
+    pairs, inverse = np.unique(ccodes * n + acodes, return_inverse=True)
+    ucolors = [cuniques[i] for i in pairs // n]
+    ualpha = [auniques[i] for i in pairs % n]
+    return ucolors, ualpha, inverse.ravel()
+
+
+def _to_rgba(color: Any, alpha: Any) -> Any:
+    """
+    Convert a single color, remembering the result
+    """
+    # Missing values are not drawn
+    if isinstance(color, float) and np.isnan(color):
+        color = None
+
+    try:
+        return _to_rgba_cached(color, alpha)
+    except TypeError:
+        # Unhashable e.g. a list for a color
+        return color_utils.to_rgba(color, alpha)
+
+
+@lru_cache(maxsize=4096)
+def _to_rgba_cached(color: Any, alpha: Any) -> Any:
+    return color_utils.to_rgba(color, alpha)
+
+
+def _rgba_tuple(color: Any, alpha: Any) -> tuple[float, float, float, float]:
+    """
+    Return the RGBA of a single color as a tuple of floats
+    """
+    c = _to_rgba(color, alpha)
+    if isinstance(c, str) and c == "none":
+        return NO_COLOR
+
+    try:
+        return _mpl_to_rgba(c)
+    except TypeError:
+        from matplotlib.colors import to_rgba as mpl_to_rgba
+
+        return mpl_to_rgba(c)
+
+
+@lru_cache(maxsize=4096)
+def _mpl_to_rgba(c: Any) -> tuple[float, float, float, float]:
+    from matplotlib.colors import to_rgba as mpl_to_rgba
+
+    return mpl_to_rgba(c)
@@ -0,0 +1,107 @@
+"""
+Computing the panels of a layer in parallel
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Sequence, TypeVar
+
+    from plotnine.typing import ParallelBackend
+
+    T = TypeVar("T")
+
+
+def n_workers(n_tasks: int) -> int:
+    """
+    Return the number of workers to use for the tasks
+
+    It is determined by the `n_jobs` option and it is never more
+    than the number of tasks.
+    """
+    from ..options import get_option
+
+    n_jobs: int | None = get_option("n_jobs")
+    if n_jobs is None or n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    return max(1, min(n_jobs, n_tasks))
+
+
+def apply_panels(
+    func: Callable[..., T],
+    tasks: Sequence[tuple[Any, ...]],
+    backend: ParallelBackend | None,
+) -> tuple[list[T], list[float]]:
+    """
+    Call a function with the arguments of each panel
+
+    Parameters
+    ----------
+    func :
+        Function that computes a panel.
+    tasks :
+        The arguments to `func` for each panel.
+    backend :
+        How to compute the panels in parallel. If `None`, the panels
+        are computed one after the other. If the `"process"` backend
+        cannot be used because the function or its arguments cannot
+        be pickled, the `"thread"` backend is used instead.
+
+    Returns
+    -------
+    results :
+        What `func` returned for each panel, in the same order as the
+        tasks.
+    seconds :
+        Time taken to compute each panel.
+    """
+    n = n_workers(len(tasks))
+    if n == 1 or backend is None:
+        results = [_timed_call(func, *args) for args in tasks]
+    else:
+        # The data of a panel can always be pickled, it is left out
+        # so that probing does not copy all of it.
+        if backend == "process" and not _can_pickle(
+            func,
+            *(arg for arg in tasks[0] if not isinstance(arg, pd.DataFrame)),
+        ):
+            backend = "thread"
+
+        Executor = (
+            ProcessPoolExecutor if backend == "process" else ThreadPoolExecutor
+        )
+        with Executor(max_workers=n) as executor:
+            futures = [
+                executor.submit(_timed_call, func, *args) for args in tasks
+            ]
+            results = [f.result() for f in futures]
+
+    return [r[0] for r in results], [r[1] for r in results]
+
+
+def _timed_call(func: Callable[..., T], *args: Any) -> tuple[T, float]:
+    """
+    Call func and return the result and the time it took
+    """
+    start = perf_counter()
+    result = func(*args)
+    return result, perf_counter() - start
+
+
+def _can_pickle(*objs: Any) -> bool:
+    """
+    Return True if the objects can be sent to another process
+    """
+    try:
+        pickle.dumps(objs)
+    except Exception:
+        return False
+    return True
@@ -461,8 +461,10 @@ def munch_data(data: pd.DataFrame, dist: FloatArray) -> pd.DataFrame:
     segment_length = 0.01
 
     # Count new points per segment, excluding the final endpoint.
-    dist[np.isnan(dist)] = 1
+    # The gaps between groups (nan distances) are not subdivided,
+    # otherwise a group would trail off towards the next one.
     extra = np.maximum(np.floor(dist / segment_length), 1)
+    extra[np.isnan(extra)] = 1
     extra = extra.astype(int)
 
     # Every position aesthetic defines path geometry. Replicating `ymin` and
@@ -8,6 +8,7 @@ from warnings import warn
 import numpy as np
 
 from .._mpl._radial_axes import p9RadialAxes  # noqa: TCH001
+from .._mpl.text import TextCollection
 from .._utils.registry import alias
 from ..exceptions import PlotnineError, PlotnineWarning
 from ..iapi import panel_ranges, radial_panel_view
@@ -580,6 +581,9 @@ class coord_radial(coord):
         # (e.g. spoke labels placed just beyond the outermost bar tip).
         for text in ax.texts:
             text.set_clip_on(False)
+        for artist in ax.artists:
+            if isinstance(artist, TextCollection):
+                artist.set_clip_on(False)
 
     def aspect(self, panel_params: panel_view) -> float:
         left, right, bottom, top = polar_bbox(
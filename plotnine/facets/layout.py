@@ -16,7 +16,7 @@ if typing.TYPE_CHECKING:
     from plotnine import ggplot
     from plotnine.coords.coord import coord
     from plotnine.facets.facet import facet
-    from plotnine.iapi import panel_view
+    from plotnine.iapi import panel_timing, panel_view
     from plotnine.layer import Layers
     from plotnine.scales.scales import Scales
 
@@ -46,6 +46,13 @@ class Layout:
 
     axs: list[Axes]  # MPL axes
 
+    # Time taken to compute the stat & position of each panel
+    # of each layer
+    timings: list[panel_timing]
+
+    # (width, height) of the figure in pixels
+    figure_pixels: tuple[float, float]
+
     def setup(self, layers: Layers, plot: ggplot):
         """
         Create a layout for the panels
@@ -61,6 +68,10 @@ class Layout:
         data row/item will be plotted.
         """
         data = [l.data for l in layers]
+        self.timings = []
+        width, height = plot.theme.getp("figure_size")
+        dpi = plot.theme.getp("dpi")
+        self.figure_pixels = (width * dpi, height * dpi)
 
         # setup facets
         self.facet = plot.facet
@@ -82,6 +93,19 @@ class Layout:
         for layer, ldata in zip(layers, data):
             layer.data = self.facet.map(ldata, self.layout)
 
+    def panel_pixels(self) -> tuple[float, float]:
+        """
+        Return the approximate (width, height) of a panel in pixels
+
+        The figure is shared equally by the rows & columns of panels.
+        The space taken by the axes, titles and legends is not known
+        until the plot is drawn, so the panels are a little smaller.
+        """
+        width, height = self.figure_pixels
+        ncol = self.layout["COL"].max()
+        nrow = self.layout["ROW"].max()
+        return (width / ncol, height / nrow)
+
     def train_position(self, layers: Layers, scales: Scales):
         """
         Create all the required x & y panel_scales
@@ -6,6 +6,7 @@ from .annotate import annotate
 from .annotation_logticks import annotation_logticks
 from .annotation_stripes import annotation_stripes
 from .geom_abline import geom_abline
+from .geom_aggregate import geom_aggregate
 from .geom_area import geom_area
 from .geom_bar import geom_bar
 from .geom_bin_2d import geom_bin2d, geom_bin_2d
@@ -54,6 +55,7 @@ __all__ = (
     "annotation_logticks",
     "annotation_stripes",
     "geom_abline",
+    "geom_aggregate",
     "geom_area",
     "geom_bar",
     "geom_bin_2d",
@@ -146,20 +146,18 @@ class _geom_logticks(geom_rug):
         high = np.ceil(value_range[1])
         arr = base ** np.arange(low, float(high + 1))
         n_ticks = int(np.round(base) - 1)
-        breaks = [
-            log(np.linspace(b1, b2, n_ticks + 1), base)
-            for (b1, b2) in list(zip(arr, arr[1:]))
-        ]
+        # One row of breaks for each interval
+        breaks = log(np.linspace(arr[:-1], arr[1:], n_ticks + 1, axis=1), base)
 
         # Partition the breaks in the 3 groups
-        major = np.array([x[0] for x in breaks] + [breaks[-1][-1]])
+        major = np.append(breaks[:, 0], breaks[-1, -1])
         if n_ticks % 2:
             mid_idx = n_ticks // 2
-            middle = np.array([x[mid_idx] for x in breaks])
-            minor = np.hstack([_minor(x, mid_idx) for x in breaks])
+            middle = breaks[:, mid_idx]
+            minor = np.delete(breaks[:, :-1], [0, mid_idx], axis=1).ravel()
         else:
             middle = np.array([])
-            minor = np.hstack([x[1:-1] for x in breaks])
+            minor = breaks[:, 1:-1].ravel()
 
         return major, middle, minor
 
@@ -186,25 +184,39 @@ class _geom_logticks(geom_rug):
         if isinstance(coord, coord_flip):
             sides = sides.translate(str.maketrans("tblr", "rlbt"))
 
-        def _draw(
+        def _ticks(
             axis: Literal["x", "y"],
-            tick_positions: tuple[AnyArray, AnyArray, AnyArray],
-        ):
-            for position, length in zip(tick_positions, lengths):
-                data = pd.DataFrame({axis: position, **_aesthetics})
-                stroke_rugs(data, panel_params, ax, params, sides, length)
+            value_range: tuple[float, float],
+            base: float,
+        ) -> pd.DataFrame:
+            ticks = self._calc_ticks(value_range, base)
+            return pd.DataFrame(
+                {
+                    axis: np.hstack(ticks),
+                    "length": np.repeat(lengths, [len(t) for t in ticks]),
+                }
+            )
 
         base_x, base_y = self._check_log_scale(
             params["base"], sides, panel_params
         )
 
+        # The ticks of all the sides are marked in one go
+        ticks = []
         if "b" in sides or "t" in sides:
-            tick_positions = self._calc_ticks(panel_params.x.range, base_x)
-            _draw("x", tick_positions)
+            ticks.append(_ticks("x", panel_params.x.range, base_x))
 
         if "l" in sides or "r" in sides:
-            tick_positions = self._calc_ticks(panel_params.y.range, base_y)
-            _draw("y", tick_positions)
+            ticks.append(_ticks("y", panel_params.y.range, base_y))
+
+        if not ticks:
+            return
+
+        data = pd.concat(ticks, ignore_index=True)
+        length = data.pop("length").to_numpy()
+        for ae, value in _aesthetics.items():
+            data[ae] = [value] * len(data)
+        stroke_rugs(data, panel_params, ax, params, sides, length)
 
 
 class annotation_logticks(annotate):
@@ -7,6 +7,7 @@ from itertools import chain, repeat
 from typing import TYPE_CHECKING
 
 import numpy as np
+import pandas as pd
 
 from .._utils import (
     data_mapping_as_kwargs,
@@ -21,7 +22,6 @@ from ..mapping.evaluation import evaluate
 if TYPE_CHECKING:
     from typing import Any
 
-    import pandas as pd
     from matplotlib.axes import Axes
     from matplotlib.offsetbox import DrawingArea
 
@@ -57,6 +57,26 @@ class geom(ABC, metaclass=Register):
     those that are new or have a different default value.
     """
 
+    DRAW_GROUPS_TOGETHER: bool = False
+    """
+    Whether all the groups of a panel are drawn with one call
+
+    If `True`, `draw_panel` passes the data of the whole panel,
+    sorted by group, to `draw_group`. Geoms whose `draw_group` can
+    handle many groups use it to draw a panel with a few artists.
+    """
+
+    SCALAR_CONSTANT_AES: bool = False
+    """
+    Whether the geom draws with the constant aesthetics as scalars
+
+    If `True`, the default aesthetics and the aesthetics set as
+    parameters that have a single value are not added to the layer
+    data as columns. They are in `params["constant_aes"]` when the
+    layer is drawn, and the geom reads them with
+    [](`~plotnine._utils.aes_values`).
+    """
+
     data: DataLike
     """Geom/layer specific dataframe"""
 
@@ -198,7 +218,10 @@ class geom(ABC, metaclass=Register):
         return data
 
     def use_defaults(
-        self, data: pd.DataFrame, aes_modifiers: dict[str, Any]
+        self,
+        data: pd.DataFrame,
+        aes_modifiers: dict[str, Any],
+        constant_aes: dict[str, Any] | None = None,
     ) -> pd.DataFrame:
         """
         Combine data with defaults and set aesthetics from parameters
@@ -211,6 +234,10 @@ class geom(ABC, metaclass=Register):
             Data used for drawing the geom.
         aes_modifiers :
             Aesthetics to evaluate
+        constant_aes :
+            If given, the default aesthetics and the aesthetics set
+            as parameters that have one value for all the rows are
+            put in it instead of the data.
 
         Returns
         -------
@@ -225,9 +252,34 @@ class geom(ABC, metaclass=Register):
             - set(data.columns.to_list())
         )
 
+        # The after_scale modifiers may refer to any of the aesthetics,
+        # so they must all be columns
+        split_constants = constant_aes is not None and not aes_modifiers
+        checked_aes = self.REQUIRED_AES | self.NON_MISSING_AES
+        constants: dict[str, Any] = {}
+
+        def is_constant(ae: str, value: Any) -> bool:
+            # A missing value of an aesthetic that is checked for missing
+            # values is left in the data, where its rows are removed
+            return (
+                split_constants
+                and ae in self.DEFAULT_AES
+                and (
+                    value is None
+                    or isinstance(
+                        value, (str, int, float, np.integer, np.floating)
+                    )
+                )
+                and not (ae in checked_aes and pd.isna(value))
+            )
+
         # Not in data and not set, use default
         for ae in missing_aes:
-            data[ae] = self.DEFAULT_AES[ae]
+            value = self.DEFAULT_AES[ae]
+            if is_constant(ae, value):
+                constants[ae] = value
+            else:
+                data[ae] = value
 
         # Evaluate/Modify the mapped aesthetics
         evaled = evaluate(aes_modifiers, data, self.environment)
@@ -239,7 +291,11 @@ class geom(ABC, metaclass=Register):
 
         # Aesthetics set as parameters in the geom/stat
         for ae, value in self.aes_params.items():
-            if isinstance(value, (str, int, float, np.integer, np.floating)):
+            if is_constant(ae, value):
+                if ae in data:
+                    del data[ae]
+                constants[ae] = value
+            elif isinstance(value, (str, int, float, np.integer, np.floating)):
                 data[ae] = value
             elif isinstance(value, ae_value):
                 data[ae] = value * len(data)
@@ -263,6 +319,8 @@ class geom(ABC, metaclass=Register):
                     msg = f"'{ae}={value}' does not look like a valid value"
                     raise PlotnineError(msg) from e
 
+        if constant_aes is not None:
+            constant_aes.update(constants)
         return data
 
     def draw_layer(self, data: pd.DataFrame, layout: Layout, coord: coord):
@@ -304,8 +362,9 @@ class geom(ABC, metaclass=Register):
         Plot all groups
 
         For efficiency, geoms that do not need to partition
-        different groups before plotting should override this
-        method and avoid the groupby.
+        different groups before plotting should set
+        `DRAW_GROUPS_TOGETHER` or override this method and avoid
+        the groupby.
 
         Parameters
         ----------
@@ -330,6 +389,13 @@ class geom(ABC, metaclass=Register):
             Combined parameters for the geom and stat. Also
             includes the `zorder`.
         """
+        if self.DRAW_GROUPS_TOGETHER:
+            data = data.sort_values(
+                "group", kind="mergesort", ignore_index=True
+            )
+            self.draw_group(data, panel_params, coord, ax, self.params)
+            return
+
         for _, gdata in data.groupby("group"):
             gdata.reset_index(inplace=True, drop=True)
             self.draw_group(gdata, panel_params, coord, ax, self.params)
@@ -108,8 +108,6 @@ class geom_abline(geom):
         data["yend"] = ranges.x[1] * data["slope"] + data["intercept"]
         data = data.drop_duplicates()
 
-        for _, gdata in data.groupby("group"):
-            gdata.reset_index(inplace=True)
-            geom_segment.draw_group(
-                gdata, panel_params, coord, ax, self.params
-            )
+        # All the lines of the panel are one collection
+        data = data.sort_values("group", kind="mergesort", ignore_index=True)
+        geom_segment.draw_group(data, panel_params, coord, ax, self.params)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import typing
+
+from ..doctools import document
+from .geom_raster import geom_raster
+
+if typing.TYPE_CHECKING:
+    import pandas as pd
+
+
+@document
+class geom_aggregate(geom_raster):
+    """
+    Points aggregated onto the pixels of the panel
+
+    The points are counted (or summed, or averaged) in each pixel of
+    the panel, and the pixels are drawn as a single image colored by
+    the fill scale. Use it in place of
+    [](:class:`~plotnine.geom_point`) when there are too many points
+    to draw each one.
+
+    {usage}
+
+    Parameters
+    ----------
+    {common_parameters}
+
+    See Also
+    --------
+    plotnine.stat_aggregate : The default `stat` for this `geom`.
+    plotnine.geom_raster
+    """
+
+    DEFAULT_PARAMS = {"stat": "aggregate"}
+
+    def setup_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        # The stat computes the bounds of the pixels
+        if {"xmin", "xmax", "ymin", "ymax"}.issubset(data.columns):
+            return data
+        return super().setup_data(data)
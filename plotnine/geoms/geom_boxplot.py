@@ -86,6 +86,7 @@ class geom_boxplot(geom):
         "weight": 1,
     }
     REQUIRED_AES = {"x", "lower", "upper", "middle", "ymin", "ymax"}
+    DRAW_GROUPS_TOGETHER = True
     DEFAULT_PARAMS = {
         "stat": "boxplot",
         "position": "dodge2",
@@ -226,21 +227,21 @@ class geom_boxplot(geom):
             box["ynotchlower"] = data["notchlower"]
             box["ynotchupper"] = data["notchupper"]
 
-        # outliers
-        num_outliers = len(data["outliers"].iloc[0])
-        if num_outliers:
+        # outliers, of all the boxes
+        num_outliers = data["outliers"].map(len).to_numpy()
+        if num_outliers.any():
 
             def outlier_value(param: str) -> Any:
                 oparam = f"outlier_{param}"
                 if params[oparam] is not None:
                     return params[oparam]
-                return data[param].iloc[0]
+                return np.repeat(data[param].to_numpy(), num_outliers)
 
             outliers = pd.DataFrame(
                 {
-                    "y": data["outliers"].iloc[0],
-                    "x": np.repeat(data["x"].iloc[0], num_outliers),
-                    "fill": [None] * num_outliers,
+                    "y": np.hstack(data["outliers"].to_list()),
+                    "x": np.repeat(data["x"].to_numpy(), num_outliers),
+                    "fill": None,
                 }
             )
             outliers["alpha"] = outlier_value("alpha")
@@ -50,6 +50,7 @@ class geom_crossbar(geom):
         "size": 0.5,
     }
     REQUIRED_AES = {"x", "y", "ymin", "ymax"}
+    DRAW_GROUPS_TOGETHER = True
     DEFAULT_PARAMS = {"width": 0.5, "fatten": 2}
 
     legend_key_size = staticmethod(geom_segment.legend_key_size)
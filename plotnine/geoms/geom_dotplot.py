@@ -5,7 +5,7 @@ from warnings import warn
 
 import numpy as np
 
-from .._utils import groupby_apply, resolution, to_rgba
+from .._utils import groupby_apply, resolution, to_rgba, to_rgba_array
 from ..doctools import document
 from ..exceptions import PlotnineWarning
 from .geom import geom
@@ -186,12 +186,11 @@ class geom_dotplot(geom):
         ax: Axes,
         params: dict[str, Any],
     ):
-        from matplotlib.collections import PatchCollection
-        from matplotlib.patches import Ellipse
+        from matplotlib.collections import EllipseCollection
 
         data = coord.transform(data, panel_params)
-        fill = to_rgba(data["fill"], data["alpha"])
-        color = to_rgba(data["color"], data["alpha"])
+        fill = to_rgba_array(data["fill"], data["alpha"])
+        color = to_rgba_array(data["color"], data["alpha"])
         ranges = coord.range(panel_params)
 
         # For perfect circles the width/height of the circle(ellipse)
@@ -215,13 +214,15 @@ class geom_dotplot(geom):
         else:
             raise ValueError(f"Invalid valid value binaxis={binaxis}")
 
-        circles = []
-        for xy in zip(xpos, ypos):
-            patch = Ellipse(xy, width=width, height=height)
-            circles.append(patch)
-
-        coll = PatchCollection(
-            circles,
+        # The dots all have the same size, in data units, and they
+        # are placed with the offsets.
+        coll = EllipseCollection(
+            width,
+            height,
+            0,
+            units="xy",
+            offsets=np.column_stack([xpos, ypos]),
+            offset_transform=ax.transData,
             edgecolors=color,
             facecolors=fill,
             rasterized=params["raster"],
@@ -41,6 +41,7 @@ class geom_errorbar(geom):
         "size": 0.5,
     }
     REQUIRED_AES = {"x", "ymin", "ymax"}
+    DRAW_GROUPS_TOGETHER = True
     DEFAULT_PARAMS = {"width": 0.5}
 
     draw_legend = staticmethod(geom_path.draw_legend)
@@ -41,6 +41,7 @@ class geom_errorbarh(geom):
         "size": 0.5,
     }
     REQUIRED_AES = {"y", "xmin", "xmax"}
+    DRAW_GROUPS_TOGETHER = True
     DEFAULT_PARAMS = {"height": 0.5}
 
     draw_legend = staticmethod(geom_path.draw_legend)
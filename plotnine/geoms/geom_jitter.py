@@ -32,9 +32,10 @@ class geom_jitter(geom_point):
         Proportion to jitter in vertical direction.
         The default value is that from
         [](`~plotnine.positions.position_jitter`).
-    random_state : int | ~numpy.random.RandomState, default=None
+    random_state : int | ~numpy.random.Generator, default=None
         Seed or Random number generator to use. If `None`, then
         numpy global generator [](`numpy.random`) is used.
+        A `RandomState` or a `SeedSequence` are also accepted.
 
     See Also
     --------
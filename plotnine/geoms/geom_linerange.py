@@ -36,6 +36,7 @@ class geom_linerange(geom):
         "size": 0.5,
     }
     REQUIRED_AES = {"x", "ymin", "ymax"}
+    DRAW_GROUPS_TOGETHER = True
 
     draw_legend = staticmethod(geom_path.draw_legend)
 
@@ -5,7 +5,7 @@ import typing
 import numpy as np
 import pandas as pd
 
-from .._utils import SIZE_FACTOR, to_rgba
+from .._utils import SIZE_FACTOR, to_rgba_array
 from ..doctools import document
 from ..exceptions import PlotnineError
 from .geom import geom
@@ -18,8 +18,7 @@ if typing.TYPE_CHECKING:
     import numpy.typing as npt
     from matplotlib.axes import Axes
     from matplotlib.offsetbox import DrawingArea
-    from matplotlib.patches import PathPatch
-    from shapely.geometry.polygon import LinearRing, Polygon
+    from matplotlib.path import Path
 
     from plotnine import aes
     from plotnine.coords.coord import coord
@@ -75,36 +74,23 @@ class geom_map(geom):
         if not len(data):
             return data
 
+        import shapely
+
         # Remove any NULL geometries, and remember
         # All the non-Null shapes in a shapefile are required to be
         # of the same shape type.
-        bool_idx = np.array([g is not None for g in data["geometry"]])
+        geometry = np.asarray(data["geometry"], dtype=object)
+        bool_idx = ~shapely.is_missing(geometry)
         if not np.all(bool_idx):
             data = data.loc[bool_idx]
+            geometry = geometry[bool_idx]
 
         # Add polygon limits. Scale training uses them
-        try:
-            bounds = data["geometry"].bounds
-        except AttributeError:
-            # The geometry is not a GeoSeries
-            # Bounds calculation is extracted from
-            # geopandas.base.GeoPandasBase.bounds
-            bounds = pd.DataFrame(
-                np.array([x.bounds for x in data["geometry"]]),
-                columns=["xmin", "ymin", "xmax", "ymax"],
-                index=data.index,
-            )
-        else:
-            bounds.rename(
-                columns={
-                    "minx": "xmin",
-                    "maxx": "xmax",
-                    "miny": "ymin",
-                    "maxy": "ymax",
-                },
-                inplace=True,
-            )
-
+        bounds = pd.DataFrame(
+            shapely.bounds(geometry),
+            columns=["xmin", "ymin", "xmax", "ymax"],
+            index=data.index,
+        )
         data = pd.concat([data, bounds], axis=1)
         return data
 
@@ -122,15 +108,17 @@ class geom_map(geom):
         data.loc[data["color"].isna(), "color"] = "none"
         data.loc[data["fill"].isna(), "fill"] = "none"
 
-        geom_type = data.geometry.iloc[0].geom_type
+        import shapely
+
+        geometry = np.asarray(data["geometry"], dtype=object)
+        geom_type = geometry[0].geom_type
         if geom_type in ("Polygon", "MultiPolygon"):
-            from matplotlib.collections import PatchCollection
+            from matplotlib.collections import PathCollection
 
             linewidth = data["size"] * SIZE_FACTOR
-            fill = to_rgba(data["fill"], data["alpha"])
-            patches = [PolygonPatch(g) for g in data["geometry"]]
-            coll = PatchCollection(
-                patches,
+            fill = to_rgba_array(data["fill"], data["alpha"])
+            coll = PathCollection(
+                polygon_paths(geometry),
                 edgecolor=data["color"],
                 facecolor=fill,
                 linestyle=data["linetype"],
@@ -142,7 +130,7 @@ class geom_map(geom):
         elif geom_type == "Point":
             # Extract point coordinates from shapely geom
             # and plot with geom_point
-            arr = np.array([list(g.coords)[0] for g in data["geometry"]])
+            arr = shapely.get_coordinates(geometry)
             data["x"] = arr[:, 0]
             data["y"] = arr[:, 1]
             for _, gdata in data.groupby("group"):
@@ -152,28 +140,25 @@ class geom_map(geom):
             # Where n is the length of the dataframe (no. of multipoints),
             #       m is the number of all points in all multipoints
             #
-            # - MultiPoint -> List of Points (tuples) (n -> m)
-            # - Explode the list, to create a dataframe were each point
-            #      is associated with the right aesthetics (n -> m)
-            # - Create x & y columns from the points (m -> m)
-            data["points"] = [
-                [p.coords[0] for p in mp.geoms] for mp in data["geometry"]
-            ]
-            data = data.explode("points", ignore_index=True)
-            data["x"] = [p[0] for p in data["points"]]
-            data["y"] = [p[1] for p in data["points"]]
+            # The coordinates of all the points (m) come with the
+            # index of the multipoint (n) they belong to, and that
+            # index associates each point with the right aesthetics.
+            arr, idx = shapely.get_coordinates(geometry, return_index=True)
+            data = data.iloc[idx].reset_index(drop=True)
+            data["x"] = arr[:, 0]
+            data["y"] = arr[:, 1]
             geom_point.draw_group(data, panel_params, coord, ax, params)
         elif geom_type in ("LineString", "MultiLineString"):
             from matplotlib.collections import LineCollection
 
+            # Each line of a MultiLineString takes the aesthetics
+            # of the row
+            lines, idx = shapely.get_parts(geometry, return_index=True)
+            arr, line_idx = shapely.get_coordinates(lines, return_index=True)
+            segments = np.split(arr, np.flatnonzero(np.diff(line_idx)) + 1)
+            data = data.iloc[idx]
             linewidth = data["size"] * SIZE_FACTOR
-            color = to_rgba(data["color"], data["alpha"])
-            segments = []
-            for g in data["geometry"]:
-                if g.geom_type == "LineString":
-                    segments.append(g.coords)
-                else:
-                    segments.extend(_g.coords for _g in g.geoms)
+            color = to_rgba_array(data["color"], data["alpha"])
 
             coll = LineCollection(
                 segments,
@@ -212,21 +197,22 @@ class geom_map(geom):
         return geom_polygon.draw_legend(data, da, lyr)
 
 
-def PolygonPatch(
-    obj: Polygon,
-) -> PathPatch:
+def polygon_paths(geometry: npt.ArrayLike) -> list[Path]:
     """
-    Return a Matplotlib patch from a Polygon/MultiPolygon Geometry
+    Return Matplotlib paths from Polygon/MultiPolygon geometries
+
+    The coordinates of all the geometries are extracted in bulk, and
+    each geometry becomes a compound path with a subpath per ring.
 
     Parameters
     ----------
-    obj : shapley.geometry.Polygon | shapley.geometry.MultiPolygon
-        A Polygon or MultiPolygon to create a patch for description
+    geometry : array_like
+        Polygons and MultiPolygons to create paths for.
 
     Returns
     -------
-    result : matplotlib.patches.PathPatch
-        A patch representing the shapely geometry
+    out : list[matplotlib.path.Path]
+        A path for each geometry.
 
     Notes
     -----
@@ -234,65 +220,42 @@ def PolygonPatch(
     by Sean Gillies (BSD license, https://pypi.org/project/descartes)
     which is nolonger being maintained.
     """
-    from matplotlib.patches import PathPatch
+    import shapely
     from matplotlib.path import Path
 
-    def cw_coords(ring: LinearRing) -> npt.NDArray[Any]:
-        """
-        Return Clockwise array coordinates
-
-        Parameters
-        ----------
-        ring: shapely.geometry.polygon.LinearRing
-            LinearRing
-
-        Returns
-        -------
-        out: ndarray
-            (n x 2) array of coordinate points.
-        """
-        if ring.is_ccw:
-            return np.asarray(ring.coords)[:, :2][::-1]
-        return np.asarray(ring.coords)[:, :2]
-
-    def ccw_coords(ring: LinearRing) -> npt.NDArray[Any]:
-        """
-        Return Counter Clockwise array coordinates
-
-        Parameters
-        ----------
-        ring: shapely.geometry.polygon.LinearRing
-            LinearRing
-
-        Returns
-        -------
-        out: ndarray
-            (n x 2) array of coordinate points.
-        """
-        if ring.is_ccw:
-            return np.asarray(ring.coords)[:, :2]
-        return np.asarray(ring.coords)[:, :2][::-1]
+    # A MultiPolygon has one or more Polygon geoms, and each
+    # Polygon has an exterior ring followed by the interior rings
+    geometry = np.asarray(geometry, dtype=object)
+    polygons, polygon_geom = shapely.get_parts(geometry, return_index=True)
+    rings, ring_polygon = shapely.get_rings(polygons, return_index=True)
+    coords, ring_idx = shapely.get_coordinates(rings, return_index=True)
 
     # The interiors are holes in the Polygon
     # MPL draws a hole if the vertex points are specified
     # in an opposite direction. So we use Clockwise for
     # the exterior/shell and Counter-Clockwise for any
     # interiors/holes
-    if obj.geom_type == "Polygon":
-        _exterior = [Path(cw_coords(obj.exterior))]
-        _interior = [Path(ccw_coords(ring)) for ring in obj.interiors]
-    else:
-        # A MultiPolygon has one or more Polygon geoms.
-        # Concatenate the exterior of all the Polygons
-        # and the interiors
-        _exterior = []
-        _interior = []
-        for p in obj.geoms:  # type: ignore
-            _exterior.append(Path(cw_coords(p.exterior)))
-            _interior.extend([Path(ccw_coords(ring)) for ring in p.interiors])
-
-    path = Path.make_compound_path(*_exterior, *_interior)
-    return PathPatch(path)
+    n = np.bincount(ring_idx, minlength=len(rings))
+    starts = np.cumsum(n) - n
+    is_exterior = np.ones(len(rings), dtype=bool)
+    is_exterior[1:] = ring_polygon[1:] != ring_polygon[:-1]
+    reverse = shapely.is_ccw(rings) == is_exterior
+    pos = np.arange(len(coords))
+    flip = reverse[ring_idx]
+    first, last = starts[ring_idx], starts[ring_idx] + n[ring_idx] - 1
+    pos[flip] = (first + last - pos)[flip]
+    coords = coords[pos]
+
+    codes = np.full(len(coords), Path.LINETO, dtype=Path.code_type)
+    codes[starts] = Path.MOVETO
+
+    # The vertices of each geometry
+    geom_idx = polygon_geom[ring_polygon][ring_idx]
+    bounds = np.searchsorted(geom_idx, np.arange(1, len(geometry)))
+    return [
+        Path(v, c)
+        for v, c in zip(np.split(coords, bounds), np.split(codes, bounds))
+    ]
 
 
 def check_geopandas():
@@ -1,30 +1,34 @@
 from __future__ import annotations
 
-from collections import Counter
 from contextlib import suppress
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from warnings import warn
 
 import numpy as np
-
-from .._utils import SIZE_FACTOR, make_line_segments, match, to_rgba
+import pandas as pd
+
+from .._utils import (
+    SIZE_FACTOR,
+    scalar_if_constant,
+    to_rgba,
+    to_rgba_array,
+)
 from ..doctools import document
 from ..exceptions import PlotnineWarning
 from .geom import geom
 
 if TYPE_CHECKING:
-    from typing import Any, Literal, Sequence
+    from typing import Any, Literal
 
     import numpy.typing as npt
-    import pandas as pd
     from matplotlib.axes import Axes
     from matplotlib.offsetbox import DrawingArea
-    from matplotlib.path import Path
 
     from plotnine.coords.coord import coord
     from plotnine.iapi import panel_view
     from plotnine.layer import layer
-    from plotnine.typing import BoolArray
+    from plotnine.typing import FloatArray, IntArray
 
 
 @document
@@ -64,35 +68,28 @@ class geom_path(geom):
     }
 
     def handle_na(self, data: pd.DataFrame) -> pd.DataFrame:
-        def keep(x: Sequence[float]) -> BoolArray:
-            # first non-missing to last non-missing
-            first = match([False], x, nomatch=1, start=0)[0]
-            last = len(x) - match([False], x[::-1], nomatch=1, start=0)[0]
-            bool_idx = np.hstack(
-                [
-                    np.repeat(False, first),
-                    np.repeat(True, last - first),
-                    np.repeat(False, len(x) - last),
-                ]
-            )
-            return bool_idx
-
-        # Get indices where any row for the select aesthetics has
-        # NaNs at the beginning or the end. Those we drop
-        bool_idx = (
-            data[["x", "y", "size", "color", "linetype"]]
-            .isna()  # Missing
-            .apply(keep, axis=0)
-        )  # Beginning or the End
-        bool_idx = np.all(bool_idx, axis=1)  # Across the aesthetics
-
-        # return data
+        # Drop the rows before the first non-missing value & after the
+        # last non-missing value of any of the aesthetics. The missing
+        # values in between remain, they break the path.
         n1 = len(data)
-        data = data.loc[bool_idx]
-        data.reset_index(drop=True, inplace=True)
+        first, last = 0, n1
+        for col in ["x", "y", "size", "color", "linetype"]:
+            present = ~data[col].isna().to_numpy()
+            if present.any():
+                first = max(first, int(present.argmax()))
+                last = min(last, n1 - int(present[::-1].argmax()))
+            else:
+                first, last = max(first, 1), min(last, n1 - 1)
+
+        if first == 0 and last == n1:
+            if not data.index.equals(pd.RangeIndex(n1)):
+                data = data.reset_index(drop=True)
+            return data
+
+        data = data.iloc[first : max(first, last)].reset_index(drop=True)
         n2 = len(data)
 
-        if n2 != n1 and not self.params["na_rm"]:
+        if not self.params["na_rm"]:
             geom = self.__class__.__name__
             msg = f"{geom}: Removed {n1 - n2} rows containing missing values."
             warn(msg, PlotnineWarning)
@@ -106,7 +103,7 @@ class geom_path(geom):
         coord: coord,
         ax: Axes,
     ):
-        if not any(data["group"].duplicated()):
+        if not data["group"].duplicated().any():
             geom = self.__class__.__name__
             warn(
                 f"{geom}: Each group consist of only one "
@@ -116,9 +113,8 @@ class geom_path(geom):
             )
 
         # drop lines with less than two points
-        c = Counter(data["group"])
-        counts = np.array([c[v] for v in data["group"]])
-        data = data[counts >= 2]
+        counts = data.groupby("group")["group"].transform("size")
+        data = data[counts.to_numpy() >= 2]
 
         if len(data) < 2:
             return
@@ -137,13 +133,7 @@ class geom_path(geom):
 
         constant = num_unique_rows == ngroup
         self.params["constant"] = constant
-
-        if not constant:
-            self.draw_group(data, panel_params, coord, ax, self.params)
-        else:
-            for _, gdata in data.groupby("group"):
-                gdata.reset_index(inplace=True, drop=True)
-                self.draw_group(gdata, panel_params, coord, ax, self.params)
+        self.draw_group(data, panel_params, coord, ax, self.params)
 
     @staticmethod
     def draw_group(
@@ -285,83 +275,75 @@ class arrow:
             Combined parameters for the geom and stat. Also
             includes the `zorder`.
         """
+        from matplotlib.collections import PolyCollection
+
         first = self.ends in ("first", "both")
         last = self.ends in ("last", "both")
 
         data = data.sort_values("group", kind="mergesort")
-        data["color"] = to_rgba(data["color"], data["alpha"])  # pyright: ignore[reportCallIssue,reportArgumentType]
-
-        if self.type == "open":
-            data["facecolor"] = "none"
-        else:
-            data["facecolor"] = data["color"]
 
         if not constant:
-            from matplotlib.collections import PathCollection
-
             # Get segments/points (x1, y1) -> (x2, y2)
             # for which to calculate the arrow heads
-            idx1: list[int] = []
-            idx2: list[int] = []
-            for _, df in data.groupby("group"):
-                idx1.extend(df.index[:-1].to_list())
-                idx2.extend(df.index[1:].to_list())
-
-            d = {
-                "zorder": params["zorder"],
-                "rasterized": params["raster"],
-                "edgecolor": data.loc[idx1, "color"],
-                "facecolor": data.loc[idx1, "facecolor"],
-                "linewidth": data.loc[idx1, "linewidth"],
-                "linestyle": data.loc[idx1, "linetype"],
-            }
-
-            x1 = data.loc[idx1, "x"].to_numpy()
-            y1 = data.loc[idx1, "y"].to_numpy()
-            x2 = data.loc[idx2, "x"].to_numpy()
-            y2 = data.loc[idx2, "y"].to_numpy()
-
-            if first:
-                paths = self.get_paths(x1, y1, x2, y2, panel_params, coord, ax)
-                coll = PathCollection(paths, **d)
-                ax.add_collection(coll)
-            if last:
-                x1, y1, x2, y2 = x2, y2, x1, y1
-                paths = self.get_paths(x1, y1, x2, y2, panel_params, coord, ax)
-                coll = PathCollection(paths, **d)
-                ax.add_collection(coll)
+            idx1, idx2 = _segment_indices(data["group"].to_numpy())
+            first_idx = last_idx = (idx1, idx2)
         else:
-            from matplotlib.patches import PathPatch
-
-            d = {
-                "zorder": params["zorder"],
-                "rasterized": params["raster"],
-                "edgecolor": data["color"].iloc[0],
-                "facecolor": data["facecolor"].iloc[0],
-                "linewidth": data["linewidth"].iloc[0],
-                "linestyle": data["linetype"].iloc[0],
-                "joinstyle": "round",
-                "capstyle": "butt",
-            }
-
-            if first:
-                x1, x2 = data["x"].iloc[0:2]
-                y1, y2 = data["y"].iloc[0:2]
-                x1, y1, x2, y2 = (np.array([i]) for i in (x1, y1, x2, y2))
-                paths = self.get_paths(x1, y1, x2, y2, panel_params, coord, ax)
-                patch = PathPatch(paths[0], **d)
-                ax.add_artist(patch)
-
-            if last:
-                x1, x2 = data["x"].iloc[-2:]
-                y1, y2 = data["y"].iloc[-2:]
-                x1, y1, x2, y2 = x2, y2, x1, y1
-                x1, y1, x2, y2 = (np.array([i]) for i in (x1, y1, x2, y2))
-                paths = self.get_paths(x1, y1, x2, y2, panel_params, coord, ax)
-                patch = PathPatch(paths[0], **d)
-                ax.add_artist(patch)
-
-    def get_paths(
+            # The first and last segments of each path
+            starts, ends = _group_bounds(data["group"].to_numpy())
+            first_idx = (starts, starts + 1)
+            last_idx = (ends - 2, ends - 1)
+
+        # The point of each arrow head, the point it points away
+        # from and the point that has the style of the head
+        heads: list[IntArray] = []
+        tails: list[IntArray] = []
+        styles: list[IntArray] = []
+        if first:
+            idx1, idx2 = first_idx
+            heads.append(idx1)
+            tails.append(idx2)
+            styles.append(idx1)
+
+        if last:
+            idx1, idx2 = last_idx
+            heads.append(idx2)
+            tails.append(idx1)
+            styles.append(idx1)
+
+        empty = np.array([], dtype=int)
+        head = np.hstack(heads) if heads else empty
+        tail = np.hstack(tails) if tails else empty
+        style = np.hstack(styles) if styles else empty
+
+        x = data["x"].to_numpy()
+        y = data["y"].to_numpy()
+        verts = self.get_vertices(
+            x[head], y[head], x[tail], y[tail], panel_params, coord, ax
+        )
+
+        color = to_rgba_array(
+            data["color"].iloc[style], data["alpha"].iloc[style]
+        )
+        facecolor = "none" if self.type == "open" else color
+        linewidth = data["linewidth"].to_numpy()[style]
+        linetype = data["linetype"].to_numpy()[style]
+
+        # All the arrow heads, of all styles, are one collection
+        coll = PolyCollection(
+            verts,  # pyright: ignore[reportArgumentType]
+            closed=False,
+            edgecolor=color,
+            facecolor=facecolor,
+            linewidth=scalar_if_constant(linewidth),
+            linestyle=scalar_if_constant(linetype),
+            joinstyle="round",
+            capstyle="butt",
+            zorder=params["zorder"],
+            rasterized=params["raster"],
+        )
+        ax.add_collection(coll)
+
+    def get_vertices(
         self,
         x1: npt.ArrayLike,
         y1: npt.ArrayLike,
@@ -370,9 +352,9 @@ class arrow:
         panel_params: panel_view,
         coord: coord,
         ax: Axes,
-    ) -> list[Path]:
+    ) -> FloatArray:
         """
-        Compute paths that create the arrow heads
+        Compute the vertices of the arrow heads
 
         Parameters
         ----------
@@ -397,17 +379,12 @@ class arrow:
 
         Returns
         -------
-        out : list of Path
-            Paths that create arrow heads
+        out : array
+            Array of shape (n, 3, 2), the 3 vertices of each of
+            the n arrow heads. The middle vertex is the point.
         """
-        from matplotlib.path import Path
-
-        # The arrowhead path has 3 vertices,
-        # plus a dummy vertex for the STOP code
-        dummy = (0, 0)
-
-        # codes list remains the same after initialization
-        codes = [Path.MOVETO, Path.LINETO, Path.LINETO, Path.STOP]
+        x1, y1 = np.asarray(x1, dtype=float), np.asarray(y1, dtype=float)
+        x2, y2 = np.asarray(x2, dtype=float), np.asarray(y2, dtype=float)
 
         # We need the axes dimensions so that we can
         # compute scaling factors
@@ -423,7 +400,7 @@ class arrow:
         a = self.angle * np.pi / 180
 
         # direction of arrow head
-        xdiff, ydiff = x2 - x1, y2 - y1  # type: ignore
+        xdiff, ydiff = x2 - x1, y2 - y1
         rotations = np.arctan2(ydiff / ly, xdiff / lx)
 
         # Arrow head vertices
@@ -432,13 +409,9 @@ class arrow:
         v2x = x1 + lx * np.cos(rotations - a)
         v2y = y1 + ly * np.sin(rotations - a)
 
-        # create a path for each arrow head
-        paths = []
-        for t in zip(v1x, v1y, x1, y1, v2x, v2y):  # type: ignore
-            verts = [t[:2], t[2:4], t[4:], dummy]
-            paths.append(Path(verts, codes))
-
-        return paths
+        xs = np.column_stack([v1x, x1, v2x])
+        ys = np.column_stack([v1y, y1, v2y])
+        return np.stack([xs, ys], axis=-1)
 
 
 def stroke_paths(
@@ -491,28 +464,21 @@ def _draw_segments(data: pd.DataFrame, ax: Axes, params: dict[str, Any]):
     """
     from matplotlib.collections import LineCollection
 
-    color = to_rgba(data["color"], data["alpha"])
+    color = to_rgba_array(data["color"], data["alpha"])
     # All we do is line-up all the points in a group
-    # into segments, all in a single list.
-    # Along the way the other parameters are put in
-    # sequences accordingly
-    indices: list[int] = []  # for attributes of starting point of each segment
-    _segments = []
-    for _, df in data.groupby("group"):
-        idx = df.index
-        indices.extend(idx[:-1].to_list())  # One line from two points
-        x = data["x"].iloc[idx]
-        y = data["y"].iloc[idx]
-        _segments.append(make_line_segments(x, y, ispath=True))
-
-    segments = np.vstack(_segments).tolist()
-
-    edgecolor = color if color is None else [color[i] for i in indices]
-    linewidth = data.loc[indices, "linewidth"]
-    linestyle = data.loc[indices, "linetype"]
+    # into segments, all in a single array.
+    # The other parameters are those of the starting point
+    # of each segment
+    idx1, idx2 = _segment_indices(data["group"].to_numpy())
+    xy = np.column_stack([data["x"], data["y"]])
+    segments = np.stack([xy[idx1], xy[idx2]], axis=1)
+
+    edgecolor = color[idx1]
+    linewidth = data["linewidth"].to_numpy()[idx1]
+    linestyle = data["linetype"].to_numpy()[idx1]
 
     coll = LineCollection(
-        segments,
+        segments,  # pyright: ignore[reportArgumentType]
         edgecolor=edgecolor,
         linewidth=linewidth,
         linestyle=linestyle,
@@ -525,29 +491,55 @@ def _draw_segments(data: pd.DataFrame, ax: Axes, params: dict[str, Any]):
 
 def _draw_lines(data: pd.DataFrame, ax: Axes, params: dict[str, Any]):
     """
-    Draw a path with the same characteristics from the
-    first point to the last point
+    Draw paths with the same characteristics from the first point
+    to the last point
+
+    Each group is a path, and the rows of a group must be together.
+    The characteristics of a path are those of its first point.
     """
-    from matplotlib.lines import Line2D
+    from matplotlib.collections import LineCollection
+
+    starts, ends = _group_bounds(data["group"].to_numpy())
+    xy = np.column_stack([data["x"], data["y"]])
+    paths = np.split(xy, starts[1:])
+
+    first = data.take(starts)
+    colors = to_rgba_array(first["color"], first["alpha"])
+    linewidths = first["linewidth"].to_numpy()
+    linetypes = first["linetype"].to_numpy()
+
+    # The join & cap styles depend on the linetype and there can be
+    # only one of each for a collection. We create a collection for
+    # each run of paths that have the same styles, so that the paths
+    # are drawn in order.
+    # The styles are worked out once for each linetype.
+    codes, uniques = pd.factorize(linetypes, use_na_sentinel=False)
+    lt_styles = [_get_line_styles(lt, params) for lt in uniques]
+    styles = list(dict.fromkeys(lt_styles))
+    path_styles = np.array([styles.index(st) for st in lt_styles])[codes]
+    run_starts = np.hstack([0, np.flatnonzero(np.diff(path_styles)) + 1])
+    run_ends = np.hstack([run_starts[1:], len(path_styles)])
+    for i, j in zip(run_starts, run_ends):
+        joinstyle, capstyle = styles[path_styles[i]]
+        coll = LineCollection(
+            paths[i:j],
+            colors=scalar_if_constant(colors[i:j]),
+            linewidths=scalar_if_constant(linewidths[i:j]),
+            linestyles=scalar_if_constant(linetypes[i:j]),
+            joinstyle=joinstyle,
+            capstyle=capstyle,
+            zorder=params["zorder"],
+            rasterized=params["raster"],
+        )
+        ax.add_collection(coll)
 
-    color = to_rgba(data["color"].iloc[0], data["alpha"].iloc[0])
-    join_style = _get_joinstyle(data, params)
-    lines = Line2D(
-        data["x"],
-        data["y"],
-        color=color,
-        linewidth=data["linewidth"].iloc[0],
-        linestyle=data["linetype"].iloc[0],
-        zorder=params["zorder"],
-        rasterized=params["raster"],
-        **join_style,
-    )
-    ax.add_artist(lines)
 
+def _get_line_styles(linetype: Any, params: dict[str, Any]) -> tuple[str, str]:
+    """
+    Return the join style and cap style of a path
 
-def _get_joinstyle(
-    data: pd.DataFrame, params: dict[str, Any]
-) -> dict[str, Any]:
+    They are those that a Line2D with the linetype would use.
+    """
     with suppress(KeyError):
         if params["linejoin"] == "mitre":
             params["linejoin"] = "miter"
@@ -556,16 +548,57 @@ def _get_joinstyle(
         if params["lineend"] == "square":
             params["lineend"] = "projecting"
 
-    joinstyle = params.get("linejoin", "miter")
-    capstyle = params.get("lineend", "butt")
-    d = {}
-    if data["linetype"].iloc[0] == "solid":
-        d["solid_joinstyle"] = joinstyle
-        d["solid_capstyle"] = capstyle
-    elif data["linetype"].iloc[0] == "dashed":
-        d["dash_joinstyle"] = joinstyle
-        d["dash_capstyle"] = capstyle
-    return d
+    if isinstance(linetype, str) and linetype in ("solid", "dashed"):
+        return params.get("linejoin", "miter"), params.get("lineend", "butt")
+
+    return _default_line_styles(linetype)
+
+
+@lru_cache
+def _default_line_styles(linetype: Any) -> tuple[str, str]:
+    """
+    Return the default join and cap styles of a Line2D with the linetype
+    """
+    import matplotlib as mpl
+    from matplotlib.lines import Line2D
+
+    if Line2D([], [], linestyle=linetype).is_dashed():
+        return (
+            mpl.rcParams["lines.dash_joinstyle"],
+            mpl.rcParams["lines.dash_capstyle"],
+        )
+    return (
+        mpl.rcParams["lines.solid_joinstyle"],
+        mpl.rcParams["lines.solid_capstyle"],
+    )
+
+
+def _group_bounds(group: npt.ArrayLike) -> tuple[IntArray, IntArray]:
+    """
+    Return the starts and (exclusive) ends of contiguous groups
+    """
+    group = np.asarray(group)
+    if len(group) == 0:
+        empty = np.array([], dtype=int)
+        return empty, empty
+
+    change = np.flatnonzero(group[1:] != group[:-1]) + 1
+    starts = np.hstack([0, change])
+    ends = np.hstack([change, len(group)])
+    return starts, ends
+
+
+def _segment_indices(group: npt.ArrayLike) -> tuple[IntArray, IntArray]:
+    """
+    Return the indices of the points at the ends of the path segments
+
+    The points of each group make a path, taken group by group in
+    sorted order and in the order of the rows within a group.
+    """
+    group = np.asarray(group)
+    order = np.argsort(group, kind="stable")
+    same = group[order[1:]] == group[order[:-1]]
+    return order[:-1][same], order[1:][same]
 
 
 def _axes_get_size_inches(ax: Axes) -> tuple[float, float]:
@@ -3,8 +3,15 @@ from __future__ import annotations
 import typing
 
 import numpy as np
-
-from .._utils import SIZE_FACTOR, to_rgba
+import pandas as pd
+
+from .._utils import (
+    SIZE_FACTOR,
+    aes_values,
+    scalar_if_constant,
+    to_rgba,
+    to_rgba_array,
+)
 from ..doctools import document
 from ..scales.scale_shape import FILLED_SHAPES
 from .geom import geom
@@ -12,7 +19,6 @@ from .geom import geom
 if typing.TYPE_CHECKING:
     from typing import Any
 
-    import pandas as pd
     from matplotlib.axes import Axes
     from matplotlib.offsetbox import DrawingArea
 
@@ -43,6 +49,7 @@ class geom_point(geom):
     }
     REQUIRED_AES = {"x", "y"}
     NON_MISSING_AES = {"color", "shape", "size"}
+    SCALAR_CONSTANT_AES = True
 
     def draw_panel(
         self,
@@ -65,9 +72,19 @@ class geom_point(geom):
         params: dict[str, Any],
     ):
         data = coord.transform(data, panel_params)
+        # A constant shape is not in the data, all the points are a unit
+        if "shape" not in data:
+            geom_point.draw_unit(data, panel_params, coord, ax, params)
+            return
+
         units = "shape"
-        for _, udata in data.groupby(units, dropna=False):
-            udata.reset_index(inplace=True, drop=True)
+        indices = data.groupby(units, dropna=False, sort=True).indices
+        if len(indices) == 1:
+            geom_point.draw_unit(data, panel_params, coord, ax, params)
+            return
+
+        for idx in indices.values():
+            udata = data.take(idx).reset_index(drop=True)
             geom_point.draw_unit(udata, panel_params, coord, ax, params)
 
     @staticmethod
@@ -78,40 +95,86 @@ class geom_point(geom):
         ax: Axes,
         params: dict[str, Any],
     ):
+        """
+        Draw points that all have the same shape
+
+        The points are drawn as a single collection that is created
+        directly from the columns. It is what `ax.scatter` would
+        create, without the cost of processing the arguments.
+        """
+        import matplotlib as mpl
+        from matplotlib.collections import PathCollection
+        from matplotlib.markers import MarkerStyle
+        from matplotlib.transforms import IdentityTransform
+
+        shape = aes_values(data, params, "shape")
+        if isinstance(shape, pd.Series):
+            shape = shape.iloc[0]
+        x = np.asarray(data["x"], dtype=float)
+        y = np.asarray(data["y"], dtype=float)
+        # The constant sizes and strokes are scalars
+        stroke = np.asarray(aes_values(data, params, "stroke"), dtype=float)
+        size = np.asarray(aes_values(data, params, "size"), dtype=float)
+
+        # Points that cannot be placed or sized are not drawn
+        finite = (
+            np.isfinite(x)
+            & np.isfinite(y)
+            & np.isfinite(size)
+            & np.isfinite(stroke)
+        )
+        if not finite.all():
+            data = data.loc[finite]
+            x, y = x[finite], y[finite]
+            if stroke.ndim:
+                stroke = stroke[finite]
+            if size.ndim:
+                size = size[finite]
+
         # Our size is in 'points' while scatter wants
         # 'points^2'. The stroke is outside. And pi
         # gives a large enough scaling factor
         # All other sizes for which the MPL units should
         # be in points must scaled using sqrt(pi)
-        size = ((data["size"] + data["stroke"]) ** 2) * np.pi
-        linewidth = data["stroke"] * SIZE_FACTOR
-        color = to_rgba(data["color"], data["alpha"])
-        shape = data["shape"].iloc[0]
+        size = ((size + stroke) ** 2) * np.pi
+        linewidth = scalar_if_constant(stroke) * SIZE_FACTOR
+        alpha = aes_values(data, params, "alpha")
+        color = to_rgba_array(aes_values(data, params, "color"), alpha)
 
         # It is common to forget that scatter points are
         # filled and slip-up by manually assigning to the
         # color instead of the fill. We forgive.
         if shape in FILLED_SHAPES:
-            if all(c is None for c in data["fill"]):
+            fill = aes_values(data, params, "fill")
+            if np.all(pd.isna(fill)):
                 fill = color
             else:
-                fill = to_rgba(data["fill"], data["alpha"])
+                fill = to_rgba_array(fill, alpha)
         else:
             # Assume unfilled
             fill = color
-            color = None
-
-        ax.scatter(
-            x=data["x"],
-            y=data["y"],
-            s=size,
-            facecolor=fill,
-            edgecolor=color,
-            linewidth=linewidth,
-            marker=shape,
+            color = mpl.rcParams["scatter.edgecolors"]
+
+        marker = MarkerStyle(shape)
+        path = marker.get_path().transformed(marker.get_transform())
+        if not marker.is_filled():
+            # Markers like "+" and "x" are drawn with the edges
+            # only, so they take the color of the face
+            color = "face"
+
+        collection = PathCollection(
+            (path,),
+            np.atleast_1d(size),
+            facecolors=fill,
+            edgecolors=color,
+            linewidths=linewidth,
+            offsets=np.column_stack([x, y]),
+            offset_transform=ax.transData,
             zorder=params["zorder"],
             rasterized=params["raster"],
         )
+        collection.set_transform(IdentityTransform())
+        ax.add_collection(collection)
 
     @staticmethod
     def draw_legend(
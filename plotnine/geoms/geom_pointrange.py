@@ -45,6 +45,7 @@ class geom_pointrange(geom):
         "size": 0.5,
     }
     REQUIRED_AES = {"x", "y", "ymin", "ymax"}
+    DRAW_GROUPS_TOGETHER = True
     DEFAULT_PARAMS = {"fatten": 4}
 
     @staticmethod
@@ -3,8 +3,14 @@ from __future__ import annotations
 import typing
 
 import numpy as np
-
-from .._utils import SIZE_FACTOR, to_rgba
+import pandas as pd
+
+from .._utils import (
+    SIZE_FACTOR,
+    scalar_if_constant,
+    to_rgba,
+    to_rgba_array,
+)
 from ..doctools import document
 from .geom import geom
 from .geom_path import geom_path
@@ -12,7 +18,6 @@ from .geom_path import geom_path
 if typing.TYPE_CHECKING:
     from typing import Any
 
-    import pandas as pd
     from matplotlib.axes import Axes
     from matplotlib.offsetbox import DrawingArea
 
@@ -91,23 +96,21 @@ class geom_polygon(geom):
 
         # Each group is a polygon with a single facecolor
         # with potentially an edgecolor for every edge.
-        verts = []
-        facecolor = []
-        edgecolor = []
-        linestyle = []
-        linewidth = []
-
         # Some stats may order the data in ways that prevent
         # objects from occluding other objects. We do not want
-        # to undo that order.
-        grouper = data.groupby("group", sort=False)
-        for group, df in grouper:
-            fill = to_rgba(df["fill"].iloc[0], df["alpha"].iloc[0])
-            verts.append(tuple(zip(df["x"], df["y"])))
-            facecolor.append("none" if fill is None else fill)
-            edgecolor.append(df["color"].iloc[0] or "none")
-            linestyle.append(df["linetype"].iloc[0])
-            linewidth.append(df["linewidth"].iloc[0])
+        # to undo that order, so the polygons are in the order
+        # in which the groups first appear.
+        codes, _ = pd.factorize(data["group"])
+        order = np.argsort(codes, kind="stable")
+        starts = np.flatnonzero(np.diff(codes[order], prepend=-1))
+        xy = np.column_stack([data["x"].to_numpy(), data["y"].to_numpy()])
+        verts = np.split(xy[order], starts[1:]) if len(starts) else []
+
+        first = data.iloc[order[starts]]
+        facecolor = to_rgba_array(first["fill"], first["alpha"])
+        edgecolor = [c or "none" for c in first["color"]]
+        linestyle = scalar_if_constant(first["linetype"])
+        linewidth = scalar_if_constant(first["linewidth"])
 
         col = PolyCollection(
             verts,
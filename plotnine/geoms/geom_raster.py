@@ -4,8 +4,8 @@ import typing
 from warnings import warn
 
 import numpy as np
+import pandas as pd
 
-from .._utils import resolution
 from ..coords import coord_cartesian
 from ..doctools import document
 from ..exceptions import PlotnineError, PlotnineWarning
@@ -15,7 +15,6 @@ from .geom_polygon import geom_polygon
 if typing.TYPE_CHECKING:
     from typing import Any
 
-    import pandas as pd
     from matplotlib.axes import Axes
 
     from plotnine import aes
@@ -72,6 +71,11 @@ class geom_raster(geom):
         when interpolation is one of: `sinc`, `lanczos`, `blackman`.
         Must be a number greater than zero.
 
+    Notes
+    -----
+    A raster with many more cells than there are pixels in the panel
+    is shrunk, by averaging blocks of cells, before it is drawn.
+
     See Also
     --------
     plotnine.geom_rect
@@ -167,39 +171,91 @@ class geom_raster(geom):
         data = coord.transform(data, panel_params)
         x = data["x"].to_numpy().astype(float)
         y = data["y"].to_numpy().astype(float)
-        facecolor = to_rgba_array(data["fill"].to_numpy())
-        facecolor[:, 3] = data["alpha"].to_numpy()
+
+        # The size of the cells was computed when setting up the data
+        w = data["xmax"].iloc[0] - data["xmin"].iloc[0]
+        h = data["ymax"].iloc[0] - data["ymin"].iloc[0]
 
         # Convert vector of data to flat image,
         # figure out dimensions of raster on plot, and the colored
         # indices.
-        x_pos = ((x - x.min()) / resolution(x, False)).astype(int)
-        y_pos = ((y - y.min()) / resolution(y, False)).astype(int)
+        x_pos = np.round((x - x.min()) / w).astype(int)
+        y_pos = np.round((y - y.min()) / h).astype(int)
+
+        # When there are many cells to a pixel of the panel, the
+        # raster is shrunk by averaging blocks of cells. It is left
+        # with about two cells per pixel, so that the interpolation
+        # of the image still has some detail to work with.
+        bbox = ax.get_window_extent()
+        fx = _block_size(np.ptp(panel_params.x.range) / w, bbox.width)
+        fy = _block_size(np.ptp(panel_params.y.range) / h, bbox.height)
+        x_pos //= fx
+        y_pos //= fy
         nrow = y_pos.max() + 1
         ncol = x_pos.max() + 1
         yidx, xidx = nrow - y_pos - 1, x_pos
 
+        # The colors are converted once for each unique color and
+        # the image is 8 bit RGBA.
+        codes, uniques = pd.factorize(data["fill"])
+        rgb = to_rgba_array(np.asarray(uniques))[codes, :3]
+        alpha = data["alpha"].to_numpy().astype(float)
+
         # Create and "color" the matrix.
-        # Any gaps left whites (ones) colors plus zero alpha values
+        # Any gaps left whites colors plus zero alpha values
         # allows makes it possible to have a "neutral" interpolation
         # into the gaps when intervals are uneven.
-        X = np.ones((nrow, ncol, 4))
+        X = np.full((nrow, ncol, 4), 255, dtype=np.uint8)
         X[:, :, 3] = 0
-        X[yidx, xidx] = facecolor
+        if fx == 1 and fy == 1:
+            X[yidx, xidx, :3] = np.round(rgb * 255)
+            X[yidx, xidx, 3] = np.round(alpha * 255)
+        else:
+            # Average the alpha premultiplied colors of the cells
+            # in each block
+            block = yidx * ncol + xidx
+            size = nrow * ncol
+            a = np.bincount(block, alpha, size)
+            has_color = a > 0
+            for i in range(3):
+                c = np.bincount(block, rgb[:, i] * alpha, size)
+                channel = X[:, :, i].reshape(-1)
+                channel[has_color] = np.round(
+                    c[has_color] / a[has_color] * 255
+                )
+                X[:, :, i] = channel.reshape(nrow, ncol)
+            X[:, :, 3] = np.round(a / (fx * fy) * 255).reshape(nrow, ncol)
 
+        xmin, ymin = data["xmin"].min(), data["ymin"].min()
         im = AxesImage(
             ax,
             data=X,
             interpolation=self.params["interpolation"],
             origin="upper",
             extent=(
-                data["xmin"].min(),
-                data["xmax"].max(),
-                data["ymin"].min(),
-                data["ymax"].max(),
+                xmin,
+                max(data["xmax"].max(), xmin + ncol * fx * w),
+                ymin,
+                max(data["ymax"].max(), ymin + nrow * fy * h),
             ),
             rasterized=self.params["raster"],
             filterrad=self.params["filterrad"],
             zorder=self.params["zorder"],
         )
         ax.add_image(im)
+
+
+def _block_size(ncells: float, npixels: float) -> int:
+    """
+    Return the number of cells to merge along one side of the raster
+
+    Parameters
+    ----------
+    ncells :
+        Number of cells that span the panel.
+    npixels :
+        Number of pixels that span the panel.
+    """
+    if npixels <= 0:
+        return 1
+    return max(int(ncells / npixels / 2), 1)
@@ -5,7 +5,7 @@ import typing
 import numpy as np
 import pandas as pd
 
-from .._utils import SIZE_FACTOR, to_rgba
+from .._utils import SIZE_FACTOR, scalar_if_constant, to_rgba_array
 from ..doctools import document
 from .geom import geom
 from .geom_polygon import geom_polygon
@@ -57,13 +57,10 @@ class geom_rect(geom):
             # Each rectangle is its own closed polygon. Grouping by the
             # `group` aesthetic would merge a stacked bar's segments into one
             # open path, and coord.munch would then bend the join between
-            # consecutive rectangles into a spurious spike.
+            # consecutive rectangles into a spurious spike. The polygons
+            # of all the rectangles are drawn with one call.
             data["group"] = np.repeat(np.arange(len(data) // 4), 4)
-            for _, gdata in data.groupby("group"):
-                gdata.reset_index(inplace=True, drop=True)
-                geom_polygon.draw_group(
-                    gdata, panel_params, coord, ax, self.params
-                )
+            geom_polygon.draw_group(data, panel_params, coord, ax, self.params)
         else:
             self.draw_group(data, panel_params, coord, ax, self.params)
 
@@ -99,13 +96,17 @@ def fill_rects(
     """
     from matplotlib.collections import PolyCollection
 
-    linewidth = data["size"] * SIZE_FACTOR
+    linewidth = scalar_if_constant(data["size"]) * SIZE_FACTOR
 
-    limits = zip(data["xmin"], data["xmax"], data["ymin"], data["ymax"])
-
-    verts = [[(l, b), (l, t), (r, t), (r, b)] for (l, r, b, t) in limits]
+    # The corners of all the rectangles, in an (n, 4, 2) array
+    l, r = data["xmin"].to_numpy(), data["xmax"].to_numpy()
+    b, t = data["ymin"].to_numpy(), data["ymax"].to_numpy()
+    verts = np.stack(
+        [np.column_stack([l, l, r, r]), np.column_stack([b, t, t, b])],
+        axis=-1,
+    )
 
-    fill = to_rgba(data["fill"], data["alpha"])
+    fill = to_rgba_array(data["fill"], data["alpha"])
     color = data["color"]
 
     # prevent unnecessary borders
@@ -116,7 +117,7 @@ def fill_rects(
         verts,
         facecolors=fill,
         edgecolors=color,
-        linestyles=data["linetype"],
+        linestyles=scalar_if_constant(data["linetype"]),
         linewidths=linewidth,
         zorder=params["zorder"],
         rasterized=params["raster"],
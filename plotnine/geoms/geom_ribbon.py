@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import typing
 
-from .._utils import SIZE_FACTOR, to_rgba
+import numpy as np
+
+from .._utils import SIZE_FACTOR, scalar_if_constant, to_rgba_array
 from ..doctools import document
 from ..exceptions import PlotnineError
 from .geom import geom
-from .geom_path import stroke_paths
+from .geom_path import _group_bounds, stroke_paths
 from .geom_polygon import geom_polygon
 
 if typing.TYPE_CHECKING:
@@ -17,7 +19,7 @@ if typing.TYPE_CHECKING:
 
     from plotnine.coords.coord import coord
     from plotnine.iapi import panel_view
-    from plotnine.typing import ColorsLike
+    from plotnine.typing import BoolArray, FloatArray, IntArray
 
 
 @document
@@ -67,6 +69,7 @@ class geom_ribbon(geom):
         "where": True,
     }
     REQUIRED_AES = {"x", "ymax", "ymin"}
+    DRAW_GROUPS_TOGETHER = True
     DEFAULT_PARAMS = {"outline_type": "both"}
     draw_legend = staticmethod(geom_polygon.draw_legend)
 
@@ -91,16 +94,17 @@ class geom_ribbon(geom):
     ):
         _x = "x" if coord.preserves_dimensions else "y"
         data = coord.transform(data, panel_params, munch=True)
-        data = data.sort_values(by=["group", _x], kind="mergesort")
-        units = ["alpha", "color", "fill", "linetype", "size"]
+        data = data.sort_values(
+            by=["group", _x], kind="mergesort", ignore_index=True
+        )
+        units = ["alpha", "color", "fill", "linetype", "size", "group"]
+        ngroups = len(np.unique(data["group"].to_numpy()))
 
-        if len(data[units].drop_duplicates()) > 1:
+        if len(data[units].drop_duplicates()) > ngroups:
             msg = "Aesthetics cannot vary within a ribbon."
             raise PlotnineError(msg)
 
-        for _, udata in data.groupby(units, dropna=False):
-            udata.reset_index(inplace=True, drop=True)
-            geom_ribbon.draw_unit(udata, panel_params, coord, ax, params)
+        geom_ribbon.draw_unit(data, panel_params, coord, ax, params)
 
     @staticmethod
     def draw_unit(
@@ -110,45 +114,54 @@ class geom_ribbon(geom):
         ax: Axes,
         params: dict[str, Any],
     ):
-        linewidth = data["size"].iloc[0] * SIZE_FACTOR
-        fill = to_rgba(data["fill"], data["alpha"])
+        """
+        Draw the ribbons of one or more groups
 
-        if data["color"].isna().all():
-            color: ColorsLike = "none"
-        else:
-            color = data["color"]
-
-        if fill is None:
-            fill = "none"
+        The rows of each group must be together and in order.
+        """
+        from matplotlib.collections import PolyCollection
 
         if coord.preserves_dimensions:
-            fill_between = ax.fill_between
             _x, _min, _max = data["x"], data["ymin"], data["ymax"]
         else:
-            fill_between = ax.fill_betweenx
             _x, _min, _max = data["y"], data["xmin"], data["xmax"]
 
-        # We only change this defaults for fill_between when necessary
-        where = data.get("where", None)
-        interpolate = not (where is None or where.all())
-
-        if params["outline_type"] != "full":
-            linewidth = 0
-            color = "none"
-
-        fill_between(
-            _x,
-            _min,
-            _max,
-            where=where,
-            interpolate=interpolate,
-            facecolor=fill,
-            edgecolor=color,
-            linewidth=linewidth,
-            linestyle=data["linetype"].iloc[0],
+        starts, _ = _group_bounds(data["group"].to_numpy())
+        where = data.get("where", True)
+        verts, region_group = _ribbon_verts(
+            _x.to_numpy(dtype=float),
+            _min.to_numpy(dtype=float),
+            _max.to_numpy(dtype=float),
+            np.broadcast_to(np.asarray(where, dtype=bool), len(data)),
+            starts,
+        )
+        if not coord.preserves_dimensions:
+            verts = [v[:, ::-1] for v in verts]
+
+        # The aesthetics of a ribbon are those of the first point of
+        # its group
+        first = data.take(starts[region_group])
+        facecolor = to_rgba_array(first["fill"], first["alpha"])
+        edgecolor: Any = "none"
+        linewidth: Any = 0
+        if params["outline_type"] == "full":
+            color = to_rgba_array(first["color"], 1)
+            # Matplotlib does not stroke the polygons only if all
+            # the edges are "none"
+            if color[:, 3].any():
+                edgecolor = color
+                linewidth = scalar_if_constant(first["size"]) * SIZE_FACTOR
+
+        col = PolyCollection(
+            verts,
+            facecolors=facecolor,
+            edgecolors=edgecolor,
+            linewidths=linewidth,
+            linestyles=scalar_if_constant(first["linetype"]),
             zorder=params["zorder"],
             rasterized=params["raster"],
         )
+        ax.add_collection(col)
 
         # Alpha does not affect the outlines
         data["alpha"] = 1
@@ -170,8 +183,8 @@ class geom_ribbon(geom):
         # the dimensions, the ribbon bounds are `xmin` and `xmax`.
         bounds = "y" if coord.preserves_dimensions else "x"
 
-        # Each call receives one ribbon group, so an outline forms one path
-        # with constant aesthetics.
+        # The aesthetics are constant within a ribbon, so the outlines
+        # are paths with constant aesthetics.
         if outline_type in ("lower", "both"):
             lower = data.assign(**{bounds: data[f"{bounds}min"]})
             stroke_paths(lower, ax, params, constant=True)
@@ -179,3 +192,113 @@ class geom_ribbon(geom):
         if outline_type in ("upper", "both"):
             upper = data.assign(**{bounds: data[f"{bounds}max"]})
             stroke_paths(upper, ax, params, constant=True)
+
+
+def _ribbon_verts(
+    t: FloatArray,
+    f1: FloatArray,
+    f2: FloatArray,
+    where: BoolArray,
+    starts: IntArray,
+) -> tuple[list[FloatArray], IntArray]:
+    """
+    Compute the polygons that fill the ribbons of many groups
+
+    The polygons are those that matplotlib's `fill_between` creates
+    for each group, with `interpolate=True` for the groups where
+    `where` is not all `True`.
+
+    Parameters
+    ----------
+    t :
+        Positions along the ribbons
+    f1, f2 :
+        The bounds of the ribbons
+    where :
+        Whether to fill at each position
+    starts :
+        Positions where the groups start
+
+    Returns
+    -------
+    verts :
+        The vertices of a polygon for each region that is filled
+    region_group :
+        The group (index into starts) of each polygon
+    """
+    n = len(t)
+    valid = where & np.isfinite(t) & np.isfinite(f1) & np.isfinite(f2)
+    is_start = np.zeros(n, dtype=bool)
+    is_start[starts] = True
+    is_end = np.append(is_start[1:], True)
+
+    # A region is a run of valid points within a group
+    first = np.flatnonzero(valid & (is_start | ~np.append(False, valid[:-1])))
+    last = np.flatnonzero(valid & (is_end | ~np.append(valid[1:], False)))
+    if not len(first):
+        return [], np.array([], dtype=int)
+
+    length = last - first + 1
+    group = np.searchsorted(starts, first, side="right") - 1
+    interpolate = ~np.logical_and.reduceat(where, starts)[group]
+
+    # Each polygon goes from a start point, along f1, to an end point,
+    # then back along f2
+    size = 2 * length + 2
+    offset = np.cumsum(size) - size
+    k = np.arange(length.sum()) - np.repeat(np.cumsum(length) - length, length)
+    idx = np.repeat(first, length) + k
+    poly_offset = np.repeat(offset, length)
+    poly_length = np.repeat(length, length)
+
+    pts = np.empty((size.sum(), 2))
+    pts[offset] = np.column_stack([t[first], f2[first]])
+    pts[poly_offset + 1 + k] = np.column_stack([t[idx], f1[idx]])
+    pts[offset + length + 1] = np.column_stack([t[last], f2[last]])
+    pts[poly_offset + 2 * poly_length + 1 - k] = np.column_stack(
+        [t[idx], f2[idx]]
+    )
+
+    for r in np.flatnonzero(interpolate):
+        lo = starts[group[r]]
+        hi = starts[group[r] + 1] if group[r] + 1 < len(starts) else n
+        pts[offset[r]] = _interpolating_point(t, f1, f2, first[r], lo, hi)
+        pts[offset[r] + length[r] + 1] = _interpolating_point(
+            t, f1, f2, last[r] + 1, lo, hi
+        )
+
+    return np.split(pts, offset[1:]), group
+
+
+def _interpolating_point(
+    t: FloatArray,
+    f1: FloatArray,
+    f2: FloatArray,
+    idx: int,
+    lo: int,
+    hi: int,
+) -> tuple[float, float]:
+    """
+    Point where a region of a ribbon starts or ends
+
+    It is where f1 and f2 cross between the point at idx and the one
+    before it, limited to the group between lo and hi. This is how
+    matplotlib's `fill_between` interpolates.
+    """
+    im1 = max(idx - 1, lo)
+    sl = slice(im1, min(idx + 1, hi))
+    t_values, f1_values = t[sl], f1[sl]
+    diff_values = f1_values - f2[sl]
+    missing = ~np.isfinite(t_values) | ~np.isfinite(diff_values)
+
+    if len(diff_values) == 2:
+        if missing[1]:
+            return t[im1], f1[im1]
+        elif missing[0]:
+            return t[idx], f1[idx]
+
+    order = diff_values.argsort()
+    root_t = np.interp(0, diff_values[order], t_values[order])
+    order = t_values.argsort()
+    root_f = np.interp(root_t, t_values[order], f1_values[order])
+    return root_t, root_f
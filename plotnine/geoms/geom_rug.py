@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 
 import numpy as np
 
-from .._utils import SIZE_FACTOR, make_line_segments, to_rgba
+from .._utils import (
+    SIZE_FACTOR,
+    scalar_if_constant,
+    to_rgba_array,
+)
 from ..coords import coord_flip
 from ..doctools import document
 from .geom import geom
@@ -18,7 +22,7 @@ if TYPE_CHECKING:
 
     from plotnine.coords.coord import coord
     from plotnine.iapi import panel_view
-    from plotnine.typing import FloatArray
+    from plotnine.typing import FloatArray, FloatArrayLike, IntArray
 
 
 @document
@@ -49,6 +53,23 @@ class geom_rug(geom):
 
     draw_legend = staticmethod(geom_path.draw_legend)
 
+    def draw_panel(
+        self,
+        data: pd.DataFrame,
+        panel_params: panel_view,
+        coord: coord,
+        ax: Axes,
+    ):
+        """
+        Plot all groups
+        """
+        # The marks of all the groups are drawn by one collection, in
+        # the order they would be if drawn group by group.
+        if not data["group"].is_monotonic_increasing:
+            data = data.sort_values("group", kind="stable")
+        data = data.reset_index(drop=True)
+        self.draw_group(data, panel_params, coord, ax, self.params)
+
     @staticmethod
     def draw_group(
         data: pd.DataFrame,
@@ -74,11 +95,13 @@ def stroke_rugs(
     ax: Axes,
     params: dict[str, Any],
     sides: str,
-    length: float,
+    length: float | FloatArrayLike,
 ) -> None:
     """
     Draw rug marks in panel coordinates
 
+    The marks on all the sides are drawn as one collection.
+
     Parameters
     ----------
     data :
@@ -95,53 +118,106 @@ def stroke_rugs(
         `r`. Resolve any axis flip before calling.
     length :
         Length of each mark as a fraction of the panel width or height.
+        One value for all the marks or one for each row.
     """
     from matplotlib.collections import LineCollection
 
-    linewidth = data["size"] * SIZE_FACTOR
+    segments, rows = rug_segments(data, panel_params, sides, length)
+    if not len(segments):
+        return
+
+    color = to_rgba_array(data["color"], data["alpha"])
+    linewidth = data["size"].to_numpy() * SIZE_FACTOR
+    linetype = data["linetype"].to_numpy()
+    coll = LineCollection(
+        segments,  # pyright: ignore[reportArgumentType]
+        edgecolor=color[rows],
+        linewidth=scalar_if_constant(linewidth[rows]),
+        linestyle=scalar_if_constant(linetype[rows]),
+        zorder=params["zorder"],
+        rasterized=params["raster"],
+    )
+    ax.add_collection(coll)
 
-    has_x = "x" in data.columns
-    has_y = "y" in data.columns
 
-    if not (has_x or has_y):
-        return
+def rug_segments(
+    data: pd.DataFrame,
+    panel_params: panel_view,
+    sides: str,
+    length: float | FloatArrayLike,
+) -> tuple[FloatArray, IntArray]:
+    """
+    Compute the line segments of rug marks
 
-    n = len(data)
-    rugs = []
+    Parameters
+    ----------
+    data :
+        Rug-mark positions in panel coordinates, `x`, `y` or both.
+        A missing position has no marks.
+    panel_params :
+        Panel ranges used to determine the mark endpoints.
+    sides :
+        Panel sides to mark, using any combination of `b`, `t`, `l`, and
+        `r`.
+    length :
+        Length of each mark as a fraction of the panel width or height.
+        One value for all the marks or one for each row.
+
+    Returns
+    -------
+    segments :
+        Array of shape (n, 2, 2). The marks on the bottom, top, left
+        and right sides, in that order.
+    rows :
+        The row in `data` of each mark.
+    """
     xmin, xmax = panel_params.x.range
     ymin, ymax = panel_params.y.range
-    xheight = (xmax - xmin) * length
-    yheight = (ymax - ymin) * length
+    length = np.broadcast_to(np.asarray(length, dtype=float), len(data))
+    segments: list[FloatArray] = []
+    rows: list[IntArray] = []
 
-    if has_x:
-        x = cast("FloatArray", np.repeat(data["x"].to_numpy(), 2))
+    if "x" in data.columns:
+        x = data["x"].to_numpy(dtype=float)
+        idx = np.flatnonzero(~np.isnan(x))
+        x, height = x[idx], (ymax - ymin) * length[idx]
 
         if "b" in sides:
-            y = np.tile([ymin, ymin + yheight], n)
-            rugs.extend(make_line_segments(x, y, ispath=False))
+            segments.append(_segments(x, x, ymin, ymin + height))
+            rows.append(idx)
 
         if "t" in sides:
-            y = np.tile([ymax - yheight, ymax], n)
-            rugs.extend(make_line_segments(x, y, ispath=False))
+            segments.append(_segments(x, x, ymax - height, ymax))
+            rows.append(idx)
 
-    if has_y:
-        y = cast("FloatArray", np.repeat(data["y"].to_numpy(), 2))
+    if "y" in data.columns:
+        y = data["y"].to_numpy(dtype=float)
+        idx = np.flatnonzero(~np.isnan(y))
+        y, height = y[idx], (xmax - xmin) * length[idx]
 
         if "l" in sides:
-            x = np.tile([xmin, xmin + xheight], n)
-            rugs.extend(make_line_segments(x, y, ispath=False))
+            segments.append(_segments(xmin, xmin + height, y, y))
+            rows.append(idx)
 
         if "r" in sides:
-            x = np.tile([xmax - xheight, xmax], n)
-            rugs.extend(make_line_segments(x, y, ispath=False))
+            segments.append(_segments(xmax - height, xmax, y, y))
+            rows.append(idx)
 
-    color = to_rgba(data["color"], data["alpha"])
-    coll = LineCollection(
-        rugs,
-        edgecolor=color,
-        linewidth=linewidth,
-        linestyle=data["linetype"],
-        zorder=params["zorder"],
-        rasterized=params["raster"],
-    )
-    ax.add_collection(coll)
+    if not segments:
+        return np.zeros((0, 2, 2)), np.zeros(0, dtype=int)
+
+    return np.concatenate(segments), np.concatenate(rows)
+
+
+def _segments(
+    x1: float | FloatArray,
+    x2: float | FloatArray,
+    y1: float | FloatArray,
+    y2: float | FloatArray,
+) -> FloatArray:
+    """
+    Return an (n x 2 x 2) array of line segments (x1, y1) -> (x2, y2)
+    """
+    x = np.column_stack(np.broadcast_arrays(x1, x2))
+    y = np.column_stack(np.broadcast_arrays(y1, y2))
+    return np.stack([x, y], axis=-1)
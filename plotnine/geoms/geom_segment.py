@@ -5,7 +5,13 @@ import typing
 import numpy as np
 import pandas as pd
 
-from .._utils import SIZE_FACTOR, interleave, make_line_segments, to_rgba
+from .._utils import (
+    SIZE_FACTOR,
+    interleave,
+    make_line_segments,
+    scalar_if_constant,
+    to_rgba_array,
+)
 from ..doctools import document
 from .geom import geom
 from .geom_path import geom_path
@@ -63,8 +69,8 @@ class geom_segment(geom):
         from matplotlib.collections import LineCollection
 
         data = coord.transform(data, panel_params)
-        linewidth = data["size"] * SIZE_FACTOR
-        color = to_rgba(data["color"], data["alpha"])
+        linewidth = scalar_if_constant(data["size"]) * SIZE_FACTOR
+        color = to_rgba_array(data["color"], data["alpha"])
 
         # start point -> end point, sequence of xy points
         # from which line segments are created
@@ -72,10 +78,10 @@ class geom_segment(geom):
         y = interleave(data["y"], data["yend"])
         segments = make_line_segments(x, y, ispath=False)
         coll = LineCollection(
-            list(segments),
+            segments,  # pyright: ignore[reportArgumentType]
             edgecolor=color,
             linewidth=linewidth,
-            linestyle=data["linetype"][0],
+            linestyle=scalar_if_constant(data["linetype"]),
             capstyle=params.get("lineend"),
             zorder=params["zorder"],
             rasterized=params["raster"],
@@ -83,16 +89,18 @@ class geom_segment(geom):
         ax.add_collection(coll)
 
         if "arrow" in params and params["arrow"]:
-            adata = pd.DataFrame(index=range(len(data) * 2))
-            idx = np.arange(1, len(data) + 1)
-            adata["group"] = np.hstack([idx, idx])
-            adata["x"] = np.hstack([data["x"], data["xend"]])
-            adata["y"] = np.hstack([data["y"], data["yend"]])
-            adata["linewidth"] = np.hstack([linewidth, linewidth])
-            other = ["color", "alpha", "linetype"]
-            for param in other:
-                adata[param] = np.hstack([data[param], data[param]])
-
+            # Each segment is a path of two points, the start & end
+            adata = pd.DataFrame(
+                {
+                    "group": np.repeat(np.arange(len(data)), 2),
+                    "x": x,
+                    "y": y,
+                    "linewidth": np.repeat(data["size"] * SIZE_FACTOR, 2),
+                    "color": np.repeat(data["color"].to_numpy(), 2),
+                    "alpha": np.repeat(data["alpha"].to_numpy(), 2),
+                    "linetype": np.repeat(data["linetype"].to_numpy(), 2),
+                }
+            )
             params["arrow"].draw(
                 adata, panel_params, coord, ax, params, constant=False
             )
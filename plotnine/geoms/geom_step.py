@@ -5,11 +5,9 @@ import typing
 import numpy as np
 import pandas as pd
 
-from .._utils import copy_missing_columns
 from ..doctools import document
 from ..exceptions import PlotnineError
-from .geom import geom
-from .geom_path import geom_path
+from .geom_path import _group_bounds, geom_path
 
 if typing.TYPE_CHECKING:
     from typing import Any
@@ -42,7 +40,19 @@ class geom_step(geom_path):
 
     DEFAULT_PARAMS = {"direction": "hv"}
 
-    draw_panel = geom.draw_panel
+    def draw_panel(
+        self,
+        data: pd.DataFrame,
+        panel_params: panel_view,
+        coord: coord,
+        ax: Axes,
+    ):
+        """
+        Plot all groups
+
+        The steps of all the groups are created at once.
+        """
+        self.draw_group(data, panel_params, coord, ax, self.params)
 
     @staticmethod
     def draw_group(
@@ -53,31 +63,49 @@ class geom_step(geom_path):
         params: dict[str, Any],
     ):
         direction = params["direction"]
-        n = len(data)
-        data = data.sort_values("x", kind="mergesort")
+        data = data.sort_values(["group", "x"], kind="mergesort")
         x = data["x"].to_numpy()
         y = data["y"].to_numpy()
+        starts, ends = _group_bounds(data["group"].to_numpy())
 
+        # Each point is used twice, and the first or last use of
+        # each group is dropped when stepping through the points.
+        # The paths of all the groups are created together.
+        n = len(data)
+        idx = np.repeat(range(n), 2)
+        first_use = 2 * starts
+        last_use = 2 * ends - 1
         if direction == "vh":
             # create stepped path -- interleave x with
             # itself and y with itself
-            xidx = np.repeat(range(n), 2)[:-1]
-            yidx = np.repeat(range(n), 2)[1:]
+            xidx = np.delete(idx, last_use)
+            yidx = np.delete(idx, first_use)
             new_x, new_y = x[xidx], y[yidx]
         elif direction == "hv":
-            xidx = np.repeat(range(n), 2)[1:]
-            yidx = np.repeat(range(n), 2)[:-1]
+            xidx = np.delete(idx, first_use)
+            yidx = np.delete(idx, last_use)
             new_x, new_y = x[xidx], y[yidx]
         elif direction == "mid":
-            xidx = np.repeat(range(n - 1), 2)
-            yidx = np.repeat(range(n), 2)
-            diff = x[1::] - x[:-1:]
-            mid_x = x[:-1:] + diff / 2
-            new_x = np.hstack([x[0], mid_x[xidx], x[-1]])
+            xidx = yidx = idx
+            # Within a group, the x values are halfway between the
+            # adjacent points except at the ends
+            mid_x = x[:-1] + (x[1:] - x[:-1]) / 2
+            new_x = np.empty(2 * n)
+            new_x[1:-1:2] = mid_x
+            new_x[2::2] = mid_x
+            new_x[first_use] = x[starts]
+            new_x[last_use] = x[ends - 1]
             new_y = y[yidx]
         else:
             raise PlotnineError(f"Invalid direction `{direction}`")
 
+        # The other aesthetics are those of the first point in the
+        # group
+        group_starts = np.repeat(starts, ends - starts)
+        src = group_starts[xidx]
         path_data = pd.DataFrame({"x": new_x, "y": new_y})
-        copy_missing_columns(path_data, data)
+        for col in data.columns.difference(path_data.columns):
+            path_data[col] = data[col].to_numpy()[src]
+
+        params = params | {"constant": True}
         geom_path.draw_group(path_data, panel_params, coord, ax, params)
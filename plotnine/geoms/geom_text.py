@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from contextlib import suppress
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 from warnings import warn
 
 import numpy as np
@@ -68,6 +68,12 @@ class geom_text(geom):
         See
         [](https://matplotlib.org/tutorials/advanced/patheffects_guide.html)
         documentation for more details.
+    check_overlap : bool, default=False
+        If `True`{.py}, text that overlaps earlier text (in the order
+        of the data) in the same layer and panel is not plotted.
+        This has no effect when `adjust_text` is used. Each distinct
+        label is measured, so with many distinct labels the check
+        takes about as long as drawing them all.
 
     See Also
     --------
@@ -150,6 +156,7 @@ class geom_text(geom):
         "adjust_text": None,
         "format_string": None,
         "path_effects": None,
+        "check_overlap": False,
     }
 
     def __init__(
@@ -212,7 +219,17 @@ class geom_text(geom):
         coord: coord,
         ax: Axes,
     ):
-        super().draw_panel(data, panel_params, coord, ax)
+        # adjust_text works with the text artists of each group
+        if self.params["adjust_text"] is not None:
+            super().draw_panel(data, panel_params, coord, ax)
+            return
+
+        # All the texts in the panel are drawn by one artist. They
+        # are ordered as they would be if drawn group by group.
+        if not data["group"].is_monotonic_increasing:
+            data = data.sort_values("group", kind="stable")
+        data = data.reset_index(drop=True)
+        self.draw_group(data, panel_params, coord, ax, self.params)
 
     @staticmethod
     def draw_group(
@@ -222,38 +239,33 @@ class geom_text(geom):
         ax: Axes,
         params: dict[str, Any],
     ):
+        from .._mpl.text import TextCollection
+
         data = coord.transform(data, panel_params)
         zorder = params["zorder"]
 
         # Bind color and alpha
         color = to_rgba(data["color"], data["alpha"])
 
-        # Create a dataframe for the plotting data required
-        # by ax.text
-        ae_names = list(set(geom_text.DEFAULT_AES) | geom_text.REQUIRED_AES)
-        plot_data = data[ae_names]
-        plot_data.rename(
-            {
-                "label": "s",
-                "angle": "rotation",
-                "lineheight": "linespacing",
-            },
-            axis=1,
-            inplace=True,
-        )
-        plot_data["color"] = color  # pyright: ignore[reportCallIssue,reportArgumentType]
-        plot_data["zorder"] = zorder
-        plot_data["rasterized"] = params["raster"]
-        plot_data["clip_on"] = True
+        # The properties of the texts, named as the matplotlib
+        # Text properties
+        props: dict[str, Any] = {
+            "color": color,
+            "fontsize": data["size"].tolist(),
+            "rotation": data["angle"].tolist(),
+            "linespacing": data["lineheight"].tolist(),
+            "horizontalalignment": data["ha"].tolist(),
+            "verticalalignment": data["va"].tolist(),
+            "family": data["family"].tolist(),
+            "fontweight": data["fontweight"].tolist(),
+            "fontstyle": data["fontstyle"].tolist(),
+            "fontvariant": data["fontvariant"].tolist(),
+        }
 
         # 'boxstyle' indicates geom_label so we need an MPL bbox
         draw_label = "boxstyle" in params
         if draw_label:
-            fill = to_rgba(data.pop("fill"), data["alpha"])
-            if isinstance(fill, tuple):
-                fill = [list(fill)] * len(data["x"])
-            plot_data["facecolor"] = fill  # pyright: ignore[reportCallIssue,reportArgumentType]
-
+            fill = to_rgba(data["fill"], data["alpha"])
             tokens = [params["boxstyle"], f"pad={params['label_padding']}"]
             if params["boxstyle"] in {"round", "round4"}:
                 tokens.append(f"rounding_size={params['label_r']}")
@@ -262,39 +274,69 @@ class geom_text(geom):
 
             boxstyle = ",".join(tokens)
             bbox = {"linewidth": params["label_size"], "boxstyle": boxstyle}
+            bbox_props = {
+                "edgecolor": params["boxcolor"] or color,
+                "facecolor": fill,
+            }
         else:
-            bbox = {}
-
-        texts: Sequence[Text] = []
-
-        # For labels add a bbox
+            bbox, bbox_props = None, None
+
+        if params["adjust_text"] is None:
+            collection = TextCollection(
+                data["x"],
+                data["y"],
+                data["label"],
+                props,
+                bbox=bbox,
+                bbox_props=bbox_props,
+                path_effects=params["path_effects"],
+                check_overlap=params["check_overlap"],
+            )
+            collection.set_zorder(zorder)
+            collection.set_rasterized(params["raster"])
+            collection.set_transform(ax.transData)
+            ax.add_artist(collection)
+            return
+
+        # adjust_text moves the texts around so each must be an artist
+        texts: list[Text] = []
         for i in range(len(data)):
-            kw = cast("dict[str, Any]", plot_data.iloc[i].to_dict())
-            if draw_label:
-                kw["bbox"] = bbox
-                kw["bbox"]["edgecolor"] = params["boxcolor"] or kw["color"]
-                kw["bbox"]["facecolor"] = kw.pop("facecolor")
-            text_elem = ax.text(**kw)
+            kw = {
+                name: value[i] if isinstance(value, list) else value
+                for name, value in props.items()
+            }
+            if bbox is not None and bbox_props is not None:
+                kw["bbox"] = bbox | {
+                    name: value[i] if isinstance(value, list) else value
+                    for name, value in bbox_props.items()
+                }
+            text_elem = ax.text(
+                data["x"].iloc[i],
+                data["y"].iloc[i],
+                data["label"].iloc[i],
+                zorder=zorder,
+                rasterized=params["raster"],
+                clip_on=True,
+                **kw,
+            )
             texts.append(text_elem)
             if params["path_effects"]:
                 text_elem.set_path_effects(params["path_effects"])
 
-        # TODO: Do adjust text per panel
-        if params["adjust_text"] is not None:
-            if zorder == 1:
-                warn(
-                    "For better results with adjust_text, it should "
-                    "not be the first layer or the only layer.",
-                    PlotnineWarning,
-                )
-            do_adjust_text(
-                texts,
-                ax,
-                params["adjust_text"],
-                color[0],
-                float(data["size"].mean()),
-                zorder,
+        if zorder == 1:
+            warn(
+                "For better results with adjust_text, it should "
+                "not be the first layer or the only layer.",
+                PlotnineWarning,
             )
+        do_adjust_text(
+            texts,
+            ax,
+            params["adjust_text"],
+            color[0],
+            float(data["size"].mean()),
+            zorder,
+        )
 
     @staticmethod
     def draw_legend(
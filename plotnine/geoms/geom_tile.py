@@ -2,12 +2,21 @@ from __future__ import annotations
 
 import typing
 
-from .._utils import resolution
+import numpy as np
+
+from .._utils import SIZE_FACTOR, resolution, to_rgba_array
 from ..doctools import document
-from .geom_rect import geom_rect
+from .geom_rect import fill_rects, geom_rect
 
 if typing.TYPE_CHECKING:
+    from typing import Any
+
     import pandas as pd
+    from matplotlib.axes import Axes
+
+    from plotnine.coords.coord import coord
+    from plotnine.iapi import panel_view
+    from plotnine.typing import FloatArray, IntArray
 
 
 @document
@@ -21,6 +30,12 @@ class geom_tile(geom_rect):
     ----------
     {common_parameters}
 
+    Notes
+    -----
+    When the tiles make up a complete regular grid, e.g. a heatmap,
+    and they all have the same outline, they are drawn as a single
+    matplotlib `QuadMesh`.
+
     See Also
     --------
     plotnine.geom_rect
@@ -59,3 +74,109 @@ class geom_tile(geom_rect):
         data["ymin"] = data["y"] - height / 2
         data["ymax"] = data["y"] + height / 2
         return data
+
+    @staticmethod
+    def draw_group(
+        data: pd.DataFrame,
+        panel_params: panel_view,
+        coord: coord,
+        ax: Axes,
+        params: dict[str, Any],
+    ):
+        data = coord.transform(data, panel_params, munch=True)
+        # A mesh has one outline style for all the cells
+        size = data["size"].to_numpy()
+        linetype = data["linetype"].to_numpy()
+        grid = None
+        if (size == size[:1]).all() and (linetype == linetype[:1]).all():
+            grid = _regular_grid(data)
+
+        if grid is None:
+            fill_rects(data, ax, params)
+            return
+
+        from matplotlib.collections import QuadMesh
+
+        coordinates, order = grid
+        data = data.take(order)
+        color = data["color"]
+        if all(color.isna()):
+            color = "none"
+
+        # Like the rectangles, the outlines are antialiased. Without
+        # outlines, antialiasing would leave seams between the cells.
+        linewidth = data["size"].iloc[0] * SIZE_FACTOR
+        has_edges = not isinstance(color, str) and linewidth > 0
+        mesh = QuadMesh(
+            coordinates,
+            facecolors=to_rgba_array(data["fill"], data["alpha"]),
+            edgecolors=color,
+            linestyles=data["linetype"].iloc[0],
+            linewidths=linewidth,
+            antialiased=has_edges,
+            zorder=params["zorder"],
+            rasterized=params["raster"],
+        )
+        ax.add_collection(mesh)
+
+
+def _regular_grid(data: pd.DataFrame) -> tuple[FloatArray, IntArray] | None:
+    """
+    Lay out the tiles as a mesh if they make up a complete grid
+
+    Parameters
+    ----------
+    data :
+        Tiles with panel-coordinate `xmin`, `xmax`, `ymin`, and
+        `ymax` bounds.
+
+    Returns
+    -------
+    out :
+        The (ny+1, nx+1, 2) coordinates of the mesh and the order in
+        which to take the rows of the data to fill the mesh cells.
+        `None` if the tiles are not a complete grid of adjacent and
+        non-overlapping cells.
+    """
+    n = len(data)
+    if not n:
+        return None
+
+    def edges(lo: FloatArray, hi: FloatArray) -> tuple[FloatArray, IntArray]:
+        """
+        The edges along one axis & the column/row of each tile
+        """
+        left = np.unique(lo)
+        idx = np.searchsorted(left, lo)
+        right = np.empty(len(left))
+        right[idx] = hi
+        # Every cell in a column/row must have the same extent and
+        # abut the next one. The tolerance is relative to the size of
+        # the cells, whatever the scale of the data.
+        atol = 1e-6 * np.min(hi - lo)
+        if not (
+            np.allclose(right[idx], hi, rtol=0, atol=atol)
+            and np.allclose(right[:-1], left[1:], rtol=0, atol=atol)
+        ):
+            raise ValueError("Not a grid")
+        return np.append(left, right[-1]), idx
+
+    bounds = data[["xmin", "xmax", "ymin", "ymax"]].to_numpy(dtype=float)
+    if not np.isfinite(bounds).all():
+        return None
+
+    try:
+        xs, i = edges(bounds[:, 0], bounds[:, 1])
+        ys, j = edges(bounds[:, 2], bounds[:, 3])
+    except ValueError:
+        return None
+
+    nx, ny = len(xs) - 1, len(ys) - 1
+    cells = j * nx + i
+    if nx * ny != n or len(np.unique(cells)) != n:
+        return None
+
+    order = np.empty(n, dtype=int)
+    order[cells] = np.arange(n)
+    coordinates = np.stack(np.meshgrid(xs, ys), axis=-1)
+    return coordinates, order
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
 
-from .._utils import groupby_apply, interleave, resolution
+from .._utils import (
+    SIZE_FACTOR,
+    interleave,
+    resolution,
+    scalar_if_constant,
+    to_rgba_array,
+)
 from ..doctools import document
 from .geom import geom
-from .geom_path import geom_path
+from .geom_path import _group_bounds
 from .geom_polygon import geom_polygon
 
 if TYPE_CHECKING:
@@ -109,15 +115,16 @@ class geom_violin(geom):
             else:
                 data["width"] = resolution(data["x"], False) * 0.9
 
-        def func(df: pd.DataFrame) -> pd.DataFrame:
-            df["ymin"] = df["y"].min()
-            df["ymax"] = df["y"].max()
-            df["xmin"] = df["x"] - df["width"] / 2
-            df["xmax"] = df["x"] + df["width"] / 2
-            return df
-
-        # This is a plyr::ddply
-        data = groupby_apply(data, ["group", "PANEL"], func)
+        # The bounds of each violin, with the rows in the order
+        # of a plyr::ddply by group and panel
+        data = data.sort_values(
+            ["group", "PANEL"], kind="mergesort", ignore_index=True
+        )
+        y = data.groupby(["group", "PANEL"], observed=True)["y"]
+        data["ymin"] = y.transform("min")
+        data["ymax"] = y.transform("max")
+        data["xmin"] = data["x"] - data["width"] / 2
+        data["xmax"] = data["x"] + data["width"] / 2
         return data
 
     def draw_panel(
@@ -127,122 +134,196 @@ class geom_violin(geom):
         coord: coord,
         ax: Axes,
     ):
-        params = self.params.copy()
-        quantiles = params.pop("draw_quantiles")
-        style = params.pop("style")
-        zorder = params.pop("zorder")
-
-        for i, (group, df) in enumerate(data.groupby("group")):
-            # Place the violins with the smalleer group number on top
-            # of those with larger numbers. The group_zorder values should be
-            # in the range [zorder, zorder + 1) to stay within the layer.
-            group = cast("int", group)
-            group_zorder = zorder + 0.9 / group
-            params["zorder"] = group_zorder
-
-            # Find the points for the line to go all the way around
-            df["xminv"] = df["x"] - df["violinwidth"] * (df["x"] - df["xmin"])
-            df["xmaxv"] = df["x"] + df["violinwidth"] * (df["xmax"] - df["x"])
-            even = i % 2 == 0
-            if (
-                style == "left"
-                or (style == "left-right" and even)
-                or (style == "right-left" and not even)
-            ):
-                df["xmaxv"] = df["x"]
-            elif (
-                style == "right"
-                or (style == "right-left" and even)
-                or (style == "left-right" and not even)
-            ):
-                df["xminv"] = df["x"]
-
-            # Make sure it's sorted properly to draw the outline
-            # i.e violin = kde + mirror kde,
-            # bottom to top then top to bottom
-            n = len(df)
-            polygon_df = pd.concat(
-                [df.sort_values("y"), df.sort_values("y", ascending=False)],
-                axis=0,
-                ignore_index=True,
+        from matplotlib.collections import PathCollection
+        from matplotlib.path import Path
+
+        from plotnine.mapping._atomic import broadcast_ae_value
+
+        if data.empty:
+            return
+
+        params = self.params
+        quantiles = params["draw_quantiles"]
+        style = params["style"]
+
+        # Bottom to top within each violin
+        data = data.sort_values(["group", "y"], kind="mergesort")
+        data.reset_index(drop=True, inplace=True)
+        starts, ends = _group_bounds(data["group"].to_numpy())
+        ngroups = len(starts)
+        sizes = ends - starts
+
+        # Find the points for the line to go all the way around
+        x = data["x"].to_numpy()
+        vw = data["violinwidth"].to_numpy()
+        xminv = x - vw * (x - data["xmin"].to_numpy())
+        xmaxv = x + vw * (data["xmax"].to_numpy() - x)
+        even = np.repeat(np.arange(ngroups) % 2 == 0, sizes)
+        left = (
+            (style == "left")
+            | ((style == "left-right") & even)
+            | ((style == "right-left") & ~even)
+        )
+        right = (
+            (style == "right")
+            | ((style == "right-left") & even)
+            | ((style == "left-right") & ~even)
+        )
+        xmaxv = np.where(left, x, xmaxv)
+        xminv = np.where(right, x, xminv)
+
+        # The outline of a violin, i.e. kde + mirror kde, goes up the
+        # left side, down the right side & back to the start
+        npoints = 2 * sizes + 1
+        n = np.repeat(sizes, npoints)
+        k = np.arange(len(n)) - np.repeat(
+            np.cumsum(npoints) - npoints, npoints
+        )
+        row = np.repeat(starts, npoints) + np.select(
+            [k < n, k < 2 * n], [k, 2 * n - 1 - k], 0
+        )
+        on_left = (k < n) | (k == 2 * n)
+
+        # Each outline & each quantile segment is a path, numbered by
+        # the group column
+        paths = pd.DataFrame(
+            {
+                "x": np.where(on_left, xminv[row], xmaxv[row]),
+                "y": data["y"].to_numpy()[row],
+                "group": np.repeat(np.arange(ngroups), npoints),
+            }
+        )
+
+        first = data.take(starts)
+        linewidth = first["size"].to_numpy() * SIZE_FACTOR
+        facecolor = to_rgba_array(first["fill"], first["alpha"])
+        edgecolor = to_rgba_array([c or "none" for c in first["color"]], 1)
+        linetype = list(first["linetype"])
+        closed = np.ones(ngroups, dtype=bool)
+
+        if quantiles is not None:
+            # Each quantile is a segment across its violin, and has
+            # the aesthetics of the violin unless they are set.
+            segments = make_quantile_df(data, xminv, xmaxv, quantiles)
+            segments["group"] += ngroups
+            paths = pd.concat([paths, segments], ignore_index=True)
+
+            idx = np.repeat(np.arange(ngroups), len(quantiles))
+            nq = len(idx)
+            qcolor = first["color"].to_numpy()[idx]
+            if color := params["quantile_colour"] or params["quantile_color"]:
+                qcolor = broadcast_ae_value(color, "color", nq)
+            qlinetype = list(first["linetype"].to_numpy()[idx])
+            if lt := params["quantile_linetype"]:
+                qlinetype = list(broadcast_ae_value(lt, "linetype", nq))
+            qsize = params["quantile_size"] or first["size"].to_numpy()[idx]
+
+            linewidth = np.hstack(
+                [linewidth, np.broadcast_to(qsize, nq) * SIZE_FACTOR]
             )
-
-            _df = polygon_df.iloc
-            _loc = polygon_df.columns.get_loc
-            _df[:n, _loc("x")] = _df[:n, _loc("xminv")]  # type: ignore
-            _df[n:, _loc("x")] = _df[n:, _loc("xmaxv")]  # type: ignore
-
-            # Close the polygon: set first and last point the same
-            polygon_df.loc[-1, :] = polygon_df.loc[0, :]
-
-            # plot violin polygon
-            geom_polygon.draw_group(
-                polygon_df,
-                panel_params,
-                coord,
-                ax,
-                params,
+            facecolor = np.vstack([facecolor, np.zeros((nq, 4))])
+            edgecolor = np.vstack(
+                [
+                    edgecolor,
+                    to_rgba_array(qcolor, first["alpha"].to_numpy()[idx]),
+                ]
             )
-
-            if quantiles is not None:
-                from plotnine.mapping._atomic import broadcast_ae_value
-
-                # Get dataframe with quantile segments and that
-                # with aesthetics then put them together
-                # Each quantile segment is defined by 2 points and
-                # they all get similar aesthetics
-                aes_df = df.drop(["x", "y", "group"], axis=1)
-                aes_df.reset_index(inplace=True)
-                idx = [0] * 2 * len(quantiles)
-                aes_df = aes_df.iloc[idx, :].reset_index(drop=True)
-                segment_df = pd.concat(
-                    [make_quantile_df(df, quantiles), aes_df], axis=1
-                )
-
-                color = params["quantile_colour"] or params["quantile_color"]
-                n = len(segment_df)
-                if color:
-                    segment_df["color"] = broadcast_ae_value(color, "color", n)
-                if linetype := params["quantile_linetype"]:
-                    segment_df["linetype"] = broadcast_ae_value(
-                        linetype,
-                        "linetype",
-                        n,
-                    )
-                if size := params["quantile_size"]:
-                    segment_df["size"] = size
-
-                # plot quantile segments
-                geom_path.draw_group(
-                    segment_df,
-                    panel_params,
-                    coord,
-                    ax,
-                    params,
-                )
+            linetype += qlinetype
+            closed = np.hstack([closed, np.zeros(nq, dtype=bool)])
+
+        # The violins with the smaller group numbers are on top of
+        # those with larger numbers, and the quantiles of a violin
+        # are on top of it (and under the violins above it). The paths
+        # are drawn in that order.
+        order = np.arange(ngroups)[::-1]
+        if quantiles is not None:
+            qpaths = ngroups + np.arange(nq).reshape(ngroups, -1)
+            order = np.column_stack([order, qpaths[::-1]]).ravel()
+
+        paths = coord.transform(paths, panel_params, munch=True)
+        pstarts, pends = _group_bounds(paths["group"].to_numpy())
+        xy = paths[["x", "y"]].to_numpy()
+        mpl_paths = [
+            Path(np.vstack([xy[i:j], xy[i : i + 1]]), closed=True)
+            if c
+            else Path(xy[i:j])
+            for i, j, c in zip(pstarts, pends, closed)
+        ]
+
+        coll = PathCollection(
+            [mpl_paths[i] for i in order],
+            facecolors=facecolor[order],
+            edgecolors=edgecolor[order],
+            linewidths=scalar_if_constant(linewidth[order]),
+            linestyles=scalar_if_constant([linetype[i] for i in order]),
+            capstyle="butt",
+            zorder=params["zorder"],
+            rasterized=params["raster"],
+        )
+        ax.add_collection(coll)
 
 
 def make_quantile_df(
-    data: pd.DataFrame, draw_quantiles: FloatArray
+    data: pd.DataFrame,
+    xminv: FloatArray,
+    xmaxv: FloatArray,
+    draw_quantiles: FloatArray,
 ) -> pd.DataFrame:
     """
     Return a dataframe with info needed to draw quantile segments
-    """
-    from scipy.interpolate import interp1d
 
-    dens = data["density"].cumsum() / data["density"].sum()
-    ecdf = interp1d(dens, data["y"], assume_sorted=True)
-    ys = ecdf(draw_quantiles)
+    Parameters
+    ----------
+    data :
+        Violin data, ordered by group and then by y.
+    xminv, xmaxv :
+        The left and right bounds of the violins at each row.
+    draw_quantiles :
+        Quantiles to draw in each violin.
+
+    Returns
+    -------
+    out :
+        The segments, two rows for each quantile in each violin.
+        The `group` column numbers the segments from 0.
+    """
+    group = data["group"].to_numpy()
+    starts, ends = _group_bounds(group)
+    code = np.repeat(np.arange(len(starts)), ends - starts)
+
+    # The cumulative density of each violin, in the same array with
+    # those of the other violins. Offset by the violin number, the
+    # values of all the violins are in ascending order.
+    density = data.groupby("group", sort=False)["density"]
+    cdf = (density.cumsum() / density.transform("sum")).to_numpy()
+
+    q = np.tile(draw_quantiles, len(starts))
+    qcode = np.repeat(np.arange(len(starts)), len(draw_quantiles))
+    lo_bound, hi_bound = starts[qcode], ends[qcode] - 1
+    hi = np.searchsorted(code + cdf, qcode + q)
+    hi = np.clip(hi, lo_bound + 1, hi_bound)
+    lo = np.clip(hi - 1, lo_bound, hi_bound)
+
+    # The position of the quantiles between the two points
+    # on either side of them
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (q - cdf[lo]) / (cdf[hi] - cdf[lo])
+    t = np.clip(np.nan_to_num(t), 0, 1)
+
+    def _interp(v: FloatArray) -> FloatArray:
+        return v[lo] + t * (v[hi] - v[lo])
+
+    ys = _interp(data["y"].to_numpy())
 
     # Get the violin bounds for the requested quantiles
-    violin_xminvs = interp1d(data["y"], data["xminv"])(ys)
-    violin_xmaxvs = interp1d(data["y"], data["xmaxv"])(ys)
+    violin_xminvs = _interp(xminv)
+    violin_xmaxvs = _interp(xmaxv)
 
     data = pd.DataFrame(
         {
             "x": interleave(violin_xminvs, violin_xmaxvs),
             "y": np.repeat(ys, 2),
-            "group": np.repeat(np.arange(1, len(ys) + 1), 2),
+            "group": np.repeat(np.arange(len(ys)), 2),
         }
     )
 
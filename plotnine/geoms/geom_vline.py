@@ -86,11 +86,9 @@ class geom_vline(geom):
         data["yend"] = ranges.y[1]
         data = data.drop_duplicates()
 
-        for _, gdata in data.groupby("group"):
-            gdata.reset_index(inplace=True)
-            geom_segment.draw_group(
-                gdata, panel_params, coord, ax, self.params
-            )
+        # All the lines of the panel are one collection
+        data = data.sort_values("group", kind="mergesort", ignore_index=True)
+        geom_segment.draw_group(data, panel_params, coord, ax, self.params)
 
     @staticmethod
     def draw_legend(
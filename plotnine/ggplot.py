@@ -161,6 +161,9 @@ class ggplot:
         self.watermarks: list[watermark] = []
         self._insets: Insets = Insets()
 
+        # Rasterize heavy layers, if None it is from the options
+        self._raster_threshold: Optional[int] = None
+
         # build artefacts
         self._build_objs = NS(meta={})
 
@@ -487,6 +490,7 @@ class ggplot:
 
         # Apply position adjustments
         layers.compute_position(layout)
+        self._build_objs.meta["panel_timings"] = layout.timings
 
         # Reset position scales, then re-train and map.  This
         # ensures that facets have control over the range of
@@ -546,7 +550,13 @@ class ggplot:
         Draw the main plot(s) onto the axes.
         """
         # Draw the geoms
-        self.layers.draw(self.layout, self.coordinates)
+        threshold = self._raster_threshold
+        if threshold is None:
+            threshold = get_option("raster_threshold")
+
+        self._build_objs.meta["layer_rasters"] = self.layers.draw(
+            self.layout, self.coordinates, threshold
+        )
         self.coordinates.draw(self.axs)
 
     def _draw_breaks_and_labels(self):
@@ -670,6 +680,7 @@ class ggplot:
         dpi: Optional[float] = None,
         limitsize: bool | None = None,
         verbose: bool = True,
+        raster_threshold: Optional[int] = None,
         **kwargs: Any,
     ) -> mpl_save_view:
         """
@@ -733,6 +744,7 @@ class ggplot:
             self.theme = self.theme + theme(dpi=dpi)
 
         self._build_objs.meta["figure_format"] = format
+        self._raster_threshold = raster_threshold
         figure = self.draw(show=False)
         return mpl_save_view(figure, fig_kwargs)
 
@@ -747,6 +759,7 @@ class ggplot:
         dpi: Optional[int] = None,
         limitsize: bool | None = None,
         verbose: bool = True,
+        raster_threshold: Optional[int] = None,
         **kwargs: Any,
     ):
         """
@@ -782,6 +795,11 @@ class ggplot:
             is from the option `plotine.options.limitsize`.
         verbose :
             If `True`, print the saving information.
+        raster_threshold :
+            Layers that draw more than this number of vertices &
+            markers are rasterized, the rest of the plot remains
+            vector graphics. The default value is from the option
+            `plotnine.options.raster_threshold`.
         kwargs :
             Additional arguments to pass to matplotlib `savefig()`.
         """
@@ -795,6 +813,7 @@ class ggplot:
             dpi=dpi,
             limitsize=limitsize,
             verbose=verbose,
+            raster_threshold=raster_threshold,
             **kwargs,
         )
 
@@ -818,7 +837,9 @@ class ggplot:
         """
         p = deepcopy(self)
         p._build()
-        return p.layers.data[i]
+        # The constant aesthetics are columns like all the others
+        l = p.layers[i]
+        return l.data.assign(**l.geom.params.get("constant_aes", {}))
 
 
 ggsave = ggplot.save
@@ -189,6 +189,34 @@ class radial_panel_view(panel_view):
     r: scale_position_view
 
 
+@dataclass
+class panel_timing:
+    """
+    Time taken to compute a panel of a layer
+    """
+
+    stage: Literal["stat", "position"]
+    # Name of the stat or position
+    name: str
+    panel: int
+    seconds: float
+
+
+@dataclass
+class layer_raster:
+    """
+    Whether the artists of a layer were rasterized
+    """
+
+    # Position of the layer in the plot, starting at 0
+    layer: int
+    # Name of the geom
+    geom: str
+    # Number of vertices & markers drawn by the layer
+    size: int
+    rasterized: bool
+
+
 @dataclass
 class pos_scales:
     """
@@ -14,12 +14,13 @@ from .mapping.aes import NO_GROUP, aes, make_labels
 from .mapping.evaluation import evaluate, stage
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Sequence, SupportsIndex
+    from typing import Any, Optional, Sequence, SupportsIndex
 
     from plotnine import ggplot
     from plotnine.coords.coord import coord
     from plotnine.facets.layout import Layout
     from plotnine.geoms.geom import geom
+    from plotnine.iapi import layer_raster
     from plotnine.layer import layer
     from plotnine.mapping import Environment
     from plotnine.positions.position import position
@@ -335,6 +336,8 @@ class layer:
         if not len(data):
             return
 
+        self.stat.panel_pixels = layout.panel_pixels()
+        self.stat.coord = layout.coord
         self.stat.setup_params(data)
         data = self.stat.use_defaults(data)
         data = self.stat.setup_data(data)
@@ -442,7 +445,16 @@ class layer:
             the data.
         """
         old_columns = data.columns
-        data = self.geom.use_defaults(data, aes_modifiers)
+        if scales is None or not self.geom.SCALAR_CONSTANT_AES:
+            data = self.geom.use_defaults(data, aes_modifiers)
+        else:
+            constant_aes: dict[str, Any] = {}
+            data = self.geom.use_defaults(data, aes_modifiers, constant_aes)
+            if constant_aes:
+                _constants = scales.transform_df(pd.DataFrame([constant_aes]))
+                constant_aes = _constants.iloc[0].to_dict()
+            self.geom.params["constant_aes"] = constant_aes
+
         if scales is not None:
             # The default aesthetics and the aesthetic parameters are
             # specified in userspace. When we add them we have to
@@ -524,9 +536,63 @@ class Layers(List[layer]):
         for l in self:
             l.setup_data()
 
-    def draw(self, layout: Layout, coord: coord):
-        for l in self:
+    def draw(
+        self,
+        layout: Layout,
+        coord: coord,
+        raster_threshold: Optional[int] = None,
+    ) -> list[layer_raster]:
+        """
+        Draw the layers
+
+        Parameters
+        ----------
+        layout :
+            Layout object created when the plot is getting built
+        coord :
+            Type of coordinate axes
+        raster_threshold :
+            Size (number of vertices & markers) above which a layer
+            is rasterized. If `None`, no layer is rasterized
+            automatically.
+
+        Returns
+        -------
+        :
+            The size of each layer and whether it was rasterized.
+            It is empty if there is no `raster_threshold`.
+        """
+        from matplotlib.text import Text
+
+        from ._mpl.utils import artist_size
+        from .iapi import layer_raster
+
+        if raster_threshold is None:
+            for l in self:
+                l.draw(layout, coord)
+            return []
+
+        decisions = []
+        for i, l in enumerate(self):
+            before = {id(a) for ax in layout.axs for a in ax.get_children()}
             l.draw(layout, coord)
+            artists = [
+                a
+                for ax in layout.axs
+                for a in ax.get_children()
+                if id(a) not in before and not isinstance(a, Text)
+            ]
+            size = sum(artist_size(a) for a in artists)
+            rasterize = size > raster_threshold
+            if rasterize and not l.raster:
+                for a in artists:
+                    a.set_rasterized(True)
+            decisions.append(
+                layer_raster(
+                    i, l.geom.__class__.__name__, size, rasterize or l.raster
+                )
+            )
+        return decisions
 
     def compute_aesthetics(self, plot: ggplot):
         for l in self:
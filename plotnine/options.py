@@ -65,6 +65,30 @@ be drawn or saved. This is to  prevent the common error of specifying
 dimensions in pixels.
 """
 
+n_jobs: Optional[int] = 1
+"""
+Number of workers used to compute the statistics and the positions
+of the panels of a layer.
+
+The default, `1`, computes the panels one after the other. If `None`
+or negative, the number of CPUs is used. Each stat and position
+declares how its panels can be computed in parallel, with threads or
+with processes, and some (e.g. those that draw random numbers) are
+always computed one panel after the other. The results do not depend
+on the number of workers.
+"""
+
+raster_threshold: Optional[int] = None
+"""
+Size at which layers are rasterized when the plot is drawn
+
+A layer that draws more than this number of vertices & markers
+(e.g. a scatter plot with that many points) is drawn as a raster
+(bitmap) image, while the axes, text and guides remain vector
+graphics. This keeps vector output (pdf, svg) small and fast to
+render. The default, `None`, leaves the layers as they are.
+"""
+
 
 def get_option(name: str) -> Any:
     """
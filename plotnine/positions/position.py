@@ -6,20 +6,21 @@ from copy import copy
 from warnings import warn
 
 import numpy as np
+import pandas as pd
 
-from .._utils import check_required_aesthetics, groupby_apply
+from .._utils import check_required_aesthetics
+from .._utils.parallel import apply_panels
 from .._utils.registry import Register
 from ..exceptions import PlotnineError, PlotnineWarning
+from ..iapi import panel_timing
 from ..mapping.aes import X_AESTHETICS, Y_AESTHETICS
 
 if typing.TYPE_CHECKING:
     from typing import Any, Optional
 
-    import pandas as pd
-
     from plotnine.facets.layout import Layout
     from plotnine.iapi import pos_scales
-    from plotnine.typing import TransformCol
+    from plotnine.typing import ParallelBackend, TransformCol
 
 
 class position(ABC, metaclass=Register):
@@ -29,6 +30,14 @@ class position(ABC, metaclass=Register):
     """
     Aesthetics required for the positioning
     """
+
+    PARALLEL: ParallelBackend | None = None
+    """
+    How to compute the panels in parallel
+
+    If `None`, the panels are always computed one after the other.
+    See [](`~plotnine.stats.stat.stat.PARALLEL`).
+    """
     params: dict[str, Any]
 
     def __init__(self):
@@ -63,19 +72,27 @@ class position(ABC, metaclass=Register):
         independent of the panel. i.e when not colliding
         """
 
-        def fn(pdata: pd.DataFrame) -> pd.DataFrame:
-            """
-            Compute function helper
-            """
-            # Given data belonging to a specific panel, grab
-            # the corresponding scales and call the method
-            # that does the real computation
-            if len(pdata) == 0:
-                return pdata
-            scales = layout.get_scales(pdata["PANEL"].iloc[0])
-            return cls.compute_panel(pdata, scales, params)
-
-        return groupby_apply(data, "PANEL", fn)
+        if data.empty:
+            return data.copy()
+
+        # Given data belonging to a specific panel, grab the
+        # corresponding scales and call the method that does the
+        # real computation
+        panels = []
+        tasks = []
+        # Each panel gets its own copy of the params, a panel may set
+        # a parameter (e.g. the width) that must not leak into the
+        # other panels.
+        for panel, pdata in data.groupby("PANEL", observed=True):
+            panels.append(panel)
+            tasks.append((pdata, layout.get_scales(panel), copy(params)))
+
+        results, seconds = apply_panels(cls.compute_panel, tasks, cls.PARALLEL)
+        layout.timings.extend(
+            panel_timing("position", cls.__name__, panel, s)
+            for panel, s in zip(panels, seconds)
+        )
+        return pd.concat(results, axis=0, ignore_index=True)
 
     @classmethod
     def compute_panel(
@@ -135,6 +152,9 @@ class position(ABC, metaclass=Register):
     def strategy(data: pd.DataFrame, params: dict[str, Any]) -> pd.DataFrame:
         """
         Calculate boundaries of geometry object
+
+        The data is that of a whole panel. When called by `collide`,
+        the rows with the same `xmin` are the objects that overlap.
         """
         return data
 
@@ -161,6 +181,21 @@ class position(ABC, metaclass=Register):
 
         return data, width
 
+    @classmethod
+    def _check_overlap(cls, data):
+        """
+        Warn if the x intervals of the (sorted) data overlap
+        """
+        intervals = data[["xmin", "xmax"]].drop_duplicates().to_numpy()
+        intervals = intervals.flatten()
+        intervals = intervals[~np.isnan(intervals)]
+
+        if len(np.unique(intervals)) > 1 and any(
+            np.diff(intervals - intervals.mean()) < -1e-6
+        ):
+            msg = "{} requires non-overlapping x intervals"
+            warn(msg.format(cls.__name__), PlotnineWarning)
+
     @classmethod
     def collide(cls, data, params):
         """
@@ -168,7 +203,6 @@ class position(ABC, metaclass=Register):
 
         Uses Strategy
         """
-        xminmax = ["xmin", "xmax"]
         data, width = cls._collide_setup(data, params)
         if params.get("width", None) is None:
             params["width"] = width
@@ -184,27 +218,23 @@ class position(ABC, metaclass=Register):
             del data["-group"]
 
         data = data.loc[idx, :]
+        cls._check_overlap(data)
 
-        # Check for overlap
-        intervals = data[xminmax].drop_duplicates().to_numpy().flatten()
-        intervals = intervals[~np.isnan(intervals)]
-
-        if len(np.unique(intervals)) > 1 and any(
-            np.diff(intervals - intervals.mean()) < -1e-6
-        ):
-            msg = "{} requires non-overlapping x intervals"
-            warn(msg.format(cls.__name__), PlotnineWarning)
+        # The strategy is called once for the whole panel, the
+        # objects that share an xmin value are the ones that collide.
+        # Objects without an xmin cannot collide with anything.
+        data = data.loc[data["xmin"].notna()]
 
         if "ymax" in data:
-            data = groupby_apply(data, "xmin", cls.strategy, params)
+            data = cls.strategy(data, params)
         elif "y" in data:
             data["ymax"] = data["y"]
-            data = groupby_apply(data, "xmin", cls.strategy, params)
+            data = cls.strategy(data, params)
             data["y"] = data["ymax"]
         else:
             raise PlotnineError("Neither y nor ymax defined")
 
-        return data
+        return data.reset_index(drop=True)
 
     @classmethod
     def collide2(cls, data, params):
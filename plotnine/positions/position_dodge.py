@@ -7,7 +7,7 @@ from copy import copy
 import numpy as np
 import pandas as pd
 
-from .._utils import groupby_apply, match
+from .._utils import groupby_apply
 from ..exceptions import PlotnineError
 from .position import position
 
@@ -31,6 +31,7 @@ class position_dodge(position):
     """
 
     REQUIRED_AES = {"x"}
+    PARALLEL = "thread"
 
     def __init__(
         self,
@@ -91,7 +92,8 @@ class position_dodge(position):
         """
         Dodge overlapping interval
 
-        Assumes that each set has the same horizontal position.
+        The rows with the same horizontal position (xmin) are
+        dodged together.
         """
         width = params["width"]
         with suppress(TypeError):
@@ -99,35 +101,42 @@ class position_dodge(position):
             width = np.asarray(width)
             width = width[data.index]
 
-        udata_group = data["group"].drop_duplicates()
+        if not all(col in data.columns for col in ["xmin", "xmax"]):
+            data["xmin"] = data["x"]
+            data["xmax"] = data["x"]
 
+        positions = data.groupby("xmin", sort=False)
         n = params.get("n", None)
         if n is None:
-            n = len(udata_group)
-        if n == 1:
-            return data
+            n = positions["group"].transform("nunique").to_numpy()
+        else:
+            n = np.repeat(n, len(data))
 
-        if not all(col in data.columns for col in ["xmin", "xmax"]):
-            data["xmin"] = data["x"]
-            data["xmax"] = data["x"]
+        dodge = n != 1
+        if not dodge.any():
+            return data
 
-        d_width = np.max(data["xmax"] - data["xmin"])
+        d_width = (data["xmax"] - data["xmin"]).groupby(
+            data["xmin"], sort=False
+        )
+        d_width = d_width.transform("max").to_numpy()
 
-        # Have a new group index from 1 to number of groups.
-        # This might be needed if the group numbers in this set don't
-        # include all of 1:n
-        udata_group = udata_group.sort_values()
-        groupidx = match(data["group"], udata_group)
-        groupidx = np.asarray(groupidx) + 1
+        # Have a new group index from 1 to number of groups at each
+        # position. This might be needed if the group numbers in this
+        # set don't include all of 1:n
+        groupidx = positions["group"].rank(method="dense").to_numpy()
 
         # Find the center for each group, then use that to
         # calculate xmin and xmax
-        data["x"] = data["x"] + width * ((groupidx - 0.5) / n - 0.5)
-        data["xmin"] = data["x"] - (d_width / n) / 2
-        data["xmax"] = data["x"] + (d_width / n) / 2
+        x = data["x"].to_numpy() + width * ((groupidx - 0.5) / n - 0.5)
+        xmin = x - (d_width / n) / 2
+        xmax = x + (d_width / n) / 2
+        data["x"] = np.where(dodge, x, data["x"])
+        data["xmin"] = np.where(dodge, xmin, data["xmin"])
+        data["xmax"] = np.where(dodge, xmax, data["xmax"])
 
         if "x" in data and "xend" in data:
-            data["x"] = data["xmin"]
-            data["xend"] = data["xmax"]
+            data["x"] = np.where(dodge, data["xmin"], data["x"])
+            data["xend"] = np.where(dodge, data["xmax"], data["xend"])
 
         return data
@@ -6,7 +6,7 @@ from copy import copy
 import numpy as np
 import pandas as pd
 
-from .._utils import groupby_apply, pivot_apply
+from .._utils import groupby_apply
 from ..exceptions import PlotnineError
 from .position_dodge import position_dodge
 
@@ -104,47 +104,41 @@ class position_dodge2(position_dodge):
 
         # Groups of boxes that share the same position
         data["xid"] = find_x_overlaps(data)
+        overlaps = data.groupby("xid", sort=False)
 
         # Find newx using xid, i.e. the center of each group of
         # overlapping elements. for boxes, bars, etc. this should
         # be the same as original x, but for arbitrary rects it
         # may not be
-        res1 = pivot_apply(data, "xmin", "xid", np.min)
-        res2 = pivot_apply(data, "xmax", "xid", np.max)
-        data["newx"] = (res1 + res2)[data["xid"].to_numpy()].to_numpy() / 2
+        xmin = overlaps["xmin"].transform("min")
+        xmax = overlaps["xmax"].transform("max")
+        data["newx"] = (xmin + xmax) / 2
 
         if n is None:
             # If n is None, preserve total widths of elements at
             # each position by dividing widths by the number of
             # elements at that position
-            n = data["xid"].value_counts(sort=False).to_numpy()
-            n = n[data.loc[:, "xid"] - 1]
-            data["new_width"] = (data["xmax"] - data["xmin"]) / n
-        else:
-            data["new_width"] = (data["xmax"] - data["xmin"]) / n
-
-        # Find the total width of each group of elements
-        def sum_new_width(gdf):
-            return pd.DataFrame(
-                {
-                    "size": [gdf["new_width"].sum()],
-                    "newx": gdf["newx"].iloc[0],
-                }
-            )
-
-        group_sizes = groupby_apply(data, "newx", sum_new_width)
-
-        # Starting xmin for each group of elements
-        starts = group_sizes["newx"] - (group_sizes["size"] / 2)
-
-        # Set the elements in place
-        for i, start in enumerate(starts, start=1):
-            bool_idx = data["xid"] == i
-            divisions = np.cumsum(
-                np.hstack([start, data.loc[bool_idx, "new_width"]])
-            )
-            data.loc[bool_idx, "xmin"] = divisions[:-1]
-            data.loc[bool_idx, "xmax"] = divisions[1:]
+            n = overlaps["xid"].transform("size").to_numpy()
+
+        data["new_width"] = (data["xmax"] - data["xmin"]) / n
+
+        # Find the total width of each group of elements, and the
+        # starting xmin for each group
+        group_sizes = data.groupby("newx")["new_width"].sum()
+        starts = (group_sizes.index - group_sizes / 2).to_numpy()
+
+        # Set the elements in place, side by side starting at the xmin
+        # of the group
+        xid = data["xid"].to_numpy()
+        bool_idx = xid <= len(starts)
+        first = np.hstack([True, xid[1:] != xid[:-1]]) & bool_idx
+        widths = data["new_width"].to_numpy(copy=True)
+        widths[first] += starts[xid[first] - 1]
+        xmax = pd.Series(widths).groupby(xid, sort=False).cumsum()
+        xmin = xmax.groupby(xid, sort=False).shift()
+        xmin[first] = starts[xid[first] - 1]
+        data["xmin"] = np.where(bool_idx, xmin, data["xmin"])
+        data["xmax"] = np.where(bool_idx, xmax, data["xmax"])
 
         # x values get moved to between xmin and xmax
         data["x"] = (data["xmin"] + data["xmax"]) / 2
@@ -166,13 +160,12 @@ class position_dodge2(position_dodge):
 def find_x_overlaps(df: pd.DataFrame) -> IntArray:
     """
     Find overlapping regions along the x axis
+
+    An element starts a new region if it begins at or after the end
+    of the element before it.
     """
-    n = len(df)
-    overlaps = np.zeros(n, dtype=int)
-    overlaps[0] = 1
-    counter = 1
-    for i in range(1, n):
-        if df["xmin"].iloc[i] >= df["xmax"].iloc[i - 1]:
-            counter += 1
-        overlaps[i] = counter
-    return overlaps
+    xmin = df["xmin"].to_numpy()
+    xmax = df["xmax"].to_numpy()
+    overlaps = np.ones(len(df), dtype=int)
+    overlaps[1:] = xmin[1:] >= xmax[:-1]
+    return np.cumsum(overlaps)
@@ -5,13 +5,16 @@ from copy import deepcopy
 
 import numpy as np
 
-from .._utils import jitter, resolution
+from .._utils import get_random_state, jitter, resolution
+from ..mapping.aes import X_AESTHETICS, Y_AESTHETICS
 from .position import position
 
 if typing.TYPE_CHECKING:
     from typing import Optional
 
-    from plotnine.typing import FloatArray, FloatArrayLike
+    import pandas as pd
+
+    from plotnine.typing import RandomGenerator, RandomStateLike
 
 
 class position_jitter(position):
@@ -29,6 +32,7 @@ class position_jitter(position):
     random_state :
         Seed or Random number generator to use. If `None`, then
         numpy global generator [](`numpy.random`) is used.
+        A `RandomState` or a `SeedSequence` are also accepted.
     """
 
     REQUIRED_AES = {"x", "y"}
@@ -37,7 +41,7 @@ class position_jitter(position):
         self,
         width: Optional[float] = None,
         height: Optional[float] = None,
-        random_state: Optional[int | np.random.RandomState] = None,
+        random_state: Optional[RandomStateLike] = None,
     ):
         self.params = {
             "width": width,
@@ -51,31 +55,58 @@ class position_jitter(position):
             params["width"] = resolution(data["x"]) * 0.4
         if params["height"] is None:
             params["height"] = resolution(data["y"]) * 0.4
-        if not params["random_state"]:
-            params["random_state"] = np.random
+        params["random_state"] = get_random_state(params["random_state"])
         return params
 
     @classmethod
     def compute_layer(cls, data, params, layout):
-        trans_x = None  # pyright: ignore
-        trans_y = None  # pyright: ignore
-
-        if params["width"]:
+        return jitter_positions(
+            data, params["width"], params["height"], params["random_state"]
+        )
 
-            def trans_x(x: FloatArrayLike) -> FloatArray:
-                return jitter(
-                    x,
-                    amount=params["width"],
-                    random_state=params["random_state"],
-                )
 
-        if params["height"]:
+def jitter_positions(
+    data: pd.DataFrame,
+    width: float,
+    height: float,
+    random_state: RandomGenerator,
+) -> pd.DataFrame:
+    """
+    Jitter all the variables that map onto the x and y scales
 
-            def trans_y(y):
-                return jitter(
-                    y,
-                    amount=params["height"],
-                    random_state=params["random_state"],
-                )
+    All the variables of an axis get the same noise as `x` or `y`,
+    so that e.g. `ymin` and `ymax` move together with `y`.
 
-        return cls.transform_position(data, trans_x, trans_y)
+    Parameters
+    ----------
+    data :
+        Data to jitter.
+    width :
+        Amount of jitter in the horizontal direction.
+    height :
+        Amount of jitter in the vertical direction.
+    random_state :
+        Random number generator.
+    """
+    xs = [name for name in data.columns if name in X_AESTHETICS]
+    ys = [name for name in data.columns if name in Y_AESTHETICS]
+    if not width:
+        xs = []
+    if not height:
+        ys = []
+
+    if not len(data) or not (xs or ys):
+        return data
+
+    # One noise vector for each axis, drawn in one go. All the
+    # columns of an axis move by the same amount.
+    axes = [cols for cols in (xs, ys) if cols]
+    amount = [width] * bool(xs) + [height] * bool(ys)
+    noise = jitter(
+        np.zeros((len(data), len(axes))),
+        amount=amount,
+        random_state=random_state,
+    )
+    for i, cols in enumerate(axes):
+        data[cols] = data[cols].to_numpy(dtype=float) + noise[:, [i]]
+    return data
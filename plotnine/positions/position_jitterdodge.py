@@ -4,16 +4,17 @@ import typing
 from contextlib import suppress
 from copy import copy
 
-from .._utils import jitter, resolution
+from .._utils import get_random_state, resolution
 from ..exceptions import PlotnineError
 from ..mapping.aes import SCALED_AESTHETICS
 from .position import position
 from .position_dodge import position_dodge
+from .position_jitter import jitter_positions
 
 if typing.TYPE_CHECKING:
     from typing import Optional
 
-    import numpy as np
+    from plotnine.typing import RandomStateLike
 
 
 # Adjust position by simultaneously dodging and jittering
@@ -37,9 +38,11 @@ class position_jitterdodge(position):
     random_state :
         Seed or Random number generator to use. If `None`, then
         numpy global generator [](`numpy.random`) is used.
+        A `RandomState` or a `SeedSequence` are also accepted.
     """
 
     REQUIRED_AES = {"x", "y"}
+    PARALLEL = None
     strategy = staticmethod(position_dodge.strategy)
 
     def __init__(
@@ -47,7 +50,7 @@ class position_jitterdodge(position):
         jitter_width: Optional[float] = None,
         jitter_height: float = 0,
         dodge_width: float = 0.75,
-        random_state: Optional[int | np.random.RandomState] = None,
+        random_state: Optional[RandomStateLike] = None,
     ):
         self.params = {
             "jitter_width": jitter_width,
@@ -80,32 +83,17 @@ class position_jitterdodge(position):
 
         params["jitter_width"] = width / (ndodge + 2)
         params["width"] = params["dodge_width"]
+        params["random_state"] = get_random_state(params["random_state"])
         return params
 
     @classmethod
     def compute_panel(cls, data, scales, params):
-        trans_x = None  # pyright: ignore
-        trans_y = None  # pyright: ignore
-
-        if params["jitter_width"] > 0:
-
-            def trans_x(x):
-                return jitter(
-                    x,
-                    amount=params["jitter_width"],
-                    random_state=params["random_state"],
-                )
-
-        if params["jitter_height"] > 0:
-
-            def trans_y(y):
-                return jitter(
-                    y,
-                    amount=params["jitter_height"],
-                    random_state=params["random_state"],
-                )
-
         # dodge, then jitter
         data = cls.collide(data, params=params)
-        data = cls.transform_position(data, trans_x, trans_y)
+        data = jitter_positions(
+            data,
+            params["jitter_width"],
+            params["jitter_height"],
+            params["random_state"],
+        )
         return data
@@ -26,6 +26,7 @@ class position_stack(position):
         Reverse the order of the stacked groups if true.
     """
 
+    PARALLEL = "thread"
     fill = False
 
     def __init__(self, vjust: float = 1, reverse: bool = False):
@@ -95,17 +96,27 @@ class position_stack(position):
         if undo_transform:
             data = cls.transform_position(data, trans_y=scales.y.inverse)
 
-        negative = data["ymax"] < 0
-        neg = data.loc[negative]
-        pos = data.loc[~negative]
+        data, width = cls._collide_setup(data, params)
+        if params.get("width", None) is None:
+            params["width"] = width
 
-        if len(neg):
-            neg = cls.collide(neg, params=params)
+        # Reorder by x position then on group, relying on stable sort to
+        # preserve existing ordering. The default stacking order reverses
+        # the group in order to match the legend order. The negative
+        # values are stacked separately and they come first.
+        group = data["group"].to_numpy()
+        if not params["reverse"]:
+            group = -group
+        negative = (data["ymax"] < 0).to_numpy()
+        idx = np.lexsort((group, data["xmin"].to_numpy(), ~negative))
+        data = data.iloc[idx].reset_index(drop=True)
+        negative = negative[idx]
 
-        if len(pos):
-            pos = cls.collide(pos, params=params)
+        for bool_idx in (negative, ~negative):
+            if bool_idx.any():
+                cls._check_overlap(data.loc[bool_idx])
 
-        data = pd.concat([neg, pos], axis=0, ignore_index=True, sort=True)
+        data = cls.strategy(data, params)
 
         if undo_transform:
             data = cls.transform_position(data, trans_y=scales.y.transform)
@@ -117,19 +128,25 @@ class position_stack(position):
         """
         Stack overlapping intervals.
 
-        Assumes that each set has the same horizontal position
+        The rows with the same horizontal position and the same sign
+        of `ymax` are stacked on top of each other in the order in
+        which they appear.
         """
         vjust = params["vjust"]
 
-        y = data["y"].copy()
+        y = data["y"].to_numpy(dtype=float, copy=True)
         y[np.isnan(y)] = 0
-        heights = np.append(0, y.cumsum())
+        stacks = [data["xmin"].to_numpy(), (data["ymax"] < 0).to_numpy()]
+        top = pd.Series(y).groupby(stacks, sort=False).cumsum()
+        bottom = top.groupby(stacks, sort=False).shift(fill_value=0)
 
         if params["fill"]:
-            heights = heights / np.abs(heights[-1])
+            total = np.abs(top.groupby(stacks, sort=False).transform("last"))
+            top = top / total
+            bottom = bottom / total
 
-        data["ymin"] = np.min([heights[:-1], heights[1:]], axis=0)
-        data["ymax"] = np.max([heights[:-1], heights[1:]], axis=0)
+        data["ymin"] = np.minimum(bottom, top).to_numpy()
+        data["ymax"] = np.maximum(bottom, top).to_numpy()
         # less intuitive than (ymin + vjust(ymax-ymin)), but
         # this way avoids subtracting numbers of potentially
         # similar precision
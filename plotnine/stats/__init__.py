@@ -2,11 +2,13 @@
 Statistics
 """
 
+from .stat_aggregate import stat_aggregate
 from .stat_bin import stat_bin
 from .stat_bin_2d import stat_bin2d, stat_bin_2d
 from .stat_bindot import stat_bindot
 from .stat_boxplot import stat_boxplot
 from .stat_count import stat_count
+from .stat_decimate import stat_decimate
 from .stat_density import stat_density
 from .stat_density_2d import stat_density_2d
 from .stat_ecdf import stat_ecdf
@@ -28,11 +30,13 @@ from .stat_ydensity import stat_ydensity
 
 __all__ = (
     "stat_count",
+    "stat_aggregate",
     "stat_bin",
     "stat_bin_2d",
     "stat_bin2d",
     "stat_bindot",
     "stat_boxplot",
+    "stat_decimate",
     "stat_density",
     "stat_ecdf",
     "stat_ellipse",
@@ -9,11 +9,12 @@ import pandas as pd
 from .._utils import (
     check_required_aesthetics,
     data_mapping_as_kwargs,
-    groupby_apply,
     remove_missing,
     uniquecols,
 )
+from .._utils.parallel import apply_panels
 from .._utils.registry import Register, _MergedDefaultParams
+from ..iapi import panel_timing
 from ..layer import layer
 from ..mapping import aes
 
@@ -21,10 +22,11 @@ if typing.TYPE_CHECKING:
     from typing import Any
 
     from plotnine import ggplot
+    from plotnine.coords.coord import coord
     from plotnine.facets.layout import Layout
     from plotnine.iapi import pos_scales
     from plotnine.mapping import Environment
-    from plotnine.typing import DataLike
+    from plotnine.typing import DataLike, ParallelBackend
 
 from abc import ABC
 
@@ -84,6 +86,22 @@ class stat(ABC, metaclass=Register):
     their default values.
     """
 
+    PARALLEL: ParallelBackend | None = None
+    """
+    How to compute the panels in parallel
+
+    Use `"thread"` when the computation spends most of its time in
+    numpy (or other code that releases the GIL) and `"process"` when
+    it spends most of its time running python code. If `None`, the
+    panels are always computed one after the other, e.g. when the
+    computation draws random numbers. The number of workers is set
+    with the `n_jobs` option.
+
+    A stat should only opt in when its `compute_panel` and
+    `compute_group` do not modify the stat (e.g. `self.params`) or
+    any other shared state.
+    """
+
     # All recognized parameters and their default values
     default_params = _MergedDefaultParams()
 
@@ -93,6 +111,14 @@ class stat(ABC, metaclass=Register):
     # built.
     environment: Environment
 
+    # Approximate (width, height) of a panel in pixels, it gets its
+    # value when the plot is being built.
+    panel_pixels: tuple[float, float]
+
+    # Coordinate system of the plot, it gets its value when the plot
+    # is being built.
+    coord: coord
+
     def __init__(
         self,
         mapping: aes | None = None,
@@ -271,19 +297,26 @@ class stat(ABC, metaclass=Register):
             finite=True,
         )
 
-        def fn(pdata):
-            """
-            Compute function helper
-            """
-            # Given data belonging to a specific panel, grab
-            # the corresponding scales and call the method
-            # that does the real computation
-            if len(pdata) == 0:
-                return pdata
-            pscales = layout.get_scales(pdata["PANEL"].iloc[0])
-            return self.compute_panel(pdata, pscales)
-
-        return groupby_apply(data, "PANEL", fn)
+        if data.empty:
+            return data.copy()
+
+        # Given data belonging to a specific panel, grab the
+        # corresponding scales and call the method that does the
+        # real computation
+        panels = []
+        tasks = []
+        for panel, pdata in data.groupby("PANEL", observed=True):
+            panels.append(panel)
+            tasks.append((pdata, layout.get_scales(panel)))
+
+        results, seconds = apply_panels(
+            self.compute_panel, tasks, self.PARALLEL
+        )
+        layout.timings.extend(
+            panel_timing("stat", self.__class__.__name__, panel, s)
+            for panel, s in zip(panels, seconds)
+        )
+        return pd.concat(results, axis=0, ignore_index=True)
 
     def compute_panel(self, data: pd.DataFrame, scales: pos_scales):
         """
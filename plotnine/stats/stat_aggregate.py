@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from ..doctools import document
+from ..exceptions import PlotnineError
+from ..mapping.aes import NO_GROUP
+from ..mapping.evaluation import after_stat
+from ..scales.scale_continuous import scale_continuous
+from .stat import stat
+
+if TYPE_CHECKING:
+    from plotnine.typing import FloatArray, IntArray
+
+
+@document
+class stat_aggregate(stat):
+    """
+    Aggregate points onto the pixels of the panel
+
+    Each pixel of the panel is a bin and the points that fall in it
+    are reduced to a single value. Only the pixels with points are
+    returned.
+
+    {usage}
+
+    Parameters
+    ----------
+    {common_parameters}
+    fun : Literal["count", "sum", "mean"], default="count"
+        How to reduce the points in a pixel. `"sum"` and `"mean"`
+        are of the `weight` aesthetic.
+    pixels : tuple[int, int], default=None
+        Number of bins (pixels) across and up the panel. If `None`,
+        it is the size of the panel in pixels.
+
+    See Also
+    --------
+    plotnine.geom_aggregate : The default `geom` for this `stat`.
+    plotnine.stat_bin_2d : For bins of any size.
+    """
+
+    _aesthetics_doc = """
+    {aesthetics_table}
+
+    **Options for computed aesthetics**
+
+    ```python
+    "xmin"   # x lower bound of the pixel
+    "xmax"   # x upper bound of the pixel
+    "ymin"   # y lower bound of the pixel
+    "ymax"   # y upper bound of the pixel
+    "count"  # number of points in the pixel
+    "value"  # the count, sum or mean of the points in the pixel
+    ```
+    """
+
+    REQUIRED_AES = {"x", "y"}
+    PARALLEL = "thread"
+    DEFAULT_PARAMS = {"geom": "aggregate", "fun": "count", "pixels": None}
+    DEFAULT_AES = {"fill": after_stat("value"), "weight": None}
+    CREATES = {"xmin", "xmax", "ymin", "ymax", "count", "value"}
+    DROPPED_AES = ["weight"]
+
+    def setup_params(self, data):
+        fun = self.params["fun"]
+        if fun not in ("count", "sum", "mean"):
+            raise PlotnineError(f"Unknown aggregate function {fun!r}")
+
+    def compute_panel(self, data, scales):
+        from ..coords import coord_flip
+
+        if not (
+            isinstance(scales.x, scale_continuous)
+            and isinstance(scales.y, scale_continuous)
+        ):
+            raise PlotnineError(
+                "stat_aggregate() requires continuous x and y aesthetics."
+            )
+
+        # The bins are the pixels of the panel, with the range that
+        # the panel will have. Points outside the range are not seen.
+        panel_params = self.coord.setup_panel_params(scales.x, scales.y)
+        xview, yview = panel_params.x, panel_params.y
+        width, height = self.params["pixels"] or self.panel_pixels
+        if isinstance(self.coord, coord_flip):
+            xview, yview = yview, xview
+            width, height = height, width
+
+        x = data["x"].to_numpy(dtype=float)
+        y = data["y"].to_numpy(dtype=float)
+        xbins = _pixel_bins(x, scales.x.dimension(), xview.range, width)
+        ybins = _pixel_bins(y, scales.y.dimension(), yview.range, height)
+        (xlow, xstep, nx, ix), (ylow, ystep, ny, iy) = xbins, ybins
+
+        inside = (ix >= 0) & (iy >= 0)
+        cell = (iy * nx + ix)[inside]
+        count = np.bincount(cell, minlength=nx * ny)
+        if self.params["fun"] == "count":
+            value = count.astype(float)
+        else:
+            weight = (
+                data["weight"].to_numpy(dtype=float)[inside]
+                if "weight" in data
+                else np.ones(len(cell))
+            )
+            value = np.bincount(cell, weight, nx * ny)
+            if self.params["fun"] == "mean":
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    value = value / count
+
+        cells = np.flatnonzero(count)
+        row, col = np.divmod(cells, nx)
+        xmin = xlow + col * xstep
+        ymin = ylow + row * ystep
+        return pd.DataFrame(
+            {
+                "x": xmin + xstep / 2,
+                "y": ymin + ystep / 2,
+                "xmin": xmin,
+                "xmax": xmin + xstep,
+                "ymin": ymin,
+                "ymax": ymin + ystep,
+                "count": count[cells],
+                "value": value[cells],
+                "PANEL": data["PANEL"].iloc[0],
+                "group": NO_GROUP,
+            }
+        )
+
+
+def _pixel_bins(
+    x: FloatArray,
+    limits: tuple[float, float],
+    panel_range: tuple[float, float],
+    npixels: float,
+) -> tuple[float, float, int, IntArray]:
+    """
+    Put values into bins the size of the pixels of the panel
+
+    The bins line up with the pixels of the panel, counting from its
+    lower edge. Only the bins in the part of the panel that has the
+    values are made, so the range of the bins (after the stat) is
+    about the range of the values (before the stat).
+
+    Parameters
+    ----------
+    x :
+        Values
+    limits :
+        Limits of the values
+    panel_range :
+        Range of the panel
+    npixels :
+        Number of pixels across the range of the panel
+
+    Returns
+    -------
+    low :
+        Lower bound of the first bin
+    step :
+        Size of the bins
+    nbins :
+        Number of bins
+    idx :
+        Bin of each value. It is -1 for values that are not
+        in the panel.
+    """
+    step = (panel_range[1] - panel_range[0]) / max(npixels, 1)
+    if step <= 0 or not np.isfinite(step):
+        step = 1
+
+    # The first bin is the pixel with the lowest value
+    first = np.floor((max(limits[0], panel_range[0]) - panel_range[0]) / step)
+    low = panel_range[0] + max(first, 0) * step
+    high = min(limits[1], panel_range[1])
+    nbins = max(int(np.ceil((high - low) / step)), 1)
+    idx = np.floor((x - low) / step)
+    # The upper limit belongs to the last bin
+    idx[x == high] = nbins - 1
+    idx[(idx < 0) | (idx >= nbins) | ~np.isfinite(idx)] = -1
+    return low, step, nbins, idx.astype(int)
@@ -74,6 +74,7 @@ class stat_bin(stat):
 
     """
     REQUIRED_AES = {"x"}
+    PARALLEL = "thread"
     DEFAULT_PARAMS = {
         "geom": "histogram",
         "position": "stack",
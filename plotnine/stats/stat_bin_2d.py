@@ -57,6 +57,7 @@ class stat_bin_2d(stat):
 
     """
     REQUIRED_AES = {"x", "y"}
+    PARALLEL = "thread"
     DEFAULT_PARAMS = {
         "geom": "rect",
         "bins": 30,
@@ -87,6 +87,7 @@ class stat_bindot(stat):
     """
 
     REQUIRED_AES = {"x"}
+    PARALLEL = "thread"
     NON_MISSING_AES = {"weight"}
     DEFAULT_PARAMS = {
         "geom": "dotplot",
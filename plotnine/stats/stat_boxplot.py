@@ -60,6 +60,7 @@ class stat_boxplot(stat):
     """
 
     REQUIRED_AES = {"x", "y"}
+    PARALLEL = "process"
     NON_MISSING_AES = {"weight"}
     DEFAULT_PARAMS = {
         "geom": "boxplot",
@@ -40,6 +40,7 @@ class stat_count(stat):
     """
 
     REQUIRED_AES = {"x"}
+    PARALLEL = "thread"
     DEFAULT_PARAMS = {
         "geom": "histogram",
         "position": "stack",
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..doctools import document
+from ..exceptions import PlotnineError
+from .stat import stat
+
+if TYPE_CHECKING:
+    from plotnine.coords.coord import coord
+    from plotnine.iapi import pos_scales
+    from plotnine.typing import FloatArray, IntArray
+
+
+@document
+class stat_decimate(stat):
+    """
+    Reduce a long series to what can be seen
+
+    A series with many more points than the panel has pixels
+    across is reduced to a few points for each column of pixels.
+    The shape of the line, including its peaks and troughs, is
+    kept.
+
+    {usage}
+
+    Parameters
+    ----------
+    {common_parameters}
+    method : Literal["minmax", "lttb"], default="minmax"
+        How to choose the points that are kept. The x-range of the
+        panel is divided into `n` buckets of equal width, then
+
+        - `"minmax"` - keeps the first, last, lowest and highest
+          point in each bucket, at most 4 points per bucket.
+        - `"lttb"` - Largest-Triangle-Three-Buckets, keeps as many
+          points as there are buckets. The points are shared out
+          equally among the buckets, and in each bucket the point
+          that forms the largest triangle with the points kept in
+          the neighbouring buckets is kept.
+
+    n : int, default=None
+        Number of buckets across the panel. If `None`, it is the
+        width of the panel in pixels.
+
+    See Also
+    --------
+    plotnine.geom_line : The default `geom` for this `stat`.
+
+    Notes
+    -----
+    The points of each group should be ordered by `x`, as they are
+    for [](:class:`~plotnine.geom_line`) and
+    [](:class:`~plotnine.geom_step`). The points that are kept are
+    returned in their original order, with all their columns.
+    """
+
+    REQUIRED_AES = {"x", "y"}
+    PARALLEL = "thread"
+    DEFAULT_PARAMS = {"geom": "line", "method": "minmax", "n": None}
+
+    def setup_params(self, data):
+        method = self.params["method"]
+        if method not in ("minmax", "lttb"):
+            raise PlotnineError(f"Unknown decimation method {method!r}")
+
+    def compute_panel(self, data, scales):
+        from ..coords import coord_flip
+
+        # The points that are kept have all their columns, so unlike
+        # compute_group there is nothing to carry over for the groups
+        x = data["x"].to_numpy(dtype=float)
+        y = data["y"].to_numpy(dtype=float)
+        n = self.params["n"]
+        if n is None:
+            # x is along the height of a flipped panel
+            flipped = isinstance(self.coord, coord_flip)
+            n = int(np.ceil(self.panel_pixels[flipped]))
+
+        # Points that are missing a value cannot be put in a bucket,
+        # they are kept so that they still break the line
+        finite = np.isfinite(x) & np.isfinite(y)
+        if not finite.any():
+            return data
+
+        xmin, xmax = _panel_range(x[finite], scales, self.coord)
+        width = (xmax - xmin) / n if xmax > xmin else 1
+
+        # The buckets span the panel, a group that spans a part of it
+        # gets a part of the buckets. The points on either side of the
+        # panel are in a bucket of their own (0 and n+1), so the lines
+        # that leave the panel keep their slope.
+        bucket = np.zeros(len(x), dtype=int)
+        bucket[finite] = np.clip(
+            np.floor((x[finite] - xmin) / width) + 1, 0, n + 1
+        ).astype(int)
+
+        keep = []
+        for idx in data.groupby("group").indices.values():
+            missing = idx[~finite[idx]]
+            idx = idx[finite[idx]]
+            if len(idx):
+                b = bucket[idx]
+                nbuckets = b.max() - b.min() + 1
+                if self.params["method"] == "minmax":
+                    if len(idx) > 4 * nbuckets:
+                        idx = idx[_minmax(b, y[idx])]
+                elif len(idx) > nbuckets + 2:
+                    idx = idx[_lttb(x[idx], y[idx], nbuckets + 2)]
+            keep.append(np.union1d(idx, missing))
+
+        return data.iloc[np.hstack(keep)].reset_index(drop=True)
+
+
+def _panel_range(
+    x: FloatArray, scales: pos_scales, coord: coord
+) -> tuple[float, float]:
+    """
+    Return the x-range of the panel or of the data if it is unknown
+
+    The range of the panel is that of the coordinate system, with
+    its limits and the expansion of the scales.
+    """
+    if scales.x and scales.y:
+        panel_params = coord.setup_panel_params(scales.x, scales.y)
+        xmin, xmax = coord.backtransform_range(panel_params).x
+        if np.isfinite(xmin) and np.isfinite(xmax):
+            return xmin, xmax
+    return x.min(), x.max()
+
+
+def _minmax(bucket: IntArray, y: FloatArray) -> IntArray:
+    """
+    Positions of the first, last, lowest & highest point in each bucket
+
+    Parameters
+    ----------
+    bucket :
+        Bucket of each point
+    y :
+        Values of the points
+
+    Returns
+    -------
+    out :
+        Positions of the points in ascending order
+    """
+    # The points of a bucket are next to each other
+    order = np.argsort(bucket, kind="stable")
+    bucket, y = bucket[order], y[order]
+    starts = np.flatnonzero(np.diff(bucket, prepend=-1))
+    ends = np.append(starts[1:], len(bucket)) - 1
+    sizes = ends - starts + 1
+    bucket_idx = np.repeat(np.arange(len(starts)), sizes)
+
+    # The first occurrence of the extreme values in each bucket
+    lowest = np.repeat(np.minimum.reduceat(y, starts), sizes) == y
+    highest = np.repeat(np.maximum.reduceat(y, starts), sizes) == y
+    _, imin = np.unique(bucket_idx[lowest], return_index=True)
+    _, imax = np.unique(bucket_idx[highest], return_index=True)
+
+    keep = np.hstack(
+        [
+            starts,
+            ends,
+            np.flatnonzero(lowest)[imin],
+            np.flatnonzero(highest)[imax],
+        ]
+    )
+    return np.unique(order[keep])
+
+
+def _lttb(x: FloatArray, y: FloatArray, n: int) -> IntArray:
+    """
+    Positions of the points chosen by Largest-Triangle-Three-Buckets
+
+    Parameters
+    ----------
+    x, y :
+        Coordinates of the points, ordered by x
+    n :
+        Number of points to keep, including the first and last.
+
+    Returns
+    -------
+    out :
+        Positions of the points in ascending order
+
+    References
+    ----------
+    Steinarsson, S. (2013). Downsampling time series for visual
+    representation. MSc thesis, University of Iceland.
+    """
+    npoints = len(x)
+    # The first & last points are kept, the rest are shared out
+    # among n-2 buckets of (almost) equal size
+    edges = np.append(np.linspace(1, npoints - 1, n - 1).astype(int), npoints)
+    keep = np.zeros(n, dtype=int)
+    keep[-1] = npoints - 1
+
+    a = 0
+    for i in range(n - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = edges[i + 1], edges[i + 2]
+        # Average of the next bucket
+        cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        # Twice the area of triangles with vertices at the last kept
+        # point, the points in this bucket & the average of the next
+        area = np.abs(
+            (x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a])
+        )
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+
+    return keep
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from contextlib import suppress
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 from warnings import warn
 
 import numpy as np
@@ -13,7 +13,11 @@ from ..mapping.evaluation import after_stat
 from .stat import stat
 
 if TYPE_CHECKING:
-    from plotnine.typing import FloatArray, FloatArrayLike
+    from plotnine.typing import (
+        FloatArray,
+        FloatArrayLike,
+        IntArray,
+    )
 
 
 # NOTE: Parameter descriptions are in
@@ -108,6 +112,7 @@ class stat_density(stat):
 
     """
     REQUIRED_AES = {"x"}
+    PARALLEL = "thread"
     DEFAULT_PARAMS = {
         "geom": "density",
         "position": "stack",
@@ -175,16 +180,7 @@ def compute_density(x, weight, range, params):
     n = len(x)
 
     if n == 0 or (n == 1 and isinstance(bw, str)):
-        if n == 1:
-            warn(
-                "To compute the density of a group with only one "
-                "value set the bandwidth manually. e.g `bw=0.1`",
-                PlotnineWarning,
-            )
-        warn(
-            "Groups with fewer than 2 data points have been removed.",
-            PlotnineWarning,
-        )
+        _warn_too_few(n)
         return pd.DataFrame()
 
     # kde is computed efficiently using fft. But the fft does
@@ -269,6 +265,155 @@ def compute_density(x, weight, range, params):
     )
 
 
+def compute_densities(
+    x: FloatArrayLike,
+    group: IntArray,
+    ranges: FloatArray,
+    weight: FloatArrayLike | None,
+    params: dict[str, Any],
+) -> pd.DataFrame:
+    """
+    Compute the densities of many groups
+
+    The gaussian kernel is evaluated for all the groups together. It
+    is the same estimate that statsmodels makes, without fitting a
+    model to each group. Other kernels, weights, bounds and bandwidth
+    rules fall back to [](`~plotnine.stats.stat_density.compute_density`)
+    for each group.
+
+    Parameters
+    ----------
+    x :
+        Values whose densities are estimated.
+    group :
+        Group number of each value, 0 to (number of groups - 1).
+    ranges :
+        Array of shape (number of groups, 2) with the range over
+        which to evaluate the density of each group.
+    weight :
+        Weight of each value.
+    params :
+        Parameters of the estimate, as used by `compute_density`.
+
+    Returns
+    -------
+    out :
+        The densities of the groups one after the other, in the same
+        form as `compute_density`. The index is the group number.
+        Groups with too few values are left out.
+    """
+    x = np.asarray(x, dtype=float)
+    group = np.asarray(group)
+    ngroups = len(ranges)
+    bw = params["bw"]
+    bounds = params["bounds"]
+    has_bounds = not (np.isneginf(bounds[0]) and np.isposinf(bounds[1]))
+
+    order = np.argsort(group, kind="stable")
+    not_nan = ~np.isnan(x[order])
+    order = order[not_nan]
+    x, group = x[order], group[order]
+    sizes = np.bincount(group, minlength=ngroups)
+    starts = np.cumsum(sizes) - sizes
+
+    batch = (
+        params["kernel"] == "gau"
+        and weight is None
+        and not has_bounds
+        and (bw == "nrd0" or not isinstance(bw, str))
+    )
+
+    if not batch:
+        if weight is not None:
+            weight = np.asarray(weight, dtype=float)[order]
+        densities = []
+        for i in range(ngroups):
+            s = slice(starts[i], starts[i] + sizes[i])
+            w = weight[s] if weight is not None else None
+            dens = compute_density(x[s], w, ranges[i], params)
+            if len(dens):
+                densities.append(dens.set_axis([i] * len(dens)))
+        return pd.concat(densities) if densities else pd.DataFrame()
+
+    min_size = 2 if isinstance(bw, str) else 1
+    for n in sizes[sizes < min_size]:
+        _warn_too_few(n)
+    estimate = sizes >= min_size
+    rows = estimate[group]
+    x, group = x[rows], group[rows]
+
+    bws = np.ones(ngroups)
+    if isinstance(bw, str):
+        bws[estimate] = _nrd0_groups(x, group)
+    else:
+        bws[:] = bw
+    h = bws * params["adjust"]
+
+    npoints = params["n"]
+    grid = np.linspace(ranges[:, 0], ranges[:, 1], npoints, axis=1)
+
+    # The contributions of the values to each point of the grid are
+    # summed a block of values at a time, which bounds the memory.
+    # The groups in a block are contiguous.
+    density = np.zeros((ngroups, npoints))
+    blocksize = max(2**22 // npoints, 1)
+    for i in range(0, len(x), blocksize):
+        _group = group[i : i + blocksize]
+        u = (x[i : i + blocksize, None] - grid[_group]) / h[_group, None]
+        k = 0.3989422804014327 * np.exp(-(u**2) / 2.0)
+        first = np.hstack([0, np.flatnonzero(np.diff(_group)) + 1])
+        density[_group[first]] += np.add.reduceat(k, first, axis=0)
+
+    idx = np.flatnonzero(estimate)
+    density = density[idx] * (1.0 / (h[idx] * sizes[idx]))[:, None]
+    n = sizes[idx, None]
+    return pd.DataFrame(
+        {
+            "x": grid[idx].ravel(),
+            "density": density.ravel(),
+            "scaled": (density / density.max(axis=1, keepdims=True)).ravel(),
+            "count": (density * n).ravel(),
+            "n": np.repeat(sizes[idx], npoints),
+        },
+        index=np.repeat(idx, npoints),
+    )
+
+
+def _warn_too_few(n: int):
+    """
+    Warn that a group has too few values for a density
+    """
+    if n == 1:
+        warn(
+            "To compute the density of a group with only one "
+            "value set the bandwidth manually. e.g `bw=0.1`",
+            PlotnineWarning,
+        )
+    warn(
+        "Groups with fewer than 2 data points have been removed.",
+        PlotnineWarning,
+    )
+
+
+def _nrd0_groups(x: FloatArray, group: IntArray) -> FloatArray:
+    """
+    Compute the nrd0 bandwidth of each group
+
+    `x` is ordered by group and every group has at least 2 values.
+    """
+    s = pd.Series(x).groupby(group)
+    n = s.size().to_numpy()
+    std = s.std(ddof=1).to_numpy()
+    std_estimate = (s.quantile(0.75) - s.quantile(0.25)).to_numpy() / 1.349
+    low_std = np.minimum(std, std_estimate)
+    first = np.abs(s.first().to_numpy())
+    fallback = np.where(
+        std_estimate != 0, std_estimate, np.where(first != 0, first, 1)
+    )
+    low_std = np.where(low_std == 0, fallback, low_std)
+    return 0.9 * low_std * (n**-0.2)
+
+
 def nrd0(x: FloatArrayLike) -> float:
     """
     Port of R stats::bw.nrd0
@@ -61,6 +61,7 @@ class stat_density_2d(stat):
     largely irrelevant.
     """
     REQUIRED_AES = {"x"}
+    PARALLEL = "thread"
     DEFAULT_PARAMS = {
         "geom": "density_2d",
         "contour": True,
@@ -40,6 +40,7 @@ class stat_ecdf(stat):
     """
 
     REQUIRED_AES = {"x"}
+    PARALLEL = "thread"
     DEFAULT_PARAMS = {"geom": "step", "n": None, "pad": True}
     DEFAULT_AES = {"y": after_stat("ecdf")}
     CREATES = {"ecdf"}
@@ -44,6 +44,7 @@ class stat_ellipse(stat):
     """
 
     REQUIRED_AES = {"x", "y"}
+    PARALLEL = "thread"
     DEFAULT_PARAMS = {
         "geom": "path",
         "type": "t",
@@ -43,6 +43,7 @@ class stat_hull(stat):
 
     """
     REQUIRED_AES = {"x", "y"}
+    PARALLEL = "thread"
     DEFAULT_PARAMS = {"geom": "path", "qhull_options": None}
     CREATES = {"area"}
 
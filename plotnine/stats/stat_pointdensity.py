@@ -46,6 +46,7 @@ class stat_pointdensity(stat):
 
     """
     REQUIRED_AES = {"x", "y"}
+    PARALLEL = "thread"
     DEFAULT_AES = {"color": after_stat("density")}
     DEFAULT_PARAMS = {
         "geom": "density_2d",
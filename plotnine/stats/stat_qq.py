@@ -64,6 +64,7 @@ class stat_qq(stat):
 
     """
     REQUIRED_AES = {"sample"}
+    PARALLEL = "thread"
     DEFAULT_AES = {"x": after_stat("theoretical"), "y": after_stat("sample")}
     DEFAULT_PARAMS = {
         "geom": "qq",
@@ -52,6 +52,7 @@ class stat_qq_line(stat):
     """
 
     REQUIRED_AES = {"sample"}
+    PARALLEL = "thread"
     DEFAULT_PARAMS = {
         "geom": "qq_line",
         "distribution": "norm",
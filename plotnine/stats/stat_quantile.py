@@ -48,6 +48,7 @@ class stat_quantile(stat):
     """
 
     REQUIRED_AES = {"x", "y"}
+    PARALLEL = "process"
     DEFAULT_PARAMS = {
         "geom": "quantile",
         "quantiles": (0.25, 0.5, 0.75),
@@ -1,17 +1,26 @@
+from __future__ import annotations
+
 from typing import TYPE_CHECKING, cast
 
 import numpy as np
 import pandas as pd
 
-from .._utils import array_kind, jitter, nextafter_range, resolution
+from .._utils import (
+    array_kind,
+    get_random_state,
+    jitter,
+    nextafter_range,
+    resolution,
+)
 from ..doctools import document
 from ..exceptions import PlotnineError
 from ..mapping.aes import has_groups
 from .binning import breaks_from_bins, breaks_from_binwidth
 from .stat import stat
-from .stat_density import compute_density
+from .stat_density import compute_densities
 
 if TYPE_CHECKING:
+    from plotnine.iapi import pos_scales
     from plotnine.typing import FloatArray, IntArray
 
 
@@ -53,9 +62,10 @@ class stat_sina(stat):
         If the samples within the same y-axis bin are more
         than `bin_limit`, the samples's X coordinates will be adjusted.
         This parameter is effective only when `method="counts"`{.py}
-    random_state : int | ~numpy.random.RandomState, default=None
+    random_state : int | ~numpy.random.Generator, default=None
         Seed or Random number generator to use. If `None`, then
         numpy global generator [](`numpy.random`) is used.
+        A `RandomState` or a `SeedSequence` are also accepted.
     scale : Literal["area", "count", "width"], default="area"
         How to scale the sina groups.
 
@@ -92,6 +102,7 @@ class stat_sina(stat):
     """
 
     REQUIRED_AES = {"x", "y"}
+    PARALLEL = None
     DEFAULT_PARAMS = {
         "geom": "sina",
         "position": "dodge",
@@ -121,7 +132,6 @@ class stat_sina(stat):
 
     def setup_params(self, data):
         params = self.params
-        random_state = params["random_state"]
 
         if params["maxwidth"] is None:
             params["maxwidth"] = resolution(data["x"], False) * 0.9
@@ -129,10 +139,7 @@ class stat_sina(stat):
         if params["binwidth"] is None and self.params["bins"] is None:
             params["bins"] = 50
 
-        if random_state is None:
-            params["random_state"] = np.random
-        elif isinstance(random_state, int):
-            params["random_state"] = np.random.RandomState(random_state)
+        params["random_state"] = get_random_state(params["random_state"])
 
         # Required by compute_density
         params["kernel"] = "gau"  # It has to be a gaussian kernel
@@ -146,11 +153,28 @@ class stat_sina(stat):
         params = self.params
         maxwidth = params["maxwidth"]
         random_state = params["random_state"]
-        data = super().compute_panel(data, scales)
 
         if not len(data):
             return data
 
+        # The groups are processed together, but the rows are kept
+        # in the order in which they would be if each group were
+        # computed separately.
+        data = data.sort_values("group", kind="stable", ignore_index=True)
+        group = data["group"].to_numpy()
+        bounds = np.flatnonzero(np.diff(group)) + 1
+        starts = np.hstack([0, bounds])
+        sizes = np.diff(np.hstack([starts, len(group)]))
+        # group number of each row, 0 to (number of groups - 1)
+        gidx = np.repeat(np.arange(len(starts)), sizes)
+
+        density, scaled = self._compute_densities(data, scales, gidx, starts)
+        data["density"] = density
+        data["scaled"] = scaled
+        data["n"] = sizes[gidx]
+        x = data.groupby(gidx)["x"]
+        data["x"] = ((x.transform("max") + x.transform("min")) / 2).to_numpy()
+
         if params["scale"] == "area":
             data["sinawidth"] = data["density"] / data["density"].max()
         elif params["scale"] == "count":
@@ -190,65 +214,129 @@ class stat_sina(stat):
 
         return data
 
-    def compute_group(self, data, scales):
-        binwidth = self.params["binwidth"]
-        maxwidth = self.params["maxwidth"]
-        bin_limit = self.params["bin_limit"]
-        weight = None
-        y = data["y"]
-
-        if len(data) == 0:
-            return pd.DataFrame()
-
-        elif len(data) < 3:
-            data["density"] = 0
-            data["scaled"] = 1
-        elif len(np.unique(y)) < 2:
-            data["density"] = 1
-            data["scaled"] = 1
-        elif self.params["method"] == "density":
-            from scipy.interpolate import interp1d
-
-            # density kernel estimation
-            range_y = y.min(), y.max()
-            dens = compute_density(y, weight, range_y, self.params)
-            densf = interp1d(
-                dens["x"],
-                dens["density"],
-                bounds_error=False,
-                fill_value="extrapolate",  # pyright: ignore
+    def _compute_densities(
+        self,
+        data: pd.DataFrame,
+        scales: pos_scales,
+        gidx: IntArray,
+        starts: IntArray,
+    ) -> tuple[FloatArray, FloatArray]:
+        """
+        Compute the density and scaled density at each point
+
+        Parameters
+        ----------
+        data :
+            Data for the panel, sorted by group.
+        scales :
+            Position scales of the panel.
+        gidx :
+            Group number of each row in data.
+        starts :
+            Position in data of the first row of each group.
+
+        Returns
+        -------
+        density :
+            Density at each point.
+        scaled :
+            Density at each point scaled to a maximum of 1 within
+            the group.
+        """
+        params = self.params
+        y = data["y"].to_numpy(dtype=float)
+        ngroups = len(starts)
+        sizes = np.bincount(gidx, minlength=ngroups)
+
+        # Groups that are too small or have a single value do not
+        # have a meaningful density.
+        n_unique = pd.Series(y).groupby(gidx).nunique().to_numpy()
+        too_small = sizes < 3
+        single_value = ~too_small & (n_unique < 2)
+        estimate = ~(too_small | single_value)
+
+        density = np.zeros(len(y))
+        scaled = np.ones(len(y))
+        density[single_value[gidx]] = 1
+
+        if not estimate.any():
+            return density, scaled
+
+        # Missing values keep a density of 0
+        rows = estimate[gidx] & ~np.isnan(y)
+        group_max = np.zeros(ngroups)
+        if params["method"] == "density":
+            density[rows], group_max[estimate] = self._lookup_kde(
+                y[rows], np.cumsum(estimate)[gidx[rows]] - 1
             )
-            data["density"] = densf(y)
-            data["scaled"] = data["density"] / dens["density"].max()
         else:
             expanded_y_range = nextafter_range(scales.y.dimension())
-            if binwidth is not None:
-                bins = breaks_from_binwidth(expanded_y_range, binwidth)
+            if params["binwidth"] is not None:
+                bins = breaks_from_binwidth(
+                    expanded_y_range, params["binwidth"]
+                )
             else:
-                bins = breaks_from_bins(expanded_y_range, self.params["bins"])
-
-            # bin based estimation
-            bin_index = pd.cut(y, bins, include_lowest=True, labels=False)  # pyright: ignore[reportCallIssue,reportArgumentType]
-            data["density"] = (
-                pd.Series(bin_index)
-                .groupby(bin_index)
-                .apply(len)[bin_index]
-                .to_numpy()
-            )
-            data.loc[data["density"] <= bin_limit, "density"] = 0
-            data["scaled"] = data["density"] / data["density"].max()
+                bins = breaks_from_bins(expanded_y_range, params["bins"])
 
-        # Compute width if x has multiple values
-        if len(data["x"].unique()) > 1:
-            width = np.ptp(data["x"]) * maxwidth
-        else:
-            width = maxwidth
-
-        data["width"] = width
-        data["n"] = len(data)
-        data["x"] = np.mean([data["x"].max(), data["x"].min()])
-
-        return data
+            # Count all groups in one go, each (group, bin) pair is a
+            # distinct cell
+            nbins = len(bins) - 1
+            bin_index = pd.cut(  # pyright: ignore[reportCallIssue,reportArgumentType]
+                y[rows], bins, include_lowest=True, labels=False
+            )
+            cell = gidx[rows] * nbins + np.asarray(bin_index, dtype=int)
+            counts = np.bincount(cell, minlength=ngroups * nbins)[cell]
+            counts[counts <= params["bin_limit"]] = 0
+            density[rows] = counts
+            np.maximum.at(group_max, gidx[rows], counts)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scaled[rows] = density[rows] / group_max[gidx[rows]]
+        return density, scaled
+
+    def _lookup_kde(
+        self,
+        y: FloatArray,
+        gidx: IntArray,
+    ) -> tuple[FloatArray, FloatArray]:
+        """
+        Evaluate the kernel density of each group at its points
+
+        The densities of all the groups are estimated together, the
+        same way as for the violin, over the range of each group. The
+        density at each point is interpolated along the grid of its
+        group.
+
+        Parameters
+        ----------
+        y :
+            Values of the groups to estimate.
+        gidx :
+            Group number of each value, 0 to (number of groups - 1).
+
+        Returns
+        -------
+        density :
+            Density at each point of the estimated groups.
+        peaks :
+            Maximum of the estimated density of each group.
+        """
+        params = self.params
+        grouped = pd.Series(y).groupby(gidx)
+        ranges = np.column_stack([grouped.min(), grouped.max()])
+        dens = compute_densities(y, gidx, ranges, None, params)
+        grid = dens["x"].to_numpy().reshape(len(ranges), -1)
+        grid_density = dens["density"].to_numpy().reshape(len(ranges), -1)
+
+        # Position of each point along the equally spaced grid
+        # of its group
+        lo, hi = ranges[gidx, 0], ranges[gidx, 1]
+        pos = (y - lo) / (hi - lo) * (grid.shape[1] - 1)
+        j = np.clip(np.floor(pos).astype(int), 0, grid.shape[1] - 2)
+        x0, x1 = grid[gidx, j], grid[gidx, j + 1]
+        d0, d1 = grid_density[gidx, j], grid_density[gidx, j + 1]
+        density = d0 + (d1 - d0) * (y - x0) / (x1 - x0)
+        return density, grid_density.max(axis=1)
 
     def finish_layer(self, data):
         # Rescale x in case positions have been adjusted
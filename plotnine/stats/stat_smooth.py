@@ -141,6 +141,7 @@ class stat_smooth(stat):
     """
 
     REQUIRED_AES = {"x", "y"}
+    PARALLEL = "process"
     DEFAULT_PARAMS = {
         "geom": "smooth",
         "method": "auto",
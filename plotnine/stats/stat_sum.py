@@ -35,6 +35,7 @@ class stat_sum(stat):
     """
 
     REQUIRED_AES = {"x", "y"}
+    PARALLEL = "thread"
     DEFAULT_PARAMS = {"geom": "point"}
     DEFAULT_AES = {"size": after_stat("n"), "weight": 1}
     CREATES = {"n", "prop"}
@@ -3,7 +3,7 @@ from typing import cast
 import numpy as np
 import pandas as pd
 
-from .._utils import get_valid_kwargs, uniquecols
+from .._utils import get_random_state, get_valid_kwargs, uniquecols
 from ..doctools import document
 from ..exceptions import PlotnineError
 from .stat import stat
@@ -20,12 +20,13 @@ def bootstrap_statistics(
     Default parameters taken from
     R's Hmisc smean.cl.boot
     """
-    if random_state is None:
-        random_state = np.random
-
+    random_state = get_random_state(random_state)
     alpha = 1 - confidence_interval
     size = (n_samples, len(series))
-    inds = random_state.randint(0, len(series), size=size)
+    if isinstance(random_state, np.random.Generator):
+        inds = random_state.integers(0, len(series), size=size)
+    else:
+        inds = random_state.randint(0, len(series), size=size)
     samples = series.to_numpy()[inds]
     means = np.sort(statistic(samples, axis=1))
     return pd.DataFrame(
@@ -51,9 +52,10 @@ def mean_cl_boot(
         Number of sample to draw.
     confidence_interval : float
         Confidence interval in the range (0, 1).
-    random_state : int | ~numpy.random.RandomState, default=None
+    random_state : int | ~numpy.random.Generator, default=None
         Seed or Random number generator to use. If `None`, then
         numpy global generator [](`numpy.random`) is used.
+        A `RandomState` or a `SeedSequence` are also accepted.
     """
     return bootstrap_statistics(
         series,
@@ -238,9 +240,10 @@ class stat_summary(stat):
         arguments will be assigned to the right functions. If there is
         a conflict, create a wrapper function that resolves the
         ambiguity in the argument names.
-    random_state : int | ~numpy.random.RandomState, default=None
+    random_state : int | ~numpy.random.Generator, default=None
         Seed or Random number generator to use. If `None`, then
         numpy global generator [](`numpy.random`) is used.
+        A `RandomState` or a `SeedSequence` are also accepted.
 
     Notes
     -----
@@ -268,6 +271,7 @@ class stat_summary(stat):
     """
 
     REQUIRED_AES = {"x", "y"}
+    PARALLEL = None
     DEFAULT_PARAMS = {
         "geom": "pointrange",
         "fun_data": "mean_cl_boot",
@@ -291,13 +295,9 @@ class stat_summary(stat):
             "random_state" not in self.params["fun_args"]
             and self.params["random_state"]
         ):
-            random_state = self.params["random_state"]
-            if random_state is None:
-                random_state = np.random
-            elif isinstance(random_state, int):
-                random_state = np.random.RandomState(random_state)
-
-            self.params["fun_args"]["random_state"] = random_state
+            self.params["fun_args"]["random_state"] = get_random_state(
+                self.params["random_state"]
+            )
 
     def compute_panel(self, data, scales):
         func = make_summary_fun(
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, cast
 import numpy as np
 import pandas as pd
 
-from .._utils import groupby_apply
+from .._utils import get_random_state, groupby_apply
 from ..doctools import document
 from ..exceptions import PlotnineWarning
 from ..scales.scale_discrete import scale_discrete
@@ -56,9 +56,10 @@ class stat_summary_bin(stat):
         arguments will be assigned to the right functions. If there is
         a conflict, create a wrapper function that resolves the
         ambiguity in the argument names.
-    random_state : int | ~numpy.random.RandomState, default=None
+    random_state : int | ~numpy.random.Generator, default=None
         Seed or Random number generator to use. If `None`, then
         numpy global generator [](`numpy.random`) is used.
+        A `RandomState` or a `SeedSequence` are also accepted.
 
     Notes
     -----
@@ -88,6 +89,7 @@ class stat_summary_bin(stat):
     """
 
     REQUIRED_AES = {"x", "y"}
+    PARALLEL = None
     DEFAULT_PARAMS = {
         "geom": "pointrange",
         "bins": 30,
@@ -118,13 +120,9 @@ class stat_summary_bin(stat):
             "random_state" not in self.params["fun_args"]
             and self.params["random_state"]
         ):
-            random_state = self.params["random_state"]
-            if random_state is None:
-                random_state = np.random
-            elif isinstance(random_state, int):
-                random_state = np.random.RandomState(random_state)
-
-            self.params["fun_args"]["random_state"] = random_state
+            self.params["fun_args"]["random_state"] = get_random_state(
+                self.params["random_state"]
+            )
 
     def compute_group(self, data, scales):
         bins = self.params["bins"]
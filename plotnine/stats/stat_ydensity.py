@@ -1,12 +1,12 @@
 from contextlib import suppress
+from warnings import warn
 
 import numpy as np
-import pandas as pd
 
 from ..doctools import document
 from ..exceptions import PlotnineError
-from .stat import stat
-from .stat_density import compute_density, stat_density
+from .stat import DROPPED_TPL, stat
+from .stat_density import compute_densities, stat_density
 
 
 @document
@@ -88,6 +88,7 @@ class stat_ydensity(stat):
     e.g. `after_stat('width')`{.py}.
     """
     REQUIRED_AES = {"x", "y"}
+    PARALLEL = "thread"
     NON_MISSING_AES = {"weight"}
     DEFAULT_PARAMS = {
         "geom": "violin",
@@ -143,50 +144,71 @@ class stat_ydensity(stat):
 
     def compute_panel(self, data, scales):
         params = self.params
-        data = super().compute_panel(data, scales)
 
         if not len(data):
-            return data
-
-        if params["scale"] == "area":
-            data["violinwidth"] = data["density"] / data["density"].max()
-        elif params["scale"] == "count":
-            data["violinwidth"] = (
-                data["density"]
-                / data["density"].max()
-                * data["n"]
-                / data["n"].max()
-            )
-        elif params["scale"] == "width":
-            data["violinwidth"] = data["scaled"]
+            return type(data)()
+
+        data = data.sort_values("group", kind="stable", ignore_index=True)
+        group = data["group"].to_numpy()
+        starts = np.hstack([0, np.flatnonzero(np.diff(group)) + 1])
+        sizes = np.diff(np.hstack([starts, len(group)]))
+        # group number of each row, 0 to (number of groups - 1)
+        gidx = np.repeat(np.arange(len(starts)), sizes)
+
+        grouped = data.groupby(gidx)
+        if params["trim"]:
+            ranges = np.column_stack([grouped["y"].min(), grouped["y"].max()])
         else:
-            msg = "Unknown scale value '{}'"
-            raise PlotnineError(msg.format(params["scale"]))
-
-        return data
+            ranges = np.tile(scales.y.dimension(), (len(starts), 1))
 
-    def compute_group(self, data, scales):
-        n = len(data)
-        if n == 0:
-            return pd.DataFrame()
-
-        weight = data.get("weight")
-
-        if self.params["trim"]:
-            range_y = data["y"].min(), data["y"].max()
-        else:
-            range_y = scales.y.dimension()
-
-        dens = compute_density(data["y"], weight, range_y, self.params)
+        dens = compute_densities(
+            data["y"], gidx, ranges, data.get("weight"), params
+        )
 
         if not len(dens):
             return dens
 
+        idx = dens.index.to_numpy()
+        dens = dens.reset_index(drop=True)
+        xmin = grouped["x"].min().to_numpy()
+        xmax = grouped["x"].max().to_numpy()
         dens["y"] = dens["x"]
-        dens["x"] = np.mean([data["x"].min(), data["x"].max()])
+        dens["x"] = ((xmin + xmax) / 2)[idx]
 
         # Compute width if x has multiple values
-        if len(np.unique(data["x"])) > 1:
-            dens["width"] = np.ptp(data["x"]) * 0.9
+        multiple_x = grouped["x"].nunique().to_numpy() > 1
+        if multiple_x.any():
+            width = np.where(multiple_x, (xmax - xmin) * 0.9, np.nan)
+            dens["width"] = width[idx]
+
+        # Carry over the columns that are constant within a group
+        for col in data.columns.difference(dens.columns):
+            constant = grouped[col].nunique(dropna=False).to_numpy() == 1
+            if constant.any():
+                values = data[col].take(starts[idx]).reset_index(drop=True)
+                dens[col] = (
+                    values if constant.all() else values.where(constant[idx])
+                )
+
+        dropped = data.columns.difference(
+            dens.columns.union(self.DROPPED_AES)
+        ).to_list()
+        if dropped:
+            warn(DROPPED_TPL.format(dropped=dropped))
+
+        if params["scale"] == "area":
+            dens["violinwidth"] = dens["density"] / dens["density"].max()
+        elif params["scale"] == "count":
+            dens["violinwidth"] = (
+                dens["density"]
+                / dens["density"].max()
+                * dens["n"]
+                / dens["n"].max()
+            )
+        elif params["scale"] == "width":
+            dens["violinwidth"] = dens["scaled"]
+        else:
+            msg = "Unknown scale value '{}'"
+            raise PlotnineError(msg.format(params["scale"]))
 
         return dens
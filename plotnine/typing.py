@@ -69,6 +69,17 @@ ColorsLike: TypeAlias = (
     ColorLike | list[ColorLike] | pd.Series[ColorLike] | StrArray
 )
 
+# Random numbers
+# A seed, a random number generator or a seed sequence from which a
+# generator is created.
+RandomStateLike: TypeAlias = (
+    int | np.random.RandomState | np.random.Generator | np.random.SeedSequence
+)
+RandomGenerator: TypeAlias = np.random.RandomState | np.random.Generator
+
+# Computing panels in parallel
+ParallelBackend: TypeAlias = Literal["thread", "process"]
+
 # Plotting
 FigureFormat: TypeAlias = Literal["png", "retina", "jpeg", "jpg", "svg", "pdf"]
 
@@ -247,3 +247,22 @@ def test_wrong_bases():
 
     with pytest.warns(PlotnineWarning):
         p.draw_test()
+
+
+def test_annotation_logticks_all_ticks():
+    p = (
+        ggplot(data, aes("x", "x"))
+        + annotation_logticks(sides="bltr")
+        + geom_point()
+        + scale_x_log10()
+        + scale_y_log10()
+    )
+    fig = p.draw()
+    ax = fig.axes[0]
+    ticks = ax.collections[0]
+
+    # Every tick, major, middle & minor, on all 4 sides
+    geom = p.layers[0].geom
+    nx = sum(len(t) for t in geom._calc_ticks(ax.get_xlim(), 10))
+    ny = sum(len(t) for t in geom._calc_ticks(ax.get_ylim(), 10))
+    assert len(ticks.get_segments()) == 2 * nx + 2 * ny
@@ -115,6 +115,41 @@ def test_munch_interpolates_every_position_aesthetic():
         assert np.all(np.diff(values) > 0), f"{column} was not interpolated"
 
 
+def test_munch_does_not_bridge_groups():
+    data = pd.DataFrame(
+        {
+            "x": [0.0, 1.0, 5.0, 6.0],
+            "y": [0.0, 1.0, 5.0, 6.0],
+            "group": [1, 1, 2, 2],
+        }
+    )
+
+    munched = munch_data(data, np.array([0.05, np.nan, 0.05]))
+    group1 = munched[munched["group"] == 1]
+    assert len(group1) == 6
+    assert group1["x"].max() == 1
+
+
+def test_coord_trans_paths_do_not_bridge_groups():
+    # Munching all the groups of a panel together must not subdivide
+    # the gap from one group to the next into points of the first group
+    data = pd.DataFrame(
+        {"x": [1, 2, 8, 9], "y": [1, 2, 8, 9], "g": [1, 1, 2, 2]}
+    )
+    p = (
+        ggplot(data, aes("x", "y", group="g"))
+        + geom_line()
+        + coord_trans(x="log10")
+    )
+    ax = p.draw().axes[0]
+    x = np.hstack(
+        [path.vertices[:, 0] for c in ax.collections for path in c.get_paths()]
+    )
+    in_gap = (np.log10(2) < x) & (x < np.log10(8))
+    assert len(x) > 4
+    assert not in_gap.any()
+
+
 def test_coord_trans_ribbon_edges_curve():
     # A smooth transformed ribbon exposes piecewise-constant `ymin` and
     # `ymax` values as stepped edges.
@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotnine import (
+    aes,
+    coord_cartesian,
+    facet_wrap,
+    geom_aggregate,
+    ggplot,
+    theme,
+)
+from plotnine.exceptions import PlotnineError
+
+n = 20_000
+prg = np.random.RandomState(123)
+data = pd.DataFrame(
+    {
+        "x": prg.normal(size=n),
+        "y": prg.normal(size=n),
+        "w": prg.uniform(size=n),
+        "g": np.repeat(["a", "b"], n // 2),
+    }
+)
+
+
+def test_count():
+    p = (
+        ggplot(data, aes("x", "y"))
+        + geom_aggregate(pixels=(50, 40))
+        + theme(figure_size=(4, 3))
+    )
+    out = p.layer_data()
+
+    # All points are counted, each in one of the pixels
+    assert out["count"].sum() == n
+    assert (out["value"] == out["count"]).all()
+    assert out["x"].nunique() <= 50
+    assert out["y"].nunique() <= 40
+
+    fig = p.draw()
+    ax = fig.axes[0]
+    assert len(ax.images) == 1
+    assert len(ax.collections) == 0
+
+
+def test_sum_and_mean():
+    p = ggplot(data, aes("x", "y", weight="w"))
+    out_sum = (p + geom_aggregate(fun="sum")).layer_data()
+    out_mean = (p + geom_aggregate(fun="mean")).layer_data()
+
+    assert out_sum["value"].sum() == pytest.approx(data["w"].sum())
+    np.testing.assert_allclose(
+        out_mean["value"], out_sum["value"] / out_sum["count"]
+    )
+
+
+def test_pixels_from_panel_size():
+    p = ggplot(data, aes("x", "y")) + theme(figure_size=(2, 1), dpi=100)
+    out = (p + geom_aggregate()).layer_data()
+    out_facets = (p + geom_aggregate() + facet_wrap("g")).layer_data()
+
+    # At most one cell per pixel of the panel, the panels of the
+    # facets are half as wide
+    assert out["x"].nunique() <= 200
+    assert out["y"].nunique() <= 100
+    assert out_facets["x"].nunique() <= 100
+    assert set(out_facets["PANEL"]) == {1, 2}
+
+
+def test_coord_limits():
+    p = (
+        ggplot(data, aes("x", "y"))
+        + geom_aggregate(pixels=(50, 50))
+        + coord_cartesian(xlim=(-1, 1))
+    )
+    out = p.layer_data()
+
+    # Only the points in the panel are counted, onto the pixels of
+    # the zoomed-in panel
+    assert out["xmin"].min() >= -1.2
+    assert out["xmax"].max() <= 1.2
+    assert out["x"].nunique() > 40
+
+
+def test_bins_line_up_with_pixels():
+    df = data[(data["x"] > 0.33) & (data["y"] > 0.33)]
+    p = (
+        ggplot(df, aes("x", "y"))
+        + geom_aggregate(pixels=(20, 20))
+        + coord_cartesian(xlim=(-1, 1), ylim=(-1, 1), expand=False)
+    )
+    out = p.layer_data()
+
+    # The pixels are 0.1 wide from the edge of the panel at -1, the
+    # lowest values do not start a pixel of their own
+    for col in ("xmin", "xmax", "ymin", "ymax"):
+        pos = (out[col] + 1) / 0.1
+        np.testing.assert_allclose(pos, pos.round(), atol=1e-9)
+    assert out["xmin"].min() == pytest.approx(0.3)
+
+
+def test_discrete_axis():
+    p = ggplot(data, aes("g", "y")) + geom_aggregate()
+    with pytest.raises(PlotnineError):
+        p.layer_data()
+
+
+def test_unknown_fun():
+    p = ggplot(data, aes("x", "y")) + geom_aggregate(fun="median")
+    with pytest.raises(PlotnineError):
+        p.layer_data()
@@ -0,0 +1,153 @@
+"""
+The geoms draw all the groups of a panel with a few artists
+
+The number of artists does not grow with the number of groups, only
+the number of paths, segments or markers in each. What the artists
+look like is checked by the image tests of each geom.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.collections import Collection
+
+from plotnine import (
+    aes,
+    arrow,
+    geom_boxplot,
+    geom_dotplot,
+    geom_hline,
+    geom_label,
+    geom_map,
+    geom_path,
+    geom_point,
+    geom_ribbon,
+    geom_rug,
+    geom_text,
+    geom_violin,
+    ggplot,
+)
+from plotnine._mpl.text import TextCollection
+
+
+def make_data(n):
+    """
+    n groups of 10 points, with 2 outliers in each group
+    """
+    return pd.DataFrame(
+        {
+            "x": np.tile(np.arange(10), n),
+            "y": np.tile([-20, 1, 2, 3, 4, 5, 6, 7, 8, 30], n)
+            + 100 * np.repeat(np.arange(n), 10),
+            "g": np.repeat(np.arange(n), 10),
+        }
+    )
+
+
+def make_map(n):
+    from geopandas import GeoDataFrame
+    from shapely.geometry import box
+
+    return GeoDataFrame(
+        {"g": np.arange(n)},
+        geometry=[box(i, 0, i + 0.5, 1) for i in range(n)],
+    )
+
+
+def artist_sizes(ax):
+    """
+    The number of things drawn by each artist of the panel
+    """
+    sizes = []
+    for artist in [*ax.collections, *ax.artists]:
+        if isinstance(artist, TextCollection):
+            sizes.append(len(artist))
+        elif isinstance(artist, Collection):
+            sizes.append(
+                max(len(artist.get_paths()), len(artist.get_offsets()))
+            )
+    return sizes
+
+
+# geom: (plot of n groups, the sizes of the artists for n groups)
+cases = {
+    "path": (
+        lambda n: ggplot(make_data(n), aes("x", "y", group="g")) + geom_path(),
+        lambda n: [n],
+    ),
+    "path_arrow": (
+        lambda n: (
+            ggplot(make_data(n), aes("x", "y", group="g"))
+            + geom_path(arrow=arrow(ends="both"))
+        ),
+        lambda n: [n, 2 * n],
+    ),
+    "point": (
+        lambda n: (
+            ggplot(make_data(n), aes("x", "y", shape="factor(x % 2)"))
+            + geom_point()
+        ),
+        lambda n: [5 * n, 5 * n],
+    ),
+    "hline": (
+        lambda n: (
+            ggplot(make_data(n))
+            + geom_hline(aes(yintercept="y", linetype="factor(g % 2)"))
+        ),
+        lambda n: [10 * n],
+    ),
+    "rug": (
+        lambda n: (
+            ggplot(make_data(n), aes("x", "y", color="factor(g)"))
+            + geom_rug(sides="tblr")
+        ),
+        lambda n: [4 * 10 * n],
+    ),
+    "ribbon": (
+        lambda n: (
+            ggplot(make_data(n), aes("x", ymin="y", ymax="y+1", group="g"))
+            + geom_ribbon(color="black")
+        ),
+        # The fill, the lower & the upper outlines
+        lambda n: [n, n, n],
+    ),
+    "violin": (
+        lambda n: (
+            ggplot(make_data(n), aes("factor(g)", "y"))
+            + geom_violin(draw_quantiles=[0.25, 0.5, 0.75])
+        ),
+        # Each violin & its 3 quantiles
+        lambda n: [4 * n],
+    ),
+    "boxplot": (
+        lambda n: ggplot(make_data(n), aes("factor(g)", "y")) + geom_boxplot(),
+        # The outliers, whiskers, boxes & middles
+        lambda n: [2 * n, 2 * n, n, n],
+    ),
+    "dotplot": (
+        lambda n: ggplot(make_data(n), aes("y")) + geom_dotplot(bins=10),
+        lambda n: [10 * n],
+    ),
+    "text": (
+        lambda n: ggplot(make_data(n), aes("x", "y", label="g")) + geom_text(),
+        lambda n: [10 * n],
+    ),
+    "label": (
+        lambda n: (
+            ggplot(make_data(n), aes("x", "y", label="g")) + geom_label()
+        ),
+        lambda n: [10 * n],
+    ),
+    "map": (
+        lambda n: ggplot(make_map(n)) + geom_map(aes(fill="g")),
+        lambda n: [n],
+    ),
+}
+
+
+@pytest.mark.parametrize("geom", cases)
+def test_artists_do_not_grow_with_groups(geom):
+    make_plot, expected_sizes = cases[geom]
+    for n in (3, 12):
+        ax = make_plot(n).draw().axes[0]
+        assert artist_sizes(ax) == expected_sizes(n)
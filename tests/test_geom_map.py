@@ -124,3 +124,33 @@ def test_facet_wrap():
         + labs(fill="miny")
     )
     assert p == "facet_wrap"
+
+
+def test_polygon_paths():
+    from matplotlib.path import Path
+
+    from plotnine.geoms.geom_map import polygon_paths
+
+    def signed_area(v):
+        x, y = v[:, 0], v[:, 1]
+        return (x * np.roll(y, -1) - np.roll(x, -1) * y).sum() / 2
+
+    square = [(0, 0), (0, 4), (4, 4), (4, 0)]
+    hole = [(1, 1), (2, 1), (2, 2), (1, 2)]
+    geometry = [
+        Polygon(square[::-1], [hole[::-1]]),
+        MultiPolygon([Polygon(square), Polygon(hole)]),
+    ]
+    paths = polygon_paths(geometry)
+    assert len(paths) == 2
+
+    # One subpath per ring, shells clockwise and holes counter-clockwise
+    subpaths = [
+        np.split(p.vertices, np.flatnonzero(p.codes == Path.MOVETO)[1:])
+        for p in paths
+    ]
+    assert [len(s) for s in subpaths] == [2, 2]
+    assert signed_area(subpaths[0][0]) < 0
+    assert signed_area(subpaths[0][1]) > 0
+    assert signed_area(subpaths[1][0]) < 0
+    assert signed_area(subpaths[1][1]) < 0
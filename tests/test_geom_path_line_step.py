@@ -141,3 +141,26 @@ def test_groups_less_that_two_points():
         aes(x="A", y="C", group="B", color="D"), size=2
     )
     p.draw_test()
+
+
+def test_arrow_heads_at_path_ends():
+    n = 20
+    df = pd.DataFrame(
+        {
+            "x": np.tile([0, 1, 2], n),
+            "y": np.arange(3 * n),
+            "g": np.repeat(np.arange(n), 3),
+        }
+    )
+    p = ggplot(df, aes("x", "y", group="g")) + geom_path(
+        arrow=arrow(ends="both")
+    )
+    fig = p.draw()
+    heads = fig.axes[0].collections[1].get_paths()
+
+    # The point of each head is at the end of a path
+    points = np.array([h.vertices[1] for h in heads])
+    ends = df.groupby("g").nth([0, -1])[["x", "y"]].to_numpy()
+    np.testing.assert_allclose(
+        np.unique(points, axis=0), np.unique(ends, axis=0)
+    )
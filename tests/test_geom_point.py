@@ -5,6 +5,7 @@ import pandas as pd
 
 from plotnine import (
     aes,
+    after_scale,
     coord_equal,
     geom_point,
     ggplot,
@@ -125,6 +126,30 @@ class TestColorFillonUnfilledShape:
         assert p == "color_only_mapping"
 
 
+def test_constant_aesthetics():
+    data = pd.DataFrame({"x": range(5), "y": range(5), "z": list("aabbc")})
+    p = ggplot(data, aes("x", "y", color="z")) + geom_point(size=3)
+    p._build()
+
+    # The aesthetics with one value are kept out of the data
+    lyr = p.layers[0]
+    assert {"size", "shape", "alpha"}.isdisjoint(lyr.data.columns)
+    assert "color" in lyr.data
+    assert lyr.geom.params["constant_aes"]["size"] == 3
+
+    # For the user, they are columns like the others
+    out = (
+        ggplot(data, aes("x", "y", color="z")) + geom_point(size=3)
+    ).layer_data()
+    assert (out["size"] == 3).all()
+    assert (out["shape"] == "o").all()
+
+    # After scale modifications are done on columns
+    p = ggplot(data, aes("x", "y", fill=after_scale("color"))) + geom_point()
+    out = p.layer_data()
+    assert (out["fill"] == "black").all()
+
+
 def test_custom_shapes():
     n = 26
     shapes = [rf"$\mathrm{{{x}}}$" for x in string.ascii_uppercase]
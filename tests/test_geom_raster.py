@@ -49,3 +49,22 @@ def test_gap_with_interpolation():
     # Warns about uneven vertical intervals
     with pytest.warns(PlotnineWarning):
         assert p == "gap_with_interpolation"
+
+
+def test_large_raster_is_shrunk():
+    n = 3000
+    data = pd.DataFrame(
+        {
+            "x": np.tile(np.arange(n), 10),
+            "y": np.repeat(np.arange(10), n),
+            "z": np.tile(np.arange(n) % 2, 10),
+        }
+    )
+    p = ggplot(data, aes("x", "y", fill="z")) + geom_raster()
+    fig = p.draw()
+    im = fig.axes[0].images[0]
+    X = im.get_array()
+    assert X.dtype == np.uint8
+    assert X.shape[0] == 10
+    assert X.shape[1] < n // 2
+    assert im.get_extent()[:2] == pytest.approx((-0.5, n - 0.5), abs=5)
@@ -165,3 +165,55 @@ def test_coord_trans_groups():
         + coord_trans()
     )
     assert p == "coord-trans-groups"
+
+
+def test_coord_trans_one_collection():
+    from matplotlib.collections import PolyCollection
+
+    p = (
+        ggplot(data, aes(xmin="xmin", xmax="xmax", ymin="ymin", ymax="ymax"))
+        + geom_rect(aes(fill="factor(z)"))
+        + coord_trans()
+    )
+    colls = p.draw().axes[0].collections
+    assert len(colls) == 1
+    assert isinstance(colls[0], PolyCollection)
+    assert len(colls[0].get_paths()) == n
+
+
+def test_tile_grid_is_quadmesh():
+    from matplotlib.collections import PolyCollection, QuadMesh
+
+    grid = pd.DataFrame(
+        {
+            "x": np.tile([1, 2, 3], 4),
+            "y": np.repeat([1, 2, 3, 4], 3),
+            "z": range(12),
+        }
+    )
+    shuffled = grid.sample(frac=1, random_state=123)
+    p = ggplot(shuffled, aes("x", "y", fill="z")) + geom_tile()
+    mesh = p.draw().axes[0].collections[0]
+    assert isinstance(mesh, QuadMesh)
+    assert mesh.get_coordinates().shape == (5, 4, 2)
+
+    # The cells are filled in row-major order, whatever the data order
+    p = ggplot(grid, aes("x", "y", fill="z")) + geom_tile()
+    expected = p.draw().axes[0].collections[0]
+    assert np.array_equal(mesh.get_facecolor(), expected.get_facecolor())
+    assert len(np.unique(mesh.get_facecolor(), axis=0)) == 12
+
+    # An incomplete grid is drawn as rectangles
+    fig = (ggplot(grid.iloc[1:], aes("x", "y")) + geom_tile()).draw()
+    assert isinstance(fig.axes[0].collections[0], PolyCollection)
+
+    # Tiles at a tiny scale with a gap between them are not a grid
+    tiny = pd.DataFrame({"x": [0, 1e-9, 2.3e-9], "y": 0})
+    fig = (ggplot(tiny, aes("x", "y")) + geom_tile()).draw()
+    assert isinstance(fig.axes[0].collections[0], PolyCollection)
+
+    # Outlines are antialiased
+    p = ggplot(grid, aes("x", "y", fill="z")) + geom_tile(color="black")
+    mesh = p.draw().axes[0].collections[0]
+    assert isinstance(mesh, QuadMesh)
+    assert mesh.get_antialiased()
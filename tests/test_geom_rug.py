@@ -37,3 +37,12 @@ def test_coord_flip():
     )
 
     assert p == "coord_flip"
+
+
+def test_same_colors_on_all_sides():
+    p = ggplot(data, aes("x", "y", color="factor(z)")) + geom_rug(sides="tblr")
+    fig = p.draw()
+
+    # The marks of all the points on one side, then on the next
+    colors = fig.axes[0].collections[0].get_edgecolor()
+    np.testing.assert_array_equal(colors[:n], colors[n : 2 * n])
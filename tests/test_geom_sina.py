@@ -78,3 +78,32 @@ def test_style():
     )
 
     assert p == "style"
+
+
+def test_groups_computed_independently():
+    # The densities of all the groups are computed together, each
+    # group must get the same result as when it is alone.
+    together = (
+        ggplot(data, aes("dist", "value")) + geom_sina(random_state=123)
+    ).layer_data()
+
+    for i, cat in enumerate(cats, start=1):
+        alone = (
+            ggplot(data[data["dist"] == cat], aes("dist", "value"))
+            + geom_sina(random_state=123)
+        ).layer_data()
+        part = together[together["group"] == i]
+        np.testing.assert_allclose(part["density"], alone["density"])
+        np.testing.assert_allclose(part["scaled"], alone["scaled"])
+
+
+def test_density_does_not_depend_on_scale():
+    # The groups are estimated together, tiny values must not lose
+    # precision to the other groups
+    tiny = data.assign(value=data["value"] * 1e-12)
+    p1 = ggplot(data, aes("dist", "value")) + geom_sina(random_state=123)
+    p2 = ggplot(tiny, aes("dist", "value")) + geom_sina(random_state=123)
+
+    np.testing.assert_allclose(
+        p1.layer_data()["scaled"], p2.layer_data()["scaled"]
+    )
@@ -13,6 +13,7 @@ from plotnine import (
     scale_size_continuous,
     scale_y_continuous,
 )
+from plotnine._mpl.text import TextCollection, non_overlapping
 from plotnine.data import mtcars
 from plotnine.exceptions import PlotnineWarning
 
@@ -150,3 +151,41 @@ def test_format_missing_values():
     )
     with pytest.warns(PlotnineWarning):
         assert p == "format_missing_values"
+
+
+def test_text_collection_extent():
+    p = ggplot(data, aes("x", "y", label="label")) + geom_text()
+    fig = p.draw()
+    ax = fig.axes[0]
+    assert not ax.texts
+
+    # The extent covers all the texts
+    (collection,) = ax.artists
+    bbox = collection.get_window_extent()
+    assert bbox.height > ax.bbox.height / 2
+
+
+def test_non_overlapping():
+    extents = np.array(
+        [
+            [0, 0, 10, 5],
+            [5, 2, 15, 7],  # overlaps 0
+            [10, 0, 20, 5],  # touches 0
+            [12, 4, 30, 9],  # overlaps 2
+            [np.nan, 0, 10, 5],
+            [-20, -20, 40, 1],  # overlaps 0 and 2
+            [25, 20, 30, 25],
+        ]
+    )
+    assert non_overlapping(extents) == [0, 2, 6]
+    assert non_overlapping(np.zeros((0, 4))) == []
+
+
+def test_check_overlap():
+    df = pd.DataFrame({"x": [1, 1.001, 2, 1.002], "y": [1, 1, 2, 1]})
+    p = ggplot(df, aes("x", "y", label="x")) + geom_text(check_overlap=True)
+    fig = p.draw()
+    ax = fig.axes[0]
+    (collection,) = [a for a in ax.artists if isinstance(a, TextCollection)]
+    renderer = fig._get_renderer()  # pyright: ignore[reportAttributeAccessIssue]
+    assert list(collection._get_indices(renderer)) == [0, 2]
@@ -152,3 +152,24 @@ def test_quantile_aesthetics():
         quantile_linetype=(0, (4, 4, 1, 4)),
     )
     assert p == "quantile_aesthetics"
+
+
+def test_violin_and_quantile_order():
+    p = ggplot(data, aes("x", "y")) + geom_violin(
+        draw_quantiles=[0.25, 0.5, 0.75]
+    )
+    fig = p.draw()
+
+    # Each violin followed by its quantiles, the violins of the later
+    # groups first so that those of the earlier groups are on top
+    paths = fig.axes[0].collections[0].get_paths()
+    outlines = paths[::4]
+    centers = [path.vertices[:, 0].mean() for path in outlines]
+    assert centers == sorted(centers, reverse=True)
+
+    # The quantiles are in order & within the violins
+    for i, outline in enumerate(outlines):
+        quantiles = paths[4 * i + 1 : 4 * i + 4]
+        ys = [path.vertices[0, 1] for path in quantiles]
+        ymin, ymax = outline.vertices[:, 1].min(), outline.vertices[:, 1].max()
+        assert ymin < ys[0] < ys[1] < ys[2] < ymax
@@ -11,11 +11,14 @@ from plotnine import (
     annotate,
     coord_trans,
     facet_null,
+    facet_wrap,
     geom_bar,
     geom_col,
     geom_histogram,
     geom_line,
     geom_point,
+    geom_rect,
+    geom_smooth,
     ggplot,
     ggtitle,
     guides,
@@ -33,6 +36,7 @@ from plotnine import (
 )
 from plotnine.exceptions import PlotnineError, PlotnineWarning
 from plotnine.mapping.aes import RepeatAesthetic
+from plotnine.options import set_option
 
 data = pd.DataFrame({"x": np.arange(10), "y": np.arange(10)})
 
@@ -425,3 +429,98 @@ def test_pickle_matplotlib_figure():
     p = ggplot(data, aes("x", "y")) + geom_point()
     fig = p.draw()
     pickle_and_unpickle(fig)
+
+
+def test_parallel_panels():
+    df = pd.DataFrame(
+        {
+            "x": np.tile(np.arange(20), 4),
+            "y": np.arange(80) % 7,
+            "g": np.repeat(list("abcd"), 20),
+        }
+    )
+    p = (
+        ggplot(df, aes("x", "y"))
+        + geom_bar(aes(fill="g"), stat="identity")
+        + geom_smooth(method="lm")
+        + facet_wrap("g")
+    )
+
+    p2 = deepcopy(p)
+    p._build()
+    set_option("n_jobs", 2)
+    try:
+        p2._build()
+    finally:
+        set_option("n_jobs", 1)
+
+    for l1, l2 in zip(p.layers, p2.layers):
+        pd.testing.assert_frame_equal(l1.data, l2.data)
+
+    # Each panel is timed for both stats and the stacking
+    timings = p2._build_objs.meta["panel_timings"]
+    assert len(timings) == 4 * 3
+    assert {t.name for t in timings} == {
+        "stat_identity",
+        "stat_smooth",
+        "position_stack",
+    }
+    assert {t.panel for t in timings} == {1, 2, 3, 4}
+
+
+def test_parallel_panels_own_params():
+    # The rectangles of each panel are dodged within their own width
+    df = pd.DataFrame(
+        {
+            "xmin": [0, 0, 10, 10],
+            "xmax": [1, 1, 10.2, 10.2],
+            "ymax": [1, 2, 1, 2],
+            "g": list("abab"),
+            "p": list("uuvv"),
+        }
+    )
+    p = (
+        ggplot(df)
+        + geom_rect(
+            aes(xmin="xmin", xmax="xmax", ymin=0, ymax="ymax", fill="g"),
+            position="dodge",
+        )
+        + facet_wrap("p", scales="free_x")
+    )
+
+    set_option("n_jobs", 2)
+    try:
+        ld = p.layer_data()
+    finally:
+        set_option("n_jobs", 1)
+
+    panel2 = ld[ld["PANEL"] == 2]
+    np.testing.assert_allclose(panel2["xmin"].min(), 10)
+    np.testing.assert_allclose(panel2["xmax"].max(), 10.2)
+
+
+def test_parallel_panels_opt_in():
+    # Stats and positions that do not opt in compute their panels
+    # one after the other, in the main thread
+    from threading import get_ident
+
+    from plotnine.stats.stat import stat
+
+    class stat_record_thread(stat):
+        REQUIRED_AES = {"x", "y"}
+
+        def compute_panel(self, data, scales):
+            self.params.setdefault("threads", set()).add(get_ident())
+            return data
+
+    df = pd.DataFrame({"x": range(8), "y": range(8), "p": list("aabbccdd")})
+    s = stat_record_thread(geom="point")
+    p = ggplot(df, aes("x", "y")) + s + facet_wrap("p")
+
+    set_option("n_jobs", 4)
+    try:
+        p._build()
+    finally:
+        set_option("n_jobs", 1)
+
+    assert p.layers[0].stat.params["threads"] == {get_ident()}
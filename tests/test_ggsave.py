@@ -1,4 +1,5 @@
 import warnings
+from io import BytesIO
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -91,6 +92,43 @@ class TestArguments:
         set_option("limitsize", True)
         assert_exist_and_clean(fn2, "big height and width")
 
+    def test_raster_threshold(self):
+        p = (
+            ggplot(mtcars, aes("wt", "mpg", label="name"))
+            + geom_point()
+            + geom_text()
+        )
+
+        def svg(**kwargs):
+            buf = BytesIO()
+            p.save(buf, format="svg", verbose=False, **kwargs)
+            return buf.getvalue().decode()
+
+        assert "<image" not in svg()
+        assert "<image" in svg(raster_threshold=10)
+
+        # Using the global option, the text remains vector
+        set_option("raster_threshold", 10)
+        try:
+            p.draw()
+        finally:
+            set_option("raster_threshold", None)
+
+        point, text = p._build_objs.meta["layer_rasters"]
+        assert (point.geom, point.size, point.rasterized) == (
+            "geom_point",
+            32,
+            True,
+        )
+        assert (text.geom, text.size, text.rasterized) == (
+            "geom_text",
+            0,
+            False,
+        )
+        assert all(not t.get_rasterized() for t in p.axs[0].texts)
+        assert p.axs[0].collections[0].get_rasterized()
+        plt.close("all")
+
     def test_dpi_theme_xkcd(self):
         data = pd.DataFrame({"x": range(4), "y": range(4), "b": list("aabb")})
 
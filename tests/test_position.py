@@ -12,6 +12,7 @@ from plotnine import (
     geom_col,
     geom_jitter,
     geom_point,
+    geom_pointrange,
     geom_rect,
     geom_segment,
     geom_text,
@@ -68,6 +69,17 @@ def test_jitter():
         geom_jitter(position=position_jitter(), width=0.1)
 
 
+def test_jitter_moves_ranges_with_points():
+    data = pd.DataFrame({"x": [1, 2, 3], "y": [2, 3, 4]})
+    p = ggplot(data, aes("x", "y", ymin="y-1", ymax="y+1")) + geom_pointrange(
+        position=position_jitter(width=0.3, height=0.3, random_state=1)
+    )
+    ld = p.layer_data()
+    np.testing.assert_allclose(ld["y"] - ld["ymin"], 1)
+    np.testing.assert_allclose(ld["ymax"] - ld["y"], 1)
+    assert (ld["x"] != data["x"]).all()
+
+
 def test_nudge():
     p = (
         ggplot(data1, aes("x", "y"))
@@ -101,6 +113,31 @@ def test_stack_negative():
     assert p == "stack-negative"
 
 
+def test_stack_values():
+    data = pd.DataFrame(
+        {
+            "x": [1, 1, 1, 1, 2, 2],
+            "y": [1, -2, 3, -4, 5, 6],
+            "g": ["a", "b", "c", "d", "a", "b"],
+        }
+    )
+    p = ggplot(data, aes("x", "y", fill="g")) + geom_col()
+
+    # Negative values are stacked apart from the positive ones and
+    # the groups are stacked in reverse order.
+    out = p.layer_data().sort_values(["x", "group"])
+    assert out["ymin"].tolist() == [3, -6, 0, -4, 6, 0]
+    assert out["ymax"].tolist() == [4, -4, 3, 0, 11, 6]
+
+    out = (
+        (p + geom_col(position=position_stack(vjust=0.5, reverse=True)))
+        .layer_data(1)
+        .sort_values(["x", "group"])
+    )
+    assert out["ymin"].tolist() == [0, -2, 1, -6, 0, 5]
+    assert out["y"].tolist() == [0.5, -1, 2.5, -4, 2.5, 8]
+
+
 def test_stack_non_linear_scale():
     data = pd.DataFrame(
         {
@@ -222,6 +259,19 @@ def test_dodge2_preserve_single_interval():
     assert p == "dodge2_preserve_single_interval"
 
 
+def test_dodge2_integer_intervals():
+    data = pd.DataFrame(
+        {"x": [1, 1, 3, 3], "x2": [2, 3, 4, 4], "y": [1, 2, 3, 4]}
+    )
+
+    p = ggplot(data, aes(xmin="x", xmax="x2", ymin=0, ymax="y")) + geom_rect(
+        position="dodge2"
+    )
+    out = p.layer_data()
+    assert out["xmin"].tolist() == pytest.approx([1.275, 1.8, 3.025, 3.525])
+    assert out["xmax"].tolist() == pytest.approx([1.725, 2.7, 3.475, 3.975])
+
+
 def test_jitterdodge():
     data = pd.DataFrame(
         {
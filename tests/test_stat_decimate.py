@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotnine import (
+    aes,
+    coord_cartesian,
+    coord_flip,
+    facet_wrap,
+    geom_line,
+    ggplot,
+    theme,
+)
+from plotnine.exceptions import PlotnineError
+from plotnine.iapi import pos_scales
+from plotnine.stats import stat_decimate
+
+n = 100_000
+rng = np.random.default_rng(123)
+data = pd.DataFrame(
+    {
+        "x": np.arange(n),
+        "y": np.cumsum(rng.normal(size=n)),
+        "g": np.repeat(["a", "b"], n // 2),
+    }
+)
+
+
+def test_minmax():
+    p = ggplot(data, aes("x", "y")) + geom_line(stat="decimate", n=100)
+    out = p.layer_data()
+
+    assert len(out) <= 4 * 100
+    assert out["x"].is_monotonic_increasing
+    # The extremes & ends of the series are kept
+    assert out["y"].min() == data["y"].min()
+    assert out["y"].max() == data["y"].max()
+    assert out["x"].iloc[0] == 0
+    assert out["x"].iloc[-1] == n - 1
+
+
+def test_lttb():
+    p = ggplot(data, aes("x", "y")) + geom_line(
+        stat="decimate", method="lttb", n=100
+    )
+    out = p.layer_data()
+
+    assert len(out) <= 100 + 2
+    assert out["x"].is_monotonic_increasing
+    assert out["x"].iloc[0] == 0
+    assert out["x"].iloc[-1] == n - 1
+
+
+def test_buckets_from_panel_width():
+    p = (
+        ggplot(data, aes("x", "y"))
+        + geom_line(stat="decimate")
+        + theme(figure_size=(4, 3), dpi=100)
+    )
+    out1 = p.layer_data()
+    out2 = (p + facet_wrap("g")).layer_data()
+
+    # 400 pixels across the panel, 200 across each of the facets
+    assert 3 * 400 < len(out1) <= 4 * 400
+    assert len(out2) <= 2 * 4 * 200
+    assert set(out2["PANEL"]) == {1, 2}
+
+
+def test_short_series_unchanged():
+    df = data.iloc[:50]
+    p = ggplot(df, aes("x", "y")) + geom_line(stat="decimate")
+    out = p.layer_data()
+    assert len(out) == 50
+
+
+def test_unknown_method():
+    p = ggplot(data, aes("x", "y")) + geom_line(stat="decimate", method="x")
+    with pytest.raises(PlotnineError):
+        p.layer_data()
+
+
+def test_buckets_from_panel_height_when_flipped():
+    p = (
+        ggplot(data, aes("x", "y"))
+        + geom_line(stat="decimate")
+        + coord_flip()
+        + theme(figure_size=(8, 2), dpi=100)
+    )
+    out = p.layer_data()
+
+    # x is along the 200 pixels of the height, not the 800 of the width
+    assert len(out) <= 4 * 200
+
+
+def test_missing_values_are_kept():
+    # Without a bucket the missing values cannot be decimated, they
+    # are kept where they are
+    df = data.assign(group=1, PANEL=1)
+    df.loc[[10, 5000, 60000], "x"] = np.nan
+    df.loc[20000, "y"] = np.nan
+    s = stat_decimate(n=100)
+    s.coord = coord_cartesian()
+    out = s.compute_panel(df, pos_scales(None, None))
+
+    assert len(out) <= 4 * 100 + 4
+    assert out["x"].isna().sum() == 3
+    assert out["y"].isna().sum() == 1
+    assert out["x"].dropna().is_monotonic_increasing
+
+
+def test_buckets_from_coord_limits():
+    df = data.iloc[:2000].assign(x=lambda d: d["x"] / 20)
+    p = (
+        ggplot(df, aes("x", "y"))
+        + geom_line(stat="decimate")
+        + coord_cartesian(xlim=(0, 10))
+        + theme(figure_size=(4, 3), dpi=100)
+    )
+    out = p.layer_data()
+
+    # The ~400 buckets are across the zoomed-in panel, so none of
+    # the 201 points in it are dropped
+    inside = (df["x"] >= 0) & (df["x"] <= 10)
+    out_inside = (out["x"] >= 0) & (out["x"] <= 10)
+    assert out_inside.sum() == inside.sum()
+    # The points just outside the panel are kept
+    assert out["x"][~out_inside].min() < 10.1
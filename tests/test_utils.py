@@ -9,11 +9,15 @@ import pandas as pd
 from plotnine._utils import (
     _margins,
     add_margins,
+    jitter,
     join_keys,
     match,
     ninteraction,
     pivot_apply,
     remove_missing,
+    scalar_if_constant,
+    to_rgba,
+    to_rgba_array,
     uniquecols,
 )
 from plotnine.data import mtcars
@@ -218,6 +222,21 @@ def test_match():
     assert list(match(v1, v3)) == [1, 1, 2, 2, -1, -1]
 
 
+def test_match_options():
+    # The first of repeated values is matched
+    assert list(match(["b", "a", "c"], ["a", "b", "a", "b"])) == [1, 0, -1]
+    assert list(match([3, 1, 5], [1, 2, 3], start=1)) == [3, 1, -1]
+    assert list(match([3, 1, 5], [1, 2, 3], nomatch=0, start=1)) == [3, 1, 0]
+    assert list(match([1, 2], [1, 2], nomatch=9, incomparables=[2])) == [0, 9]
+
+
+def test_match_empty():
+    assert list(match([1, 2, 3], [])) == [-1, -1, -1]
+    assert list(match([1, 2, 3], [], nomatch=0)) == [0, 0, 0]
+    assert list(match([], [1, 2])) == []
+    assert list(match([], [])) == []
+
+
 def test_uniquecols():
     data = pd.DataFrame(
         {
@@ -249,6 +268,18 @@ def test_remove_missing():
         assert len(w) == 1
 
 
+def test_remove_missing_does_not_copy():
+    data = pd.DataFrame({"a": [1.0, 2, np.inf], "b": [1, 2, 3]})
+
+    # Nothing to remove, the same data comes back
+    assert remove_missing(data) is data
+
+    # The infinite values are removed from the result, not the input
+    res = remove_missing(data, na_rm=True, finite=True)
+    assert len(res) == 2
+    assert np.isinf(data["a"].iloc[2])
+
+
 def test_pivot_apply():
     data = pd.DataFrame(
         {
@@ -264,3 +295,77 @@ def test_pivot_apply():
     assert res1.index.tolist() == list("abc")
     assert res1.index.name == "id"
     assert (res1 + res2 == [12, 24, 36]).all()
+
+
+def test_jitter():
+    x = np.arange(10.0)
+
+    # A seed and a RandomState made from it give the same jitter
+    out1 = jitter(x, amount=0.2, random_state=123)
+    out2 = jitter(x, amount=0.2, random_state=np.random.RandomState(123))
+    np.testing.assert_array_equal(out1, out2)
+    assert np.all(np.abs(out1 - x) <= 0.2)
+
+    # Generators and seed sequences
+    out1 = jitter(x, amount=0.2, random_state=np.random.default_rng(123))
+    out2 = jitter(x, amount=0.2, random_state=np.random.SeedSequence(123))
+    np.testing.assert_array_equal(out1, out2)
+    assert np.all(np.abs(out1 - x) <= 0.2)
+
+    # All columns at once is the same as one column after the other
+    x2 = np.column_stack([x, x * 10])
+    out = jitter(x2, amount=[0.2, 2], random_state=123)
+    rs = np.random.RandomState(123)
+    np.testing.assert_array_equal(out[:, 0], jitter(x, 1, 0.2, rs))
+    np.testing.assert_array_equal(out[:, 1], jitter(x * 10, 1, 2, rs))
+
+    # Automatic amount
+    out = jitter(x, random_state=123)
+    assert np.all(np.abs(out - x) <= 0.2)
+    assert np.any(out != x)
+
+
+def test_to_rgba():
+    import mizani._colors.utils as color_utils
+    from matplotlib.colors import to_rgba as mpl_to_rgba
+
+    colors = pd.Series(
+        ["red", "#112233", None, "none", (0.1, 0.2, 0.3), "#11223344"] * 3
+    )
+    alpha = pd.Series([0.5, 1, 1, 1, 0.3, 0.6] * 3)
+
+    # Same results as converting each color
+    expected = [color_utils.to_rgba(c, a) for c, a in zip(colors, alpha)]
+    assert to_rgba(colors, alpha) == expected
+    assert to_rgba(colors, 0.5) == color_utils.to_rgba(colors, 0.5)
+    assert to_rgba("red", 0.5) == "#FF000080"
+    assert to_rgba(None, 1) == "none"
+
+    # As an array, colors that are not drawn are transparent
+    arr = to_rgba_array(colors, alpha)
+    assert arr.shape == (18, 4)
+    for row, c in zip(arr, expected):
+        assert tuple(row) == (mpl_to_rgba(c) if c != "none" else (0,) * 4)
+
+    assert to_rgba_array("red", 1).shape == (1, 4)
+    assert to_rgba_array([], 1).shape == (0, 4)
+
+
+def test_scalar_if_constant():
+    from plotnine import aes, geom_point, ggplot
+
+    assert scalar_if_constant(pd.Series([2.5] * 3)) == 2.5
+    assert scalar_if_constant(pd.Series(["a", "a"])) == "a"
+    assert list(scalar_if_constant(pd.Series([1, 2]))) == [1, 2]
+    assert scalar_if_constant(2.5) == 2.5
+    assert scalar_if_constant(np.asarray(2.5)) == 2.5
+
+    # In the layer data, the constant aesthetics are ordinary columns,
+    # they can be modified and strings keep the default string dtype
+    p = ggplot(mtcars, aes("wt", "mpg")) + geom_point(color="red")
+    data = p.layer_data()
+    data.loc[data["x"] > 2, "size"] = 3
+    data.loc[data["x"] > 2, "color"] = "blue"
+    assert (data["size"] == 3).sum() == (data["x"] > 2).sum()
+    assert data["color"].dtype == pd.Series(["red"]).dtype
+    assert data["shape"].dtype == pd.Series(["o"]).dtype